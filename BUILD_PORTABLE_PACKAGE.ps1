@@ -156,6 +156,7 @@ $filesToCopy = @(
     "setup_new_deployment.py",
     "settings_v2_4_template.json",
     "requirements.txt",
+    "requirements-optional.txt",
     "START_PORTABLE.bat",
     "START_PORTABLE_READONLY.bat",
     "SETUP_FOR_NEW_USER.bat",
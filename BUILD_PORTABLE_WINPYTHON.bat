@@ -54,6 +54,7 @@ echo [OK] Python copied
 echo.
 echo [4/5] Installing required packages...
 portable-build\python\python.exe -m pip install pywin32 pandas PyPDF2 lxml --quiet
+portable-build\python\python.exe -m pip install -r requirements-optional.txt --quiet
 portable-build\python\Scripts\pywin32_postinstall.py -install -silent 2>nul
 echo [OK] pywin32, pandas, and PyPDF2 installed
 
@@ -77,6 +77,7 @@ echo     [OK] Settings templates copied
 REM Copy requirements
 echo [6/8] Copying requirements.txt...
 copy /Y requirements.txt "%TARGET%\" >nul 2>&1
+copy /Y requirements-optional.txt "%TARGET%\" >nul 2>&1
 echo     [OK] requirements.txt copied
 
 REM Copy documentation
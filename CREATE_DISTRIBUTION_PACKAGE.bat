@@ -29,6 +29,7 @@ echo Copying core files...
 REM Copy root files
 copy "run_v2_3.py" "%DIST_FOLDER%\" >nul
 copy "requirements.txt" "%DIST_FOLDER%\" >nul
+copy "requirements-optional.txt" "%DIST_FOLDER%\" >nul
 copy "INSTALL.bat" "%DIST_FOLDER%\" >nul
 copy "INSTALLATION_INSTRUCTIONS.md" "%DIST_FOLDER%\" >nul
 copy "diagnose_label_printing.py" "%DIST_FOLDER%\" >nul
@@ -82,6 +83,7 @@ echo FILES INCLUDED:
 echo - run_v2_3.py              : Application launcher
 echo - INSTALL.bat              : Automated installation
 echo - requirements.txt         : Python dependencies
+echo - requirements-optional.txt: Optional accelerators
 echo - src/                     : Application source code
 echo - LABEL TEMPLATE/          : Word template for labels
 echo.
@@ -175,6 +175,7 @@ copy /Y "SETUP_PYTHON_DEPS.bat" "!TARGET_PATH!\" >nul 2>&1
 
 echo   - Configuration files...
 copy /Y "requirements.txt" "!TARGET_PATH!\" >nul 2>&1
+copy /Y "requirements-optional.txt" "!TARGET_PATH!\" >nul 2>&1
 copy /Y "settings_v2_3_onedrive_example.json" "!TARGET_PATH!\" >nul 2>&1
 
 REM Check if settings_v2_3.json already exists (don't overwrite)
@@ -90,6 +90,7 @@ echo.
 echo Files:
 echo   - run_v2_3.py
 echo   - requirements.txt
+echo   - requirements-optional.txt
 echo   - START_APP.bat (production launcher)
 echo.
 echo Folders:
@@ -178,6 +179,7 @@ REM Copy main files
 echo Copying main application files...
 copy "%SOURCE_DIR%\run_v2_3.py" "%DEST_DIR%\" >nul
 if exist "%SOURCE_DIR%\requirements.txt" copy "%SOURCE_DIR%\requirements.txt" "%DEST_DIR%\" >nul
+if exist "%SOURCE_DIR%\requirements-optional.txt" copy "%SOURCE_DIR%\requirements-optional.txt" "%DEST_DIR%\" >nul
 copy "%SOURCE_DIR%\START_APP.bat" "%DEST_DIR%\" >nul
 echo ✓ Main files copied
 echo.
@@ -108,6 +108,10 @@ echo Step 6: Running pywin32 post-install...
 %FOUND_PYTHON% -m pywin32_postinstall -install
 echo.
 
+echo Step 7: Installing optional accelerators...
+%FOUND_PYTHON% -m pip install -r requirements-optional.txt
+echo.
+
 echo ============================================
 echo Verifying Installation
 echo ============================================
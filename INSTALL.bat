@@ -80,6 +80,13 @@ if errorlevel 1 (
     exit /b 1
 )
 
+echo.
+echo Installing optional accelerators (faster PDF/JSON/CSV handling)...
+%PYTHON_PATH% -m pip install -r requirements-optional.txt
+if errorlevel 1 (
+    echo WARNING: Optional packages failed to install, continuing anyway...
+)
+
 echo.
 echo Running pywin32 post-install...
 %PYTHON_PATH% -m pywin32_postinstall -install >nul 2>&1
@@ -64,6 +64,12 @@ if errorlevel 1 (
     exit /b 1
 )
 
+REM Optional accelerators - the app runs without them
+python -m pip install -r requirements-optional.txt
+if errorlevel 1 (
+    echo WARNING: Optional packages failed to install, continuing anyway...
+)
+
 echo.
 echo ============================================================
 echo SUCCESS! All dependencies installed successfully
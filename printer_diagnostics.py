@@ -410,12 +410,16 @@ class PrinterDiagnosticsWindow:
 
         output += f"Testing {len(all_printers)} configured printer(s)...\n\n"
 
+        results = self.network_manager.test_all_connections(
+            [printer_def.printer_name for printer_def in all_printers]
+        )
+
         for printer_def in all_printers:
             output += f"Testing: {printer_def.display_name}\n"
             output += f"  Printer Name: {printer_def.printer_name}\n"
             output += f"  Type: {printer_def.printer_type}\n"
 
-            success, message = self.network_manager.test_printer_connection(printer_def.printer_name)
+            success, message = results[printer_def.printer_name]
 
             if success:
                 output += f"  Result: ✓ SUCCESS\n"
@@ -433,8 +437,8 @@ class PrinterDiagnosticsWindow:
 
     def run_wizard(self):
         """Run the setup wizard"""
-        run_setup_wizard(self.window)
-        self.run_diagnostics()  # Refresh after wizard
+        # Refresh once the wizard closes; it no longer blocks until then
+        run_setup_wizard(self.window, on_complete=lambda manager: self.run_diagnostics())
 
     def export_report(self):
         """Export diagnostic report to file"""
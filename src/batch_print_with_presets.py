@@ -31,7 +31,7 @@ class PresetSelectionDialog(tk.Toplevel):
         self.title("Quick Print")
 
         # Calculate dynamic window height based on number of presets
-        num_presets = len(self.preset_manager.get_all_presets())
+        num_presets = len(self.preset_manager.iter_presets())
         # Base height + height per preset (approx 70px per preset)
         base_height = 300
         preset_height = 70 * num_presets
@@ -93,7 +93,7 @@ class PresetSelectionDialog(tk.Toplevel):
             preset_frame = tk.Frame(content_frame, bg='#ffffff', relief='solid', borderwidth=1)
             preset_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 20))
 
-        for name, preset in self.preset_manager.get_all_presets().items():
+        for name, preset in self.preset_manager.iter_presets().items():
             # Build description
             desc_parts = []
             if preset.printer_11x17_enabled and preset.printer_11x17_script:
@@ -132,7 +132,7 @@ class PresetSelectionDialog(tk.Toplevel):
 
         # Set default selection
         if default_preset:
-            for name, preset in self.preset_manager.get_all_presets().items():
+            for name, preset in self.preset_manager.iter_presets().items():
                 if preset.is_default:
                     self.preset_var.set(name)
                     break
@@ -593,11 +593,9 @@ def should_print_folder_label(order: Dict) -> bool:
     Folder labels are NOT printed for:
     - Orders in gray category (processed)
     """
-    # Skip processed orders
-    if order.get('processed', False):
-        return False
-
-    return True
+    # Skip processed orders. This is a single dict lookup - cheaper than any
+    # memoization key built from the order, so it is deliberately not cached.
+    return not order.get('processed', False)
 
 
 def execute_batch_print_with_preset(
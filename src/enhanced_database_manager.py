@@ -12,6 +12,36 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import json
 
+# SQLite builds before 3.32 reject statements with more than 999 bound parameters
+SQLITE_MAX_PARAMS = 999
+
+# Columns read for csv_files rows, in the order _csv_file_from_row expects
+_CSV_FILE_COLUMNS = (
+    "id, original_path, current_path, archive_path, file_size, "
+    "material_count, status, validation_status, validation_errors, "
+    "added_date, validated_date, uploaded_date, archived_date"
+)
+
+
+def _csv_file_from_row(row) -> Dict:
+    """Build a CSV file dict from a row selected with _CSV_FILE_COLUMNS"""
+    return {
+        'id': row[0],
+        'original_path': row[1],
+        'current_path': row[2],
+        'archive_path': row[3],
+        'file_size': row[4],
+        'material_count': row[5],
+        'status': row[6],
+        'validation_status': row[7],
+        'validation_errors': json.loads(row[8]) if row[8] else None,
+        'added_date': row[9],
+        'validated_date': row[10],
+        'uploaded_date': row[11],
+        'archived_date': row[12]
+    }
+
+
 class EnhancedDatabaseManager:
     def __init__(self, db_path: str = "document_manager_v2.db"):
         self.db_path = db_path
@@ -682,40 +712,59 @@ class EnhancedDatabaseManager:
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.cursor()
 
-                cursor.execute('''
-                    SELECT id, original_path, current_path, archive_path, file_size,
-                           material_count, status, validation_status, validation_errors,
-                           added_date, validated_date, uploaded_date, archived_date
+                cursor.execute(f'''
+                    SELECT {_CSV_FILE_COLUMNS}
                     FROM csv_files
                     WHERE order_number = ?
                     ORDER BY added_date DESC
                 ''', (order_number,))
 
-                rows = cursor.fetchall()
-                csv_files = []
-                for row in rows:
-                    csv_files.append({
-                        'id': row[0],
-                        'original_path': row[1],
-                        'current_path': row[2],
-                        'archive_path': row[3],
-                        'file_size': row[4],
-                        'material_count': row[5],
-                        'status': row[6],
-                        'validation_status': row[7],
-                        'validation_errors': json.loads(row[8]) if row[8] else None,
-                        'added_date': row[9],
-                        'validated_date': row[10],
-                        'uploaded_date': row[11],
-                        'archived_date': row[12]
-                    })
-
-                return csv_files
+                return [_csv_file_from_row(row) for row in cursor.fetchall()]
 
         except Exception as e:
             logging.error(f"Failed to get CSV files for order {order_number}: {e}")
             return []
 
+    def get_csv_files_by_orders(self, order_numbers: List[str]) -> Dict[str, List[Dict]]:
+        """
+        Get CSV files for many orders in as few queries as possible
+
+        Args:
+            order_numbers: Order numbers to look up (duplicates and blanks are ignored)
+
+        Returns:
+            Dict mapping order number to its CSV files, newest first. Orders
+            without CSV files are absent.
+        """
+        unique_orders = list(dict.fromkeys(number for number in order_numbers if number))
+        csv_files_by_order: Dict[str, List[Dict]] = {}
+        if not unique_orders:
+            return csv_files_by_order
+
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+
+                # Stay under SQLite's bound-parameter limit
+                for start in range(0, len(unique_orders), SQLITE_MAX_PARAMS):
+                    chunk = unique_orders[start:start + SQLITE_MAX_PARAMS]
+                    placeholders = ','.join('?' * len(chunk))
+                    cursor.execute(f'''
+                        SELECT order_number, {_CSV_FILE_COLUMNS}
+                        FROM csv_files
+                        WHERE order_number IN ({placeholders})
+                        ORDER BY order_number, added_date DESC
+                    ''', chunk)
+
+                    for row in cursor.fetchall():
+                        csv_files_by_order.setdefault(row[0], []).append(_csv_file_from_row(row[1:]))
+
+                return csv_files_by_order
+
+        except Exception as e:
+            logging.error(f"Failed to get CSV files for {len(unique_orders)} orders: {e}")
+            return {}
+
     def get_pending_csv_files(self) -> List[Dict]:
         """Get all CSV files pending validation or upload"""
         try:
@@ -4,14 +4,115 @@ Enhanced Database Manager V2 - Updated with relationship tracking
 """
 
 import sqlite3
+import hashlib
 import pandas as pd
 import logging
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import json
+import os
+import time
 import uuid
 
+# uuid_utils generates UUIDv7 in Rust; fall back to composing one locally
+try:
+    import uuid_utils
+except ImportError:
+    uuid_utils = None
+
+# SQLite's default limit on bound parameters per statement
+SQLITE_MAX_PARAMS = 999
+
+# Formats accepted for the CSV DateRequired field, tried in order
+DATE_REQUIRED_FORMATS = ('%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y', '%Y/%m/%d')
+
+# Keeps updated_date current on every relationship change
+_RELATIONSHIP_TIMESTAMP_TRIGGER = '''
+    CREATE TRIGGER IF NOT EXISTS update_relationship_timestamp
+    AFTER UPDATE ON relationships
+    FOR EACH ROW
+    BEGIN
+        UPDATE relationships
+        SET updated_date = CURRENT_TIMESTAMP
+        WHERE relationship_id = NEW.relationship_id;
+    END
+'''
+
+# Older clients rewrite csv_data without knowing about csv_hash/order_date;
+# clear both so the next startup backfills them instead of trusting stale values
+_RELATIONSHIP_STALE_DERIVED_TRIGGER = '''
+    CREATE TRIGGER IF NOT EXISTS clear_relationship_derived_columns
+    AFTER UPDATE OF csv_data ON relationships
+    FOR EACH ROW
+    WHEN NEW.csv_hash IS OLD.csv_hash AND NEW.csv_data IS NOT OLD.csv_data
+    BEGIN
+        UPDATE relationships
+        SET csv_hash = NULL, order_date = NULL
+        WHERE id = NEW.id;
+    END
+'''
+
+def new_relationship_id() -> str:
+    """Return a time-ordered UUIDv7 string so new IDs append near the end of the index"""
+    if uuid_utils is not None:
+        return str(uuid_utils.uuid7())
+
+    # 48-bit millisecond timestamp, version, 12 random bits, variant, 62 random bits
+    ts_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), 'big')
+    value = (ts_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76
+    value |= ((rand >> 64) & 0xFFF) << 64
+    value |= 0b10 << 62
+    value |= rand & 0x3FFF_FFFF_FFFF_FFFF
+    return str(uuid.UUID(int=value))
+
+class LazyRelRow:
+    """
+    Relationship row whose csv_data JSON is only decoded when first read
+
+    Supports the dict-style access callers use on relationship dicts
+    (row['key'], row.get(), 'key' in row, item assignment); to_dict()
+    returns a plain dict, e.g. for JSON export.
+    """
+    __slots__ = ('_fields', '_csv_json', '_csv_data')
+
+    def __init__(self, fields: Dict, csv_json: Optional[str]):
+        # A 'csv_data' placeholder in fields keeps its position for to_dict()
+        self._fields = fields
+        self._fields.setdefault('csv_data', None)
+        self._csv_json = csv_json
+        self._csv_data = None
+
+    @property
+    def csv_data(self) -> Dict:
+        if self._csv_data is None:
+            self._csv_data = json.loads(self._csv_json) if self._csv_json else {}
+        return self._csv_data
+
+    def __getitem__(self, key):
+        if key == 'csv_data':
+            return self.csv_data
+        return self._fields[key]
+
+    def get(self, key, default=None):
+        if key == 'csv_data':
+            return self.csv_data
+        return self._fields.get(key, default)
+
+    def __setitem__(self, key, value):
+        if key == 'csv_data':
+            self._csv_data = value
+        else:
+            self._fields[key] = value
+
+    def __contains__(self, key) -> bool:
+        return key in self._fields
+
+    def to_dict(self) -> Dict:
+        return dict(self._fields, csv_data=self.csv_data)
+
 class EnhancedDatabaseV2:
     def __init__(self, db_path: str = "document_manager_v2.1.db"):
         self.db_path = db_path
@@ -37,7 +138,9 @@ class EnhancedDatabaseV2:
                         updated_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                         is_active BOOLEAN DEFAULT TRUE,
                         processed BOOLEAN DEFAULT FALSE,
-                        processed_date TIMESTAMP
+                        processed_date TIMESTAMP,
+                        csv_hash BLOB,  -- csv_data_hash() of csv_data, for cheap change detection
+                        order_date TEXT  -- DateRequired as an ISO date, NULL if missing or unparseable
                     )
                 ''')
 
@@ -116,16 +219,7 @@ class EnhancedDatabaseV2:
                     cursor.execute(index_sql)
 
                 # Create triggers to auto-update timestamps
-                cursor.execute('''
-                    CREATE TRIGGER IF NOT EXISTS update_relationship_timestamp
-                    AFTER UPDATE ON relationships
-                    FOR EACH ROW
-                    BEGIN
-                        UPDATE relationships
-                        SET updated_date = CURRENT_TIMESTAMP
-                        WHERE relationship_id = NEW.relationship_id;
-                    END
-                ''')
+                cursor.execute(_RELATIONSHIP_TIMESTAMP_TRIGGER)
 
                 conn.commit()
 
@@ -142,6 +236,26 @@ class EnhancedDatabaseV2:
                         cursor.execute('ALTER TABLE relationships ADD COLUMN processed_date TIMESTAMP')
                         logging.info("Added 'processed_date' column to relationships table")
 
+                    if 'csv_hash' not in columns:
+                        cursor.execute('ALTER TABLE relationships ADD COLUMN csv_hash BLOB')
+                        logging.info("Added 'csv_hash' column to relationships table")
+
+                    if 'order_date' not in columns:
+                        cursor.execute('ALTER TABLE relationships ADD COLUMN order_date TEXT')
+                        logging.info("Added 'order_date' column to relationships table")
+
+                    cursor.execute(_RELATIONSHIP_STALE_DERIVED_TRIGGER)
+                    conn.commit()
+
+                    # A new order_date column is empty for every row
+                    self._backfill_derived_columns(conn, all_rows='order_date' not in columns)
+
+                    # order_date only exists once the migration above has run, so its
+                    # index is created here; partial, since only active rows are queried
+                    cursor.execute('''
+                        CREATE INDEX IF NOT EXISTS idx_rel_order_date
+                        ON relationships(order_date) WHERE is_active = TRUE
+                    ''')
                     conn.commit()
                 except Exception as migrate_error:
                     logging.warning(f"Migration warning (may be normal if columns exist): {migrate_error}")
@@ -152,6 +266,67 @@ class EnhancedDatabaseV2:
             logging.error(f"Enhanced database V2 initialization failed: {e}")
             raise
 
+    @staticmethod
+    def csv_data_hash(csv_data: Dict) -> bytes:
+        """
+        Stable 8-byte digest of a CSV record, stored alongside csv_data
+
+        Key order does not matter, so equal dicts always hash equal.
+        """
+        canonical = json.dumps(csv_data, sort_keys=True, default=str)
+        return hashlib.blake2b(canonical.encode('utf-8'), digest_size=8).digest()
+
+    @staticmethod
+    def order_date_from_csv(csv_data: Dict) -> Optional[str]:
+        """DateRequired from a CSV record as an ISO date string, or None if missing or unparseable"""
+        date_required = csv_data.get('DateRequired', '')
+        if not date_required:
+            return None
+
+        for fmt in DATE_REQUIRED_FORMATS:
+            try:
+                return datetime.strptime(str(date_required), fmt).date().isoformat()
+            except ValueError:
+                continue
+        return None
+
+    def _backfill_derived_columns(self, conn, all_rows: bool = False):
+        """
+        Fill csv_hash and order_date from csv_data for rows that lack them
+
+        Rows written before these columns existed, or by older clients sharing
+        the database, have no csv_hash. all_rows recomputes every row.
+        """
+        cursor = conn.cursor()
+        where_clause = "" if all_rows else "WHERE csv_hash IS NULL"
+
+        # One write transaction from read to trigger recreation: other clients
+        # never see the timestamp trigger missing, cannot change csv_data
+        # between the read and the update, and a failure rolls everything back
+        cursor.execute('BEGIN IMMEDIATE')
+        try:
+            cursor.execute(f'SELECT id, csv_data FROM relationships {where_clause}')
+            rows = cursor.fetchall()
+            if not rows:
+                conn.rollback()
+                return
+
+            updates = []
+            for row_id, csv_json in rows:
+                csv_data = json.loads(csv_json) if csv_json else {}
+                updates.append((self.csv_data_hash(csv_data), self.order_date_from_csv(csv_data), row_id))
+
+            # Derived columns are not a change to the relationship, so keep the
+            # timestamp trigger from touching updated_date while backfilling
+            cursor.execute('DROP TRIGGER IF EXISTS update_relationship_timestamp')
+            cursor.executemany('UPDATE relationships SET csv_hash = ?, order_date = ? WHERE id = ?', updates)
+            cursor.execute(_RELATIONSHIP_TIMESTAMP_TRIGGER)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        logging.info(f"Backfilled csv_hash and order_date for {len(rows)} relationships")
+
     def store_relationship(self, relationship_data: Dict) -> bool:
         """Store a new relationship record"""
         try:
@@ -160,13 +335,15 @@ class EnhancedDatabaseV2:
 
                 cursor.execute('''
                     INSERT OR REPLACE INTO relationships
-                    (relationship_id, order_number, csv_data, pdf_path)
-                    VALUES (?, ?, ?, ?)
+                    (relationship_id, order_number, csv_data, pdf_path, csv_hash, order_date)
+                    VALUES (?, ?, ?, ?, ?, ?)
                 ''', (
                     relationship_data['relationship_id'],
                     relationship_data['order_number'],
                     json.dumps(relationship_data['csv_data'], default=str),
-                    relationship_data.get('pdf_path')
+                    relationship_data.get('pdf_path'),
+                    self.csv_data_hash(relationship_data['csv_data']),
+                    self.order_date_from_csv(relationship_data['csv_data'])
                 ))
 
                 # Log the operation
@@ -186,6 +363,106 @@ class EnhancedDatabaseV2:
             logging.error(f"Failed to store relationship: {e}")
             return False
 
+    def bulk_store_relationships(self, relationships: List[Dict]) -> bool:
+        """
+        Store many new relationship records in a single transaction
+
+        Args:
+            relationships: Records shaped like store_relationship's argument;
+                records without a relationship_id are given a new one here
+
+        Returns:
+            True if every record was stored, False if the batch was rolled back
+        """
+        if not relationships:
+            return True
+
+        try:
+            # IDs are only generated for records that actually reach the insert
+            relationship_ids = [rel.get('relationship_id') or new_relationship_id() for rel in relationships]
+
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+
+                cursor.executemany('''
+                    INSERT OR REPLACE INTO relationships
+                    (relationship_id, order_number, csv_data, pdf_path, csv_hash, order_date)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                ''', [
+                    (
+                        relationship_id,
+                        rel['order_number'],
+                        json.dumps(rel['csv_data'], default=str),
+                        rel.get('pdf_path'),
+                        self.csv_data_hash(rel['csv_data']),
+                        self.order_date_from_csv(rel['csv_data'])
+                    )
+                    for relationship_id, rel in zip(relationship_ids, relationships)
+                ])
+
+                # Log the operations
+                details = json.dumps({'action': 'new_relationship'})
+                cursor.executemany('''
+                    INSERT INTO processing_log (operation_type, relationship_id, order_number, details)
+                    VALUES ('relationship_created', ?, ?, ?)
+                ''', [
+                    (relationship_id, rel['order_number'], details)
+                    for relationship_id, rel in zip(relationship_ids, relationships)
+                ])
+
+                conn.commit()
+                return True
+
+        except Exception as e:
+            logging.error(f"Failed to store {len(relationships)} relationships: {e}")
+            return False
+
+    def bulk_update_relationships(self, updates: List[Tuple[str, Dict]]) -> bool:
+        """
+        Replace the CSV data of many relationships in a single transaction
+
+        Args:
+            updates: (relationship_id, csv_data) pairs
+
+        Returns:
+            True if every row was updated, False if the batch was rolled back
+        """
+        if not updates:
+            return True
+
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+
+                cursor.executemany(
+                    'UPDATE relationships SET csv_data = ?, csv_hash = ?, order_date = ? WHERE relationship_id = ?',
+                    [
+                        (
+                            json.dumps(csv_data, default=str),
+                            self.csv_data_hash(csv_data),
+                            self.order_date_from_csv(csv_data),
+                            relationship_id
+                        )
+                        for relationship_id, csv_data in updates
+                    ]
+                )
+
+                # Log the updates
+                cursor.executemany('''
+                    INSERT INTO processing_log (operation_type, relationship_id, details)
+                    VALUES ('relationship_updated', ?, ?)
+                ''', [
+                    (relationship_id, json.dumps({'csv_data': csv_data}, default=str))
+                    for relationship_id, csv_data in updates
+                ])
+
+                conn.commit()
+                return True
+
+        except Exception as e:
+            logging.error(f"Failed to update {len(updates)} relationships: {e}")
+            return False
+
     def get_relationship(self, relationship_id: str) -> Optional[Dict]:
         """Get relationship by ID"""
         try:
@@ -274,6 +551,10 @@ class EnhancedDatabaseV2:
                 if 'csv_data' in update_data:
                     update_fields.append('csv_data = ?')
                     update_values.append(json.dumps(update_data['csv_data'], default=str))
+                    update_fields.append('csv_hash = ?')
+                    update_values.append(self.csv_data_hash(update_data['csv_data']))
+                    update_fields.append('order_date = ?')
+                    update_values.append(self.order_date_from_csv(update_data['csv_data']))
 
                 if 'pdf_path' in update_data:
                     # Get current PDF path for history tracking
@@ -330,8 +611,40 @@ class EnhancedDatabaseV2:
             logging.error(f"Failed to update relationship {relationship_id}: {e}")
             return False
 
-    def get_all_relationships(self, include_inactive: bool = False) -> List[Dict]:
-        """Get all relationships"""
+    def get_relationship_csv_hashes(self) -> Dict[str, Tuple[str, Optional[bytes]]]:
+        """
+        Map each order number to its active relationship ID and stored csv_hash
+
+        Reads only the columns needed to detect changed CSV rows. When an order
+        has several active relationships, the most recently created one wins,
+        as in get_relationship_by_order. Rows without a csv_hash (written by an
+        older client and not yet backfilled) are hashed from their csv_data.
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+
+                cursor.execute('''
+                    SELECT order_number, relationship_id, csv_hash,
+                           CASE WHEN csv_hash IS NULL THEN csv_data END
+                    FROM relationships
+                    WHERE is_active = TRUE
+                    ORDER BY created_date
+                ''')
+
+                hashes = {}
+                for order_number, relationship_id, csv_hash, csv_json in cursor.fetchall():
+                    if csv_hash is None:
+                        csv_hash = self.csv_data_hash(json.loads(csv_json) if csv_json else {})
+                    hashes[order_number] = (relationship_id, csv_hash)
+                return hashes
+
+        except Exception as e:
+            logging.error(f"Failed to get relationship CSV hashes: {e}")
+            return {}
+
+    def get_all_relationships(self, include_inactive: bool = False) -> List[LazyRelRow]:
+        """Get all relationships; csv_data is decoded lazily, per row, when read"""
         try:
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.cursor()
@@ -339,7 +652,8 @@ class EnhancedDatabaseV2:
                 where_clause = "" if include_inactive else "WHERE is_active = TRUE"
                 cursor.execute(f'''
                     SELECT relationship_id, order_number, csv_data, pdf_path,
-                           created_date, updated_date, is_active, processed, processed_date
+                           created_date, updated_date, is_active, processed, processed_date,
+                           order_date
                     FROM relationships
                     {where_clause}
                     ORDER BY order_number
@@ -347,17 +661,18 @@ class EnhancedDatabaseV2:
 
                 relationships = []
                 for row in cursor.fetchall():
-                    relationships.append({
+                    relationships.append(LazyRelRow({
                         'relationship_id': row[0],
                         'order_number': row[1],
-                        'csv_data': json.loads(row[2]) if row[2] else {},
+                        'csv_data': None,
                         'pdf_path': row[3],
                         'created_date': row[4],
                         'updated_date': row[5],
                         'is_active': bool(row[6]),
                         'processed': bool(row[7]) if row[7] is not None else False,
-                        'processed_date': row[8]
-                    })
+                        'processed_date': row[8],
+                        'order_date': row[9]
+                    }, row[2]))
 
                 return relationships
 
@@ -365,6 +680,131 @@ class EnhancedDatabaseV2:
             logging.error(f"Failed to get all relationships: {e}")
             return []
 
+    def get_pdf_changes_by_relationship(self) -> Dict[str, List[Dict]]:
+        """
+        Get the PDF change history of every relationship in one query
+
+        Returns:
+            Dict mapping relationship_id to its changes, oldest first
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+
+                cursor.execute('''
+                    SELECT relationship_id, action, old_pdf_path, new_pdf_path, reason, timestamp
+                    FROM pdf_change_history
+                    ORDER BY relationship_id, timestamp, id
+                ''')
+
+                changes_by_relationship: Dict[str, List[Dict]] = {}
+                for row in cursor.fetchall():
+                    changes_by_relationship.setdefault(row[0], []).append({
+                        'action': row[1],
+                        'old_pdf_path': row[2],
+                        'new_pdf_path': row[3],
+                        'reason': row[4],
+                        'timestamp': row[5]
+                    })
+
+                return changes_by_relationship
+
+        except Exception as e:
+            logging.error(f"Failed to get PDF change history: {e}")
+            return {}
+
+    def get_relationships_with_csv_status(self, start_date: str, end_date: str) -> List[Dict]:
+        """
+        Get active relationships required between two dates, with their newest CSV file
+
+        Args:
+            start_date: First order_date to include, as an ISO date
+            end_date: Last order_date to include, as an ISO date
+
+        Returns:
+            Relationship dicts with get_all_relationships' fields, ordered by
+            order_date. When the csv_files table shares this database, each
+            also has 'csv_file': the status and validation_status of the
+            order's newest CSV file, or None if it has none. Otherwise the
+            key is absent and callers must look CSV files up themselves.
+
+        Rows without a stored order_date (written or rewritten by an older
+        client and not yet backfilled) are dated from their csv_data instead.
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+
+                cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'csv_files'")
+                has_csv_files = cursor.fetchone() is not None
+
+                if has_csv_files:
+                    # Newest CSV file per order joined in the same query (no per-row lookups)
+                    cursor.execute('''
+                        SELECT r.relationship_id, r.order_number, r.csv_data, r.pdf_path,
+                               r.created_date, r.updated_date, r.is_active, r.processed, r.processed_date,
+                               r.order_date, c.order_number, c.status, c.validation_status
+                        FROM relationships r
+                        LEFT JOIN (
+                            SELECT order_number, status, validation_status,
+                                   ROW_NUMBER() OVER (PARTITION BY order_number ORDER BY added_date DESC) AS rn
+                            FROM csv_files
+                        ) c ON c.order_number = r.order_number AND c.rn = 1
+                        WHERE r.is_active = TRUE
+                          AND (r.order_date BETWEEN ? AND ? OR r.order_date IS NULL)
+                        ORDER BY r.order_date, r.order_number
+                    ''', (start_date, end_date))
+                else:
+                    cursor.execute('''
+                        SELECT relationship_id, order_number, csv_data, pdf_path,
+                               created_date, updated_date, is_active, processed, processed_date,
+                               order_date
+                        FROM relationships
+                        WHERE is_active = TRUE
+                          AND (order_date BETWEEN ? AND ? OR order_date IS NULL)
+                        ORDER BY order_date, order_number
+                    ''', (start_date, end_date))
+
+                relationships = []
+                undated_rows = False
+                for row in cursor.fetchall():
+                    csv_data = json.loads(row[2]) if row[2] else {}
+                    order_date = row[9]
+                    if order_date is None:
+                        order_date = self.order_date_from_csv(csv_data)
+                        if order_date is None or not start_date <= order_date <= end_date:
+                            continue
+                        undated_rows = True
+
+                    relationship = {
+                        'relationship_id': row[0],
+                        'order_number': row[1],
+                        'csv_data': csv_data,
+                        'pdf_path': row[3],
+                        'created_date': row[4],
+                        'updated_date': row[5],
+                        'is_active': bool(row[6]),
+                        'processed': bool(row[7]) if row[7] is not None else False,
+                        'processed_date': row[8],
+                        'order_date': order_date
+                    }
+                    if has_csv_files:
+                        relationship['csv_file'] = None if row[10] is None else {
+                            'status': row[11],
+                            'validation_status': row[12]
+                        }
+                    relationships.append(relationship)
+
+                # NULL order_dates sorted first in SQL; place those rows by their parsed date
+                if undated_rows:
+                    relationships.sort(key=lambda rel: (rel['order_date'], rel['order_number']))
+
+                return relationships
+
+        except Exception as e:
+            logging.error(f"Failed to get relationships with CSV status: {e}")
+            return []
+
     def search_relationships(self, search_term: str, search_type: str = 'general') -> List[Dict]:
         """Search relationships by various criteria"""
         try:
@@ -538,6 +978,53 @@ class EnhancedDatabaseV2:
             logging.error(f"Failed to mark relationship {relationship_id} as processed: {e}")
             return False
 
+    def mark_orders_processed(self, order_numbers: List[str]) -> int:
+        """
+        Mark the active relationships of many orders as processed in one transaction
+
+        Args:
+            order_numbers: Order numbers to mark (duplicates and blanks are ignored)
+
+        Returns:
+            Number of relationships marked, 0 if the batch was rolled back
+        """
+        unique_orders = list(dict.fromkeys(number for number in order_numbers if number))
+        if not unique_orders:
+            return 0
+
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                details = json.dumps({'processed': True})
+                marked_count = 0
+
+                # Stay under SQLite's bound-parameter limit
+                for start in range(0, len(unique_orders), SQLITE_MAX_PARAMS - 1):
+                    chunk = unique_orders[start:start + SQLITE_MAX_PARAMS - 1]
+                    placeholders = ','.join('?' * len(chunk))
+
+                    # Log the updates, as update_relationship does for each one
+                    cursor.execute(f'''
+                        INSERT INTO processing_log (operation_type, relationship_id, details)
+                        SELECT 'relationship_updated', relationship_id, ?
+                        FROM relationships
+                        WHERE is_active = TRUE AND order_number IN ({placeholders})
+                    ''', [details, *chunk])
+
+                    cursor.execute(f'''
+                        UPDATE relationships
+                        SET processed = TRUE, processed_date = CURRENT_TIMESTAMP
+                        WHERE is_active = TRUE AND order_number IN ({placeholders})
+                    ''', chunk)
+                    marked_count += cursor.rowcount
+
+                conn.commit()
+                return marked_count
+
+        except Exception as e:
+            logging.error(f"Failed to mark {len(unique_orders)} orders as processed: {e}")
+            return 0
+
     def unmark_relationship_processed(self, relationship_id: str) -> bool:
         """Unmark a relationship as processed (for re-sync purposes)"""
         try:
@@ -555,7 +1042,7 @@ class EnhancedDatabaseV2:
             export_data = {
                 'export_date': datetime.now().isoformat(),
                 'database_version': '2.1.0',
-                'relationships': self.get_all_relationships(include_inactive=True),
+                'relationships': [rel.to_dict() for rel in self.get_all_relationships(include_inactive=True)],
                 'statistics': self.get_statistics()
             }
 
@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""
+JSON Compat - Indented JSON encoding/decoding, using orjson when installed
+"""
+
+import json
+from typing import Any, Callable, Optional
+
+# orjson (Rust) is much faster than the stdlib json module; use it when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_dumps(obj, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Serialize obj to UTF-8 JSON indented by 2; default converts unsupported types"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=default)
+    return json.dumps(obj, indent=2, default=default).encode('utf-8')
+
+
+json_loads = orjson.loads if orjson is not None else json.loads
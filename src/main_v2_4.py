@@ -740,37 +740,13 @@ class DocumentManagerV24:
 
         logging.info(f"Shipping Schedule: Date range {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
 
-        # Get all orders with relationships
-        all_orders = self.relationship_manager.get_orders_with_relationships()
-
-        # Filter orders in current date range
-        schedule_orders = []
-        for order in all_orders:
-            csv_data = order.get('csv_data', {})
-            date_required = csv_data.get('DateRequired', '')
-            order_number = csv_data.get('OrderNumber', '')
-
-            if date_required:
-                try:
-                    # Parse order date
-                    order_date = None
-                    for fmt in ['%m/%d/%Y', '%Y-%m-%d', '%d/%m/%Y', '%Y/%m/%d']:
-                        try:
-                            order_date = datetime.strptime(str(date_required), fmt).date()
-                            break
-                        except:
-                            continue
-
-                    # Check if in date range
-                    if order_date and start_date.date() <= order_date <= end_date.date():
-                        # Add date information
-                        order_with_date = order.copy()
-                        order_with_date['parsed_date'] = order_date
-                        order_with_date['date_display'] = order_date.strftime('%a, %b %d, %Y')
-                        schedule_orders.append(order_with_date)
-
-                except Exception as e:
-                    logging.warning(f"Could not process order {order_number}: {e}")
+        # Orders required in the current date range, filtered on order_date (parsed
+        # from DateRequired) with each order's CSV file status joined in the same query
+        schedule_orders = self.relationship_manager.get_orders_in_date_range(start_date.date(), end_date.date())
+        for order in schedule_orders:
+            order_date = datetime.strptime(order['order_date'], '%Y-%m-%d').date()
+            order['parsed_date'] = order_date
+            order['date_display'] = order_date.strftime('%a, %b %d, %Y')
 
         logging.info(f"Shipping Schedule: Found {len(schedule_orders)} orders")
 
@@ -6,6 +6,7 @@ Replaces the old preset system with centralized network printer management
 
 import tkinter as tk
 from tkinter import ttk, messagebox
+from dataclasses import dataclass, field
 from typing import Dict, List, Callable, Optional
 import logging
 import os
@@ -16,6 +17,15 @@ from user_preferences import UserPreferencesManager
 from error_logger import log_error, log_info, log_warning, log_success
 
 
+@dataclass
+class SectionVars:
+    """Tk variables backing one printer section of the print job dialog"""
+    enabled: tk.BooleanVar
+    printer: tk.StringVar
+    copies: tk.IntVar
+    printers_by_name: Dict[str, PrinterDefinition] = field(default_factory=dict)
+
+
 class PrintJobConfigDialog(tk.Toplevel):
     """Dialog for configuring a batch print job using network printers"""
 
@@ -27,6 +37,7 @@ class PrintJobConfigDialog(tk.Toplevel):
         self.user_prefs = user_prefs
         self.order_count = order_count
         self.result = None
+        self.sections: Dict[str, SectionVars] = {}
 
         self.setup_window()
 
@@ -167,9 +178,11 @@ class PrintJobConfigDialog(tk.Toplevel):
             ).pack(anchor=tk.W, padx=15, pady=(0, 15))
 
             # Store empty config
-            setattr(self, f"{printer_type}_enabled", enabled_var)
-            setattr(self, f"{printer_type}_printer", tk.StringVar(value=""))
-            setattr(self, f"{printer_type}_copies", tk.IntVar(value=1))
+            self.sections[printer_type] = SectionVars(
+                enabled=enabled_var,
+                printer=tk.StringVar(value=""),
+                copies=tk.IntVar(value=1)
+            )
             return
 
         # Check for available printers
@@ -185,9 +198,11 @@ class PrintJobConfigDialog(tk.Toplevel):
             ).pack(anchor=tk.W, padx=15, pady=(0, 15))
 
             # Store empty config
-            setattr(self, f"{printer_type}_enabled", enabled_var)
-            setattr(self, f"{printer_type}_printer", tk.StringVar(value=""))
-            setattr(self, f"{printer_type}_copies", tk.IntVar(value=1))
+            self.sections[printer_type] = SectionVars(
+                enabled=enabled_var,
+                printer=tk.StringVar(value=""),
+                copies=tk.IntVar(value=1)
+            )
             return
 
         # Printer selection
@@ -236,15 +251,16 @@ class PrintJobConfigDialog(tk.Toplevel):
                 width=10
             )
             copies_spin.pack(anchor=tk.W, padx=15, pady=(0, 15))
-
-            setattr(self, f"{printer_type}_copies", copies_var)
         else:
-            setattr(self, f"{printer_type}_copies", tk.IntVar(value=1))
+            copies_var = tk.IntVar(value=1)
 
         # Store variables for later retrieval
-        setattr(self, f"{printer_type}_enabled", enabled_var)
-        setattr(self, f"{printer_type}_printer", printer_var)
-        setattr(self, f"{printer_type}_printers_list", available_printers)
+        self.sections[printer_type] = SectionVars(
+            enabled=enabled_var,
+            printer=printer_var,
+            copies=copies_var,
+            printers_by_name={p.display_name: p for p in available_printers}
+        )
 
     def confirm(self):
         """Confirm and return configuration"""
@@ -253,44 +269,18 @@ class PrintJobConfigDialog(tk.Toplevel):
             'printers': []
         }
 
-        # Add 11x17 if enabled
-        if self.printer_11x17_enabled.get() and hasattr(self, 'printer_11x17_printers_list'):
-            selected_name = self.printer_11x17_printer.get()
-            for printer in self.printer_11x17_printers_list:
-                if printer.display_name == selected_name:
-                    config['printers'].append({
-                        'type': '11x17',
-                        'printer_name': printer.printer_name,
-                        'display_name': printer.display_name,
-                        'copies': self.printer_11x17_copies.get()
-                    })
-                    break
-
-        # Add 24x36 if enabled
-        if self.printer_24x36_enabled.get() and hasattr(self, 'printer_24x36_printers_list'):
-            selected_name = self.printer_24x36_printer.get()
-            for printer in self.printer_24x36_printers_list:
-                if printer.display_name == selected_name:
-                    config['printers'].append({
-                        'type': '24x36',
-                        'printer_name': printer.printer_name,
-                        'display_name': printer.display_name,
-                        'copies': self.printer_24x36_copies.get()
-                    })
-                    break
-
-        # Add folder label if enabled
-        if self.folder_label_enabled.get() and hasattr(self, 'folder_label_printers_list'):
-            selected_name = self.folder_label_printer.get()
-            for printer in self.folder_label_printers_list:
-                if printer.display_name == selected_name:
-                    config['printers'].append({
-                        'type': 'folder_label',
-                        'printer_name': printer.printer_name,
-                        'display_name': printer.display_name,
-                        'copies': 1
-                    })
-                    break
+        for printer_type, section in self.sections.items():
+            if not section.enabled.get():
+                continue
+
+            printer = section.printers_by_name.get(section.printer.get())
+            if printer:
+                config['printers'].append({
+                    'type': printer_type,
+                    'printer_name': printer.printer_name,
+                    'display_name': printer.display_name,
+                    'copies': section.copies.get()
+                })
 
         # Validate at least one printer selected
         if not config['printers']:
@@ -4,16 +4,62 @@ Network Printer Manager - Centralized printer configuration for network deployme
 Handles printer discovery, validation, and configuration management
 """
 
-import json
+import hashlib
 import logging
-from typing import Dict, List, Optional, Tuple
+import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, FrozenSet, List, Optional, Tuple
 from pathlib import Path
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from datetime import datetime
 from error_logger import log_error, log_info, log_warning, log_success
-
-
-@dataclass
+from json_compat import json_dumps, json_loads
+
+# Optional Aho-Corasick automaton for matching all category keywords in one pass
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# How long a printer discovery result is reused before enumerating again
+DISCOVERY_TTL_SECONDS = 30.0
+
+# Upper bound on concurrent printer connection tests in test_all_connections
+MAX_CONNECTION_TEST_WORKERS = 16
+
+# Printer name keywords used by categorize_printers, checked in this order
+PRINTER_CATEGORY_KEYWORDS = {
+    # Large format printers (24x36, plotters)
+    'large_format': [
+        'designjet', 'plotter', 'wide', 'format', 'imageprograf',
+        '24x36', '36', 'arch', 'cad', 'engineering', 'hp-z'
+    ],
+    # Standard printers (11x17, tabloid)
+    'standard': [
+        '11x17', 'tabloid', 'ledger', 'legal'
+    ],
+    # Label printers
+    'label': [
+        'label', 'dymo', 'zebra', 'brother', 'ql', 'p-touch'
+    ],
+}
+
+# One case-insensitive alternation per category, so each printer name is
+# matched with a single regex call per category
+PRINTER_CATEGORY_PATTERNS = [
+    (category, re.compile('|'.join(map(re.escape, keywords)), re.IGNORECASE))
+    for category, keywords in PRINTER_CATEGORY_KEYWORDS.items()
+]
+
+
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class PrinterDefinition:
     """Defines a printer with its network configuration"""
     display_name: str           # User-friendly name: "11x17 Printer"
@@ -25,10 +71,18 @@ class PrinterDefinition:
     last_verified: str = ""     # Timestamp of last successful connection
 
     def to_dict(self) -> Dict:
-        return asdict(self)
+        return {
+            'display_name': self.display_name,
+            'printer_name': self.printer_name,
+            'printer_type': self.printer_type,
+            'is_default': self.is_default,
+            'is_available': self.is_available,
+            'description': self.description,
+            'last_verified': self.last_verified
+        }
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class NetworkPrinterConfig:
     """Network-wide printer configuration"""
     printers_11x17: List[PrinterDefinition]
@@ -54,16 +108,36 @@ class NetworkPrinterConfig:
 class NetworkPrinterManager:
     """Manages network printer configuration and discovery for multi-user deployment"""
 
-    def __init__(self, config_file: str = "network_printers.json"):
+    # Last discovery result shared by all instances: (monotonic time, printer names)
+    _discovery_cache: Optional[Tuple[float, Tuple[str, ...]]] = None
+
+    def __init__(self, config_file: str = "network_printers.json",
+                 discovery_ttl: float = DISCOVERY_TTL_SECONDS):
         """
         Initialize the network printer manager
 
         Args:
             config_file: Path to network printer configuration file
+            discovery_ttl: Seconds a printer discovery result is reused
         """
         self.config_file = config_file
+        self.discovery_ttl = discovery_ttl
         self.config: Optional[NetworkPrinterConfig] = None
         self.available_printers: List[str] = []
+        self._available_set: FrozenSet[str] = frozenset()
+        # (name, lowercased name) pairs so categorization lowercases each name once
+        self._lowered_printers: List[Tuple[str, str]] = []
+        # Content hash of the config as last loaded/saved, to skip no-op saves
+        self._saved_config_hash: Optional[bytes] = None
+
+        # Keyword automaton for categorize_printers, built on first use
+        self._category_automaton = None
+
+        # Lookup indexes over self.config, rebuilt whenever config is replaced
+        self._indexed_config: Optional[NetworkPrinterConfig] = None
+        self._by_type: Dict[str, List[PrinterDefinition]] = {}
+        self._all_printers: List[PrinterDefinition] = []
+        self._defaults: Dict[str, List[PrinterDefinition]] = {}
 
         # Load configuration
         self.load_config()
@@ -75,13 +149,21 @@ class NetworkPrinterManager:
         if self.config:
             self.validate_configured_printers()
 
-    def discover_printers(self) -> List[str]:
+    def discover_printers(self, force_refresh: bool = False) -> List[str]:
         """
         Discover all available printers on the system and network
 
+        Args:
+            force_refresh: Enumerate printers even if a recent result is cached
+
         Returns:
             List of printer names
         """
+        cache = NetworkPrinterManager._discovery_cache
+        if not force_refresh and cache and time.monotonic() - cache[0] < self.discovery_ttl:
+            self._set_available_printers(cache[1])
+            return self.available_printers
+
         try:
             import win32print
 
@@ -93,7 +175,9 @@ class NetworkPrinterManager:
                 win32print.PRINTER_ENUM_CONNECTIONS
             )
 
-            self.available_printers = [printer[2] for printer in printers]
+            printer_names = tuple(printer[2] for printer in printers)
+            NetworkPrinterManager._discovery_cache = (time.monotonic(), printer_names)
+            self._set_available_printers(printer_names)
 
             log_info(f"Discovered {len(self.available_printers)} printers", {
                 'printer_names': self.available_printers
@@ -110,6 +194,12 @@ class NetworkPrinterManager:
             log_error("printer_discovery_failed", e)
             return []
 
+    def _set_available_printers(self, printer_names: Tuple[str, ...]):
+        """Store discovered printer names and the lookups derived from them"""
+        self.available_printers = list(printer_names)
+        self._available_set = frozenset(printer_names)
+        self._lowered_printers = [(name, name.lower()) for name in printer_names]
+
     def categorize_printers(self) -> Dict[str, List[str]]:
         """
         Automatically categorize discovered printers by type based on name patterns
@@ -124,34 +214,8 @@ class NetworkPrinterManager:
             'other': []
         }
 
-        # Keywords for large format printers
-        large_format_keywords = [
-            'designjet', 'plotter', 'wide', 'format', 'imageprograf',
-            '24x36', '36', 'arch', 'cad', 'engineering', 'hp-z'
-        ]
-
-        # Keywords for standard printers
-        standard_keywords = [
-            '11x17', 'tabloid', 'ledger', 'legal'
-        ]
-
-        # Keywords for label printers
-        label_keywords = [
-            'label', 'dymo', 'zebra', 'brother', 'ql', 'p-touch'
-        ]
-
-        for printer in self.available_printers:
-            printer_lower = printer.lower()
-
-            # Check categories in order
-            if any(keyword in printer_lower for keyword in large_format_keywords):
-                categories['large_format'].append(printer)
-            elif any(keyword in printer_lower for keyword in standard_keywords):
-                categories['standard'].append(printer)
-            elif any(keyword in printer_lower for keyword in label_keywords):
-                categories['label'].append(printer)
-            else:
-                categories['other'].append(printer)
+        for printer, printer_lower in self._lowered_printers:
+            categories[self._categorize_printer(printer, printer_lower)].append(printer)
 
         log_info("Categorized printers", {
             'large_format': len(categories['large_format']),
@@ -162,6 +226,27 @@ class NetworkPrinterManager:
 
         return categories
 
+    def _categorize_printer(self, printer: str, printer_lower: str) -> str:
+        """Return the first category (in PRINTER_CATEGORY_KEYWORDS order) matching a printer name"""
+        if ahocorasick is not None:
+            if self._category_automaton is None:
+                automaton = ahocorasick.Automaton()
+                for category, keywords in PRINTER_CATEGORY_KEYWORDS.items():
+                    for keyword in keywords:
+                        automaton.add_word(keyword, category)
+                automaton.make_automaton()
+                self._category_automaton = automaton
+
+            # One scan finds every keyword; the earliest category still wins
+            matched = {category for _, category in self._category_automaton.iter(printer_lower)}
+            return next((c for c in PRINTER_CATEGORY_KEYWORDS if c in matched), 'other')
+
+        # Check categories in order
+        for category, pattern in PRINTER_CATEGORY_PATTERNS:
+            if pattern.search(printer):
+                return category
+        return 'other'
+
     def validate_configured_printers(self) -> Dict[str, List[str]]:
         """
         Validate that configured printers are available
@@ -176,16 +261,12 @@ class NetworkPrinterManager:
         missing = []
 
         # Check all configured printers
-        all_configured = (
-            self.config.printers_11x17 +
-            self.config.printers_24x36 +
-            self.config.printers_folder_label
-        )
-
-        for printer_def in all_configured:
-            if printer_def.printer_name in self.available_printers:
+        self._ensure_indexes()
+        now_iso = datetime.now().isoformat()
+        for printer_def in self._all_printers:
+            if printer_def.printer_name in self._available_set:
                 printer_def.is_available = True
-                printer_def.last_verified = datetime.now().isoformat()
+                printer_def.last_verified = now_iso
                 available.append(printer_def.printer_name)
             else:
                 printer_def.is_available = False
@@ -204,6 +285,27 @@ class NetworkPrinterManager:
 
         return {'available': available, 'missing': missing}
 
+    def _ensure_indexes(self):
+        """Rebuild the printer lookup indexes if self.config has been replaced"""
+        if self._indexed_config is self.config:
+            return
+
+        self._indexed_config = self.config
+        if not self.config:
+            self._by_type, self._all_printers, self._defaults = {}, [], {}
+            return
+
+        self._by_type = {
+            '11x17': self.config.printers_11x17,
+            '24x36': self.config.printers_24x36,
+            'folder_label': self.config.printers_folder_label
+        }
+        self._all_printers = [p for printers in self._by_type.values() for p in printers]
+        self._defaults = {
+            printer_type: [p for p in printers if p.is_default]
+            for printer_type, printers in self._by_type.items()
+        }
+
     def load_config(self) -> bool:
         """
         Load network printer configuration from file
@@ -218,8 +320,8 @@ class NetworkPrinterManager:
                 log_info("No network printer config found, will need initial setup")
                 return False
 
-            with open(config_path, 'r') as f:
-                data = json.load(f)
+            with open(config_path, 'rb') as f:
+                data = json_loads(f.read())
 
             # Parse configuration
             self.config = NetworkPrinterConfig(
@@ -237,6 +339,7 @@ class NetworkPrinterManager:
                 version=data.get('version', '1.0'),
                 last_updated=data.get('last_updated', '')
             )
+            self._saved_config_hash = self._config_hash()
 
             log_info("Loaded network printer configuration", {
                 'printers_11x17': len(self.config.printers_11x17),
@@ -265,12 +368,25 @@ class NetworkPrinterManager:
             return False
 
         try:
+            # Nothing to write if the config matches what is already on disk
+            config_hash = self._config_hash()
+            if config_hash == self._saved_config_hash and Path(self.config_file).exists():
+                log_info("Network printer config unchanged, skipping save", {
+                    'config_file': self.config_file
+                })
+                return True
+
             # Update timestamp
             self.config.last_updated = datetime.now().isoformat()
 
-            # Save to file
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config.to_dict(), f, indent=2)
+            # Write to a temp file and swap it in so readers never see a partial file
+            temp_file = f"{self.config_file}.tmp"
+            with open(temp_file, 'wb') as f:
+                f.write(json_dumps(self.config.to_dict()))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_file, self.config_file)
+            self._saved_config_hash = config_hash
 
             log_success("save_network_printer_config", {
                 'config_file': self.config_file
@@ -284,6 +400,15 @@ class NetworkPrinterManager:
             })
             return False
 
+    def _config_hash(self) -> bytes:
+        """Hash the config contents, ignoring last_updated/last_verified timestamps"""
+        data = self.config.to_dict()
+        data.pop('last_updated', None)
+        for key in ('printers_11x17', 'printers_24x36', 'printers_folder_label'):
+            for printer in data[key]:
+                printer.pop('last_verified', None)
+        return hashlib.blake2b(json_dumps(data), digest_size=16).digest()
+
     def create_default_config(self, template_path: str = "") -> bool:
         """
         Create a default configuration with auto-detected printers
@@ -298,6 +423,9 @@ class NetworkPrinterManager:
             # Categorize available printers
             categories = self.categorize_printers()
 
+            # One timestamp for every printer created in this pass
+            now_iso = datetime.now().isoformat()
+
             # Create printer definitions for each category
             printers_11x17 = []
             printers_24x36 = []
@@ -312,7 +440,7 @@ class NetworkPrinterManager:
                     is_default=(i == 0),  # First one is default
                     is_available=True,
                     description=f"Auto-detected: {printer_name}",
-                    last_verified=datetime.now().isoformat()
+                    last_verified=now_iso
                 ))
 
             # Add large format printers (24x36)
@@ -324,7 +452,7 @@ class NetworkPrinterManager:
                     is_default=(i == 0),
                     is_available=True,
                     description=f"Auto-detected: {printer_name}",
-                    last_verified=datetime.now().isoformat()
+                    last_verified=now_iso
                 ))
 
             # Add label printers
@@ -336,7 +464,7 @@ class NetworkPrinterManager:
                     is_default=(i == 0),
                     is_available=True,
                     description=f"Auto-detected: {printer_name}",
-                    last_verified=datetime.now().isoformat()
+                    last_verified=now_iso
                 ))
 
             # If no label printers found, check if any standard printer could work
@@ -350,7 +478,7 @@ class NetworkPrinterManager:
                     is_default=True,
                     is_available=True,
                     description=f"Auto-detected (verify): {printer_name}",
-                    last_verified=datetime.now().isoformat()
+                    last_verified=now_iso
                 ))
 
             # Create configuration
@@ -361,7 +489,7 @@ class NetworkPrinterManager:
                 template_path=template_path,
                 auto_discover_on_startup=True,
                 version="1.0",
-                last_updated=datetime.now().isoformat()
+                last_updated=now_iso
             )
 
             # Save configuration
@@ -390,24 +518,15 @@ class NetworkPrinterManager:
         Returns:
             PrinterDefinition or None
         """
-        if not self.config:
-            return None
-
-        printer_list = []
-        if printer_type == "11x17":
-            printer_list = self.config.printers_11x17
-        elif printer_type == "24x36":
-            printer_list = self.config.printers_24x36
-        elif printer_type == "folder_label":
-            printer_list = self.config.printers_folder_label
+        self._ensure_indexes()
 
         # Find default printer
-        for printer in printer_list:
-            if printer.is_default and printer.is_available:
+        for printer in self._defaults.get(printer_type, []):
+            if printer.is_available:
                 return printer
 
         # If no default or default not available, return first available
-        for printer in printer_list:
+        for printer in self._by_type.get(printer_type, []):
             if printer.is_available:
                 return printer
 
@@ -424,17 +543,8 @@ class NetworkPrinterManager:
         Returns:
             List of PrinterDefinition objects
         """
-        if not self.config:
-            return []
-
-        if printer_type == "11x17":
-            return self.config.printers_11x17
-        elif printer_type == "24x36":
-            return self.config.printers_24x36
-        elif printer_type == "folder_label":
-            return self.config.printers_folder_label
-
-        return []
+        self._ensure_indexes()
+        return self._by_type.get(printer_type, [])
 
     def test_printer_connection(self, printer_name: str) -> Tuple[bool, str]:
         """
@@ -472,6 +582,26 @@ class NetworkPrinterManager:
             })
             return False, f"Failed to connect: {str(e)}"
 
+    def test_all_connections(self, printer_names: List[str]) -> Dict[str, Tuple[bool, str]]:
+        """
+        Test connections to several printers concurrently
+
+        Each test is a blocking spooler round-trip, so running them on a thread
+        pool overlaps the network latency instead of paying it once per printer.
+
+        Args:
+            printer_names: Windows printer names to test
+
+        Returns:
+            Dict of printer name -> (success, message)
+        """
+        unique_names = list(dict.fromkeys(printer_names))
+        if not unique_names:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(MAX_CONNECTION_TEST_WORKERS, len(unique_names))) as executor:
+            return dict(zip(unique_names, executor.map(self.test_printer_connection, unique_names)))
+
     def needs_setup(self) -> bool:
         """
         Check if initial setup is needed
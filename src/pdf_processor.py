@@ -4,23 +4,87 @@ PDF Processor - Extract sales order numbers from PDF files
 """
 
 import re
+import os
 import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Optional, List
+from typing import Iterator, Optional, List
 import PyPDF2
 
+# PDFium (C++) extracts text far faster than PyPDF2; use it when installed
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+# Common patterns for sales order numbers, highest priority first. Each
+# captures into a named group of PDFProcessor.order_pattern
+# IMPORTANT: Order numbers are ALWAYS 7 digits
+ORDER_PATTERNS = (
+    ('so', r'(?:SO|Sales Order|Order)[:\s#]*(?P<so>\d{7})'),  # SO + 7 digits
+    ('job', r'(?:Job|Project)[:\s#]*(?P<job>\d{7})'),  # Job/Project + 7 digits
+    ('ordernum', r'(?:Order Number)[:\s#]*(?P<ordernum>\d{7})'),  # Order Number + 7 digits
+    ('seven', r'\b(?P<seven>\d{7})\b'),  # Exactly 7 digits with word boundaries
+    ('prefix', r'(?:SO|Sales Order|Order)[:\s#]*(?P<prefix>[A-Z0-9\-]+)'),  # Fallback with prefix
+    ('generic', r'(?P<generic>\d{4,8})'),  # Generic number pattern (fallback)
+)
+ORDER_GROUP_PRECEDENCE = tuple(group for group, _ in ORDER_PATTERNS)
+
+# Order number cleanup/validation
+_CLEAN_PREFIX_RE = re.compile(r'^(SO|Order|Job)[:\s\-]*', re.IGNORECASE)
+_CLEAN_SUFFIX_RE = re.compile(r'[:\s]*$')
+_HAS_DIGIT_RE = re.compile(r'\d')
+
+# Last-resort digit sequences when no order pattern produced a valid match
+_SEVEN_DIGIT_RE = re.compile(r'\b\d{7}\b')
+_DIGIT_RUN_RE = re.compile(r'\d{4,}')
+_BOUNDED_DIGIT_RUN_RE = re.compile(r'\b\d{4,}\b')
+
+# Bound for the filename/content result caches
+ORDER_CACHE_SIZE = 4096
+
+# Orders are on the first page or two; never read past this many pages
+MAX_CONTENT_PAGES = 3
+
+# Order numbers sit near the top of a page; only search this much of its text
+MAX_PAGE_TEXT_CHARS = 50000
+
+# extract_sales_orders only uses worker processes when at least this many
+# PDFs need their content parsed. Each spawned worker re-imports the app
+# (pandas, Tk), which costs more than parsing a handful of PDFs in-process
+PARALLEL_SCAN_MIN_FILES = 48
+
+# Upper bound on worker processes, whatever the core count
+MAX_SCAN_WORKERS = 4
+
+
 class PDFProcessor:
     def __init__(self):
-        # Common patterns for sales order numbers
-        # IMPORTANT: Order numbers are ALWAYS 7 digits
-        self.order_patterns = [
-            r'(?:SO|Sales Order|Order)[:\s#]*(\d{7})',  # SO + 7 digits
-            r'(?:Job|Project)[:\s#]*(\d{7})',  # Job/Project + 7 digits
-            r'(?:Order Number)[:\s#]*(\d{7})',  # Order Number + 7 digits
-            r'\b(\d{7})\b',  # Exactly 7 digits with word boundaries
-            r'(?:SO|Sales Order|Order)[:\s#]*([A-Z0-9\-]+)',  # Fallback with prefix
-            r'(\d{4,8})',  # Generic number pattern (fallback)
-        ]
+        # The patterns combined into a single alternation so the text is
+        # scanned once. The lookahead keeps matches zero-width so a long
+        # match (e.g. the prefix fallback) cannot swallow a better one
+        # inside it
+        self.order_pattern = re.compile(
+            '(?=' + '|'.join(pattern for _, pattern in ORDER_PATTERNS) + ')',
+            re.IGNORECASE
+        )
+        # The alternation reports only the first group matching at a position,
+        # so lower-priority groups are checked there on their own
+        self._group_patterns = {group: re.compile(pattern, re.IGNORECASE)
+                                for group, pattern in ORDER_PATTERNS}
+
+        # Cheap first check for the common case: the text holds exactly one
+        # run of digits and it is a standalone 7-digit order number
+        self._lone_seven_digit_re = re.compile(r'\D*\b(\d{7})\b\D*')
+
+        # Filename lookups are pure, so cache them per processor; content
+        # results are keyed on (path, mtime, size) so edited PDFs are re-read
+        self.extract_from_filename = lru_cache(maxsize=ORDER_CACHE_SIZE)(self.extract_from_filename)
+        self._content_cache = {}
 
     def extract_sales_order(self, pdf_path: Path) -> Optional[str]:
         """Extract sales order number from PDF file"""
@@ -49,134 +113,226 @@ class PDFProcessor:
 
     def extract_from_filename(self, filename: str) -> Optional[str]:
         """Extract sales order from filename"""
-        # Remove file extension
-        name_without_ext = Path(filename).stem
-        logging.debug(f"Filename stem: '{name_without_ext}'")
-
-        # Try each pattern
-        for pattern in self.order_patterns:
-            match = re.search(pattern, name_without_ext, re.IGNORECASE)
-            if match:
-                extracted = match.group(1) if match.lastindex >= 1 else match.group(0)
-                cleaned = self.clean_order_number(extracted)
-                logging.debug(f"Pattern '{pattern}' matched: '{extracted}' -> cleaned: '{cleaned}'")
-
-                # Validate the extracted order number
-                if self.validate_order_number(cleaned):
-                    logging.info(f"Valid order number from filename: {cleaned}")
-                    return cleaned
-                else:
-                    logging.debug(f"Order number '{cleaned}' failed validation")
+        # Remove file extension (plain string split; no need to build a Path)
+        name_without_ext = filename.rpartition('.')[0] or filename
+        logging.debug("Filename stem: '%s'", name_without_ext)
 
-        # If no pattern matches, look for digit sequences
-        # IMPORTANT: Order numbers are ALWAYS 7 digits - prioritize those
+        order_number = self._find_order_in_text(name_without_ext)
+        if order_number:
+            logging.info(f"Valid order number from filename: {order_number}")
+            return order_number
 
-        # First, look for exactly 7-digit sequences
-        seven_digit_matches = re.findall(r'\b\d{7}\b', name_without_ext)
-        if seven_digit_matches:
-            order_num = seven_digit_matches[0]
-            logging.debug(f"Found 7-digit sequence: {order_num}")
-            if self.validate_order_number(order_num):
-                logging.info(f"Valid 7-digit order number: {order_num}")
-                return order_num
-
-        # Fallback: Look for 4+ consecutive digits (for edge cases)
-        digit_matches = re.findall(r'\d{4,}', name_without_ext)
-        if digit_matches:
-            # Prefer 7-digit matches
-            for match in digit_matches:
-                if len(match) == 7:
-                    order_num = match
-                    logging.debug(f"Found 7-digit in fallback: {order_num}")
-                    if self.validate_order_number(order_num):
-                        logging.info(f"Valid 7-digit order number from fallback: {order_num}")
-                        return order_num
-
-            # Last resort: take first match of any length
-            order_num = digit_matches[0]
-            logging.debug(f"Found digit sequence: {order_num}")
-            if self.validate_order_number(order_num):
-                logging.info(f"Valid order number from digit sequence: {order_num}")
-                return order_num
-
-        logging.debug(f"No valid order number found in filename: {filename}")
+        logging.debug("No valid order number found in filename: %s", filename)
         return None
 
     def extract_from_content(self, pdf_path: Path) -> Optional[str]:
         """Extract sales order from PDF content"""
         try:
-            with open(pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                logging.debug(f"PDF has {len(pdf_reader.pages)} pages")
-
-                # Extract text from first few pages (orders usually on first page)
-                text = ""
-                for page_num in range(min(3, len(pdf_reader.pages))):
-                    page = pdf_reader.pages[page_num]
-                    page_text = page.extract_text()
-                    text += page_text
-                    logging.debug(f"Page {page_num + 1} text length: {len(page_text)} chars")
-
-                logging.debug(f"Total extracted text: {len(text)} chars")
-                logging.debug(f"First 200 chars: {text[:200]}")
-
-                # Try each pattern on the extracted text
-                for pattern in self.order_patterns:
-                    match = re.search(pattern, text, re.IGNORECASE)
-                    if match:
-                        extracted = match.group(1) if match.lastindex >= 1 else match.group(0)
-                        order_number = self.clean_order_number(extracted)
-                        logging.debug(f"Content pattern '{pattern}' matched: '{extracted}' -> '{order_number}'")
-
-                        if self.validate_order_number(order_number):
-                            logging.info(f"Valid order number from PDF content: {order_number}")
-                            return order_number
-                        else:
-                            logging.debug(f"Order '{order_number}' failed validation")
-
-                # Also try finding digit sequences in content as fallback
-                # IMPORTANT: Order numbers are ALWAYS 7 digits - prioritize those
-
-                # First, try to find exactly 7-digit sequences
-                seven_digit_matches = re.findall(r'\b\d{7}\b', text)
-                if seven_digit_matches:
-                    logging.debug(f"Found 7-digit sequences in content: {seven_digit_matches[:5]}")  # Show first 5
-                    for match in seven_digit_matches[:5]:  # Try first 5 7-digit matches
-                        if self.validate_order_number(match):
-                            logging.info(f"Valid 7-digit order number from content: {match}")
-                            return match
-
-                # Fallback: try finding 4+ digit sequences
-                digit_matches = re.findall(r'\b\d{4,}\b', text)
-                if digit_matches:
-                    logging.debug(f"Found digit sequences in content: {digit_matches[:5]}")  # Show first 5
-                    # First pass: look for 7-digit matches
-                    for match in digit_matches:
-                        if len(match) == 7 and self.validate_order_number(match):
-                            logging.info(f"Valid 7-digit order number from content fallback: {match}")
-                            return match
-                    # Second pass: try any valid match
-                    for match in digit_matches[:10]:  # Try first 10 matches
-                        if self.validate_order_number(match):
-                            logging.info(f"Valid order number from content digit sequence: {match}")
-                            return match
-
+            cache_key = _content_cache_key(pdf_path)
+            if cache_key in self._content_cache:
+                logging.debug("Using cached content result for %s", pdf_path)
+                return self._content_cache[cache_key]
+
+            # Search the first few pages one at a time (orders usually on
+            # first page) and stop at the first page with a valid match
+            order_number = None
+            debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
+            for page_num, page_text in self._iter_page_texts(pdf_path):
+                if debug_enabled:
+                    logging.debug("Page %d text length: %d chars", page_num + 1, len(page_text))
+                    logging.debug("First 200 chars: %s", page_text[:200])
+
+                # Every valid order number contains a digit, so a page
+                # without any cannot match; skip the full pattern scan
+                page_text = page_text[:MAX_PAGE_TEXT_CHARS]
+                if not _HAS_DIGIT_RE.search(page_text):
+                    continue
+
+                order_number = self._find_order_in_text(page_text, from_content=True)
+                if order_number:
+                    break
+
+            self._remember_content_order(cache_key, order_number)
+
+            if order_number:
+                logging.info(f"Valid order number from PDF content: {order_number}")
+            else:
                 logging.debug("No valid order number found in PDF content")
-                return None
+            return order_number
 
         except Exception as e:
             logging.error(f"Error reading PDF content from {pdf_path}: {e}")
             return None
 
-    def clean_order_number(self, raw_order: str) -> str:
+    def _remember_content_order(self, cache_key: tuple, order_number: Optional[str]):
+        """Cache a content extraction result, bounded by ORDER_CACHE_SIZE"""
+        if len(self._content_cache) >= ORDER_CACHE_SIZE:
+            self._content_cache.clear()
+        self._content_cache[cache_key] = order_number
+
+    def extract_sales_orders(self, pdf_paths: List[Path]) -> List[Optional[str]]:
+        """
+        Extract sales orders for many PDFs, parsing uncached content in parallel
+
+        Filename matches and cached content results are resolved here; only
+        PDFs whose content still has to be parsed go to worker processes.
+
+        Returns:
+            Sales order (or None) for each path, in the same order
+        """
+        orders: List[Optional[str]] = [None] * len(pdf_paths)
+        pending = []  # (index, content cache key) of PDFs that need parsing
+
+        for index, pdf_path in enumerate(pdf_paths):
+            filename_order = self.extract_from_filename(pdf_path.name)
+            if filename_order:
+                orders[index] = filename_order
+                continue
+
+            try:
+                cache_key = _content_cache_key(pdf_path)
+            except OSError:
+                cache_key = None
+            if cache_key in self._content_cache:
+                orders[index] = self._content_cache[cache_key]
+            else:
+                pending.append((index, cache_key))
+
+        if len(pending) >= PARALLEL_SCAN_MIN_FILES:
+            try:
+                # PDF parsing is CPU-bound, so spread files across processes
+                parsed = list(_get_worker_pool().map(
+                    _extract_worker, [pdf_paths[index] for index, _ in pending], chunksize=4
+                ))
+                for (index, cache_key), order_number in zip(pending, parsed):
+                    orders[index] = order_number
+                    if cache_key is not None:
+                        self._remember_content_order(cache_key, order_number)
+                return orders
+            except Exception as e:
+                if isinstance(e, BrokenProcessPool):
+                    _discard_worker_pool()
+                logging.warning(f"Parallel PDF extraction failed, extracting sequentially: {e}")
+
+        for index, _ in pending:
+            orders[index] = self.extract_sales_order(pdf_paths[index])
+
+        return orders
+
+    def _iter_page_texts(self, pdf_path: Path) -> Iterator[tuple]:
+        """Yield (page_num, text) for the first MAX_CONTENT_PAGES pages of a PDF"""
+        if pdfium is not None:
+            pdf = pdfium.PdfDocument(str(pdf_path))
+            try:
+                logging.debug("PDF has %d pages", len(pdf))
+                for page_num in range(min(MAX_CONTENT_PAGES, len(pdf))):
+                    page = pdf[page_num]
+                    textpage = page.get_textpage()
+                    try:
+                        yield page_num, textpage.get_text_bounded()
+                    finally:
+                        textpage.close()
+                        page.close()
+            finally:
+                pdf.close()
+            return
+
+        with open(pdf_path, 'rb') as file:
+            pdf_reader = PyPDF2.PdfReader(file)
+            logging.debug("PDF has %d pages", len(pdf_reader.pages))
+
+            # Iterate rather than index: some PyPDF2 versions walk the page
+            # tree again for every pages[i] lookup
+            for page_num, page in enumerate(islice(pdf_reader.pages, MAX_CONTENT_PAGES)):
+                yield page_num, page.extract_text()
+
+    def _find_order_in_text(self, text: str, from_content: bool = False) -> Optional[str]:
+        """Find the best valid order number in text using one pass of the combined pattern"""
+        # With a single 7-digit run every pattern would capture those same
+        # digits, so skip the full alternation
+        lone_match = self._lone_seven_digit_re.fullmatch(text)
+        if lone_match and self.validate_order_number(lone_match.group(1)):
+            return lone_match.group(1)
+
+        # First match of each group, or None if it failed validation
+        first_matches = {}
+        debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
+        for match in self.order_pattern.finditer(text):
+            position = match.start()
+            matched_group = match.lastgroup
+            for group in ORDER_GROUP_PRECEDENCE[ORDER_GROUP_PRECEDENCE.index(matched_group):]:
+                if group in first_matches:
+                    continue
+                if group == matched_group:
+                    extracted = match.group(group)
+                else:
+                    group_match = self._group_patterns[group].match(text, position)
+                    if not group_match:
+                        continue
+                    extracted = group_match.group(group)
+
+                order_number = self.clean_order_number(extracted)
+                is_valid = self.validate_order_number(order_number)
+                if debug_enabled:
+                    logging.debug("Pattern '%s' matched: '%s' -> '%s' (valid: %s)",
+                                  group, extracted, order_number, is_valid)
+
+                first_matches[group] = order_number if is_valid else None
+                # Nothing can outrank a valid SO match
+                if is_valid and group == ORDER_GROUP_PRECEDENCE[0]:
+                    return order_number
+
+            if len(first_matches) == len(ORDER_GROUP_PRECEDENCE):
+                break
+
+        for group in ORDER_GROUP_PRECEDENCE:
+            if first_matches.get(group):
+                return first_matches[group]
+
+        return self._find_digit_fallback(text, from_content)
+
+    def _find_digit_fallback(self, text: str, from_content: bool) -> Optional[str]:
+        """Look for bare digit sequences once no order pattern matched"""
+        # IMPORTANT: Order numbers are ALWAYS 7 digits - prioritize those
+        if from_content:
+            # Content: the first few 7-digit sequences, then any 7-digit and
+            # finally the first few 4+ digit sequences
+            for match in islice(_SEVEN_DIGIT_RE.finditer(text), 5):
+                if self.validate_order_number(match.group()):
+                    return match.group()
+
+            digit_matches = _BOUNDED_DIGIT_RUN_RE.findall(text)
+            for order_number in digit_matches:
+                if len(order_number) == 7 and self.validate_order_number(order_number):
+                    return order_number
+            for order_number in digit_matches[:10]:
+                if self.validate_order_number(order_number):
+                    return order_number
+            return None
+
+        # Filename: any valid 7-digit sequence, otherwise only the first
+        # sequence is considered so a sheet number is never taken for the order
+        digit_matches = _DIGIT_RUN_RE.findall(text)
+        for order_number in digit_matches:
+            if len(order_number) == 7 and self.validate_order_number(order_number):
+                return order_number
+        if digit_matches and self.validate_order_number(digit_matches[0]):
+            return digit_matches[0]
+        return None
+
+    @staticmethod
+    @lru_cache(maxsize=ORDER_CACHE_SIZE)
+    def clean_order_number(raw_order: str) -> str:
         """Clean and normalize order number"""
         # Remove common prefixes/suffixes and whitespace
         cleaned = raw_order.strip()
-        cleaned = re.sub(r'^(SO|Order|Job)[:\s\-]*', '', cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r'[:\s]*$', '', cleaned)
+        cleaned = _CLEAN_PREFIX_RE.sub('', cleaned)
+        cleaned = _CLEAN_SUFFIX_RE.sub('', cleaned)
         return cleaned.upper()
 
-    def validate_order_number(self, order_number: str) -> bool:
+    @staticmethod
+    @lru_cache(maxsize=ORDER_CACHE_SIZE)
+    def validate_order_number(order_number: str) -> bool:
         """Validate if the extracted string looks like a valid order number"""
         if not order_number:
             return False
@@ -186,7 +342,7 @@ class PDFProcessor:
             return False
 
         # Must contain at least one digit
-        if not re.search(r'\d', order_number):
+        if not _HAS_DIGIT_RE.search(order_number):
             return False
 
         # Should not be all the same character
@@ -206,8 +362,42 @@ class PDFProcessor:
         pdf_files = list(folder_path.glob("*.pdf"))
         logging.info(f"Found {len(pdf_files)} PDF files in {folder_path}")
 
-        for pdf_file in pdf_files:
-            sales_order = self.extract_sales_order(pdf_file)
-            results.append((str(pdf_file), sales_order))
+        results.extend(zip(map(str, pdf_files), self.extract_sales_orders(pdf_files)))
+        return results
+
+
+def _content_cache_key(pdf_path: Path) -> tuple:
+    """Content cache key; changes whenever the file is rewritten"""
+    stat = os.stat(pdf_path)
+    return (str(pdf_path), stat.st_mtime_ns, stat.st_size)
+
+
+# Worker pool shared by every extract_sales_orders call; started on first use
+# so the workers' imports are paid once per session rather than per scan
+_worker_pool = None
+_worker_pool_lock = threading.Lock()
+
+
+def _get_worker_pool() -> ProcessPoolExecutor:
+    """Get or create the shared PDF extraction worker pool"""
+    global _worker_pool
+    with _worker_pool_lock:
+        if _worker_pool is None:
+            _worker_pool = ProcessPoolExecutor(max_workers=min(MAX_SCAN_WORKERS, os.cpu_count() or 1))
+        return _worker_pool
+
+
+def _discard_worker_pool():
+    """Drop a broken worker pool so the next parallel scan starts a fresh one"""
+    global _worker_pool
+    with _worker_pool_lock:
+        if _worker_pool is not None:
+            # A broken pool has already failed its pending futures; cancel_futures
+            # would need Python 3.9+
+            _worker_pool.shutdown(wait=False)
+            _worker_pool = None
+
 
-        return results
\ No newline at end of file
+def _extract_worker(pdf_path: Path) -> Optional[str]:
+    """Extract a sales order in an extract_sales_orders worker process"""
+    return PDFProcessor().extract_sales_order(pdf_path)
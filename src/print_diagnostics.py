@@ -6,37 +6,64 @@ Generates a detailed report that can be copied and shared
 
 import sys
 import os
-import traceback
+import io
+import importlib
+import importlib.util
 from datetime import datetime
-from pathlib import Path
+from functools import lru_cache
 
 
-def generate_diagnostic_report():
-    """Generate a comprehensive diagnostic report"""
+# Modules whose version is worth reporting, and the attribute holding it.
+# Every other module is only checked for presence.
+MODULE_VERSION_ATTRS = {
+    'tkinter': 'TkVersion',
+    'PyPDF2': '__version__'
+}
+
+
+@lru_cache(maxsize=None)
+def _has_module(module_name: str) -> bool:
+    """Check whether a module can be found without importing it"""
+    # Already-imported modules need no finder walk
+    return module_name in sys.modules or importlib.util.find_spec(module_name) is not None
+
+
+def _format_exc() -> str:
+    """Format the exception being handled; traceback is only imported on error paths"""
+    import traceback
+    return traceback.format_exc()
+
+
+def _cached_win32print():
+    """Return win32print from sys.modules, importing it only the first time"""
+    return sys.modules.get('win32print') or importlib.import_module('win32print')
+
+
+def iter_diagnostic_report():
+    """Generate a comprehensive diagnostic report, one line at a time"""
 
-    report = []
-    report.append("=" * 80)
-    report.append("PRINT SYSTEM DIAGNOSTIC REPORT")
-    report.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    report.append("=" * 80)
-    report.append("")
+    yield "=" * 80
+    yield "PRINT SYSTEM DIAGNOSTIC REPORT"
+    yield f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+    yield "=" * 80
+    yield ""
 
     # System Information
-    report.append("SYSTEM INFORMATION:")
-    report.append("-" * 80)
+    yield "SYSTEM INFORMATION:"
+    yield "-" * 80
     try:
         import platform
-        report.append(f"OS: {platform.system()} {platform.release()}")
-        report.append(f"Python Version: {sys.version}")
-        report.append(f"Machine: {platform.machine()}")
-        report.append(f"Processor: {platform.processor()}")
+        yield f"OS: {platform.system()} {platform.release()}"
+        yield f"Python Version: {sys.version}"
+        yield f"Machine: {platform.machine()}"
+        yield f"Processor: {platform.processor()}"
     except Exception as e:
-        report.append(f"ERROR getting system info: {e}")
-    report.append("")
+        yield f"ERROR getting system info: {e}"
+    yield ""
 
     # Check Required Modules
-    report.append("REQUIRED MODULES:")
-    report.append("-" * 80)
+    yield "REQUIRED MODULES:"
+    yield "-" * 80
 
     modules_to_check = [
         'win32print',
@@ -48,153 +75,142 @@ def generate_diagnostic_report():
 
     for module_name in modules_to_check:
         try:
-            if module_name == 'tkinter':
-                import tkinter
-                report.append(f"✓ {module_name}: OK (version: {tkinter.TkVersion})")
-            elif module_name == 'win32print':
-                import win32print
-                report.append(f"✓ {module_name}: OK")
-            elif module_name == 'win32api':
-                import win32api
-                report.append(f"✓ {module_name}: OK")
-            elif module_name == 'PyPDF2':
-                import PyPDF2
-                report.append(f"✓ {module_name}: OK (version: {PyPDF2.__version__ if hasattr(PyPDF2, '__version__') else 'unknown'})")
-            elif module_name == 'docx':
-                import docx
-                report.append(f"✓ {module_name}: OK")
+            if not _has_module(module_name):
+                yield f"✗ {module_name}: MISSING - No module named '{module_name}'"
+                continue
+
+            # Only import modules we need a version from
+            version_attr = MODULE_VERSION_ATTRS.get(module_name)
+            if version_attr:
+                module = importlib.import_module(module_name)
+                yield f"✓ {module_name}: OK (version: {getattr(module, version_attr, 'unknown')})"
             else:
-                __import__(module_name)
-                report.append(f"✓ {module_name}: OK")
+                yield f"✓ {module_name}: OK"
         except ImportError as e:
-            report.append(f"✗ {module_name}: MISSING - {e}")
+            yield f"✗ {module_name}: MISSING - {e}"
         except Exception as e:
-            report.append(f"✗ {module_name}: ERROR - {e}")
-    report.append("")
+            yield f"✗ {module_name}: ERROR - {e}"
+    yield ""
 
     # Check Printer Access
-    report.append("PRINTER DETECTION:")
-    report.append("-" * 80)
+    yield "PRINTER DETECTION:"
+    yield "-" * 80
     try:
-        import win32print
+        win32print = _cached_win32print()
 
-        # Get available printers
+        # Get available printers; level 2 includes driver and port details,
+        # so no per-printer OpenPrinter/GetPrinter round-trip is needed
         printers = win32print.EnumPrinters(
-            win32print.PRINTER_ENUM_LOCAL | win32print.PRINTER_ENUM_CONNECTIONS
+            win32print.PRINTER_ENUM_LOCAL | win32print.PRINTER_ENUM_CONNECTIONS,
+            None,
+            2
         )
 
         if printers:
-            report.append(f"Found {len(printers)} printers:")
-            for idx, printer in enumerate(printers):
-                printer_name = printer[2]
-                report.append(f"  {idx + 1}. {printer_name}")
-
-                # Try to get printer details
-                try:
-                    hprinter = win32print.OpenPrinter(printer_name)
-                    try:
-                        printer_info = win32print.GetPrinter(hprinter, 2)
-                        driver = printer_info.get('pDriverName', 'Unknown')
-                        port = printer_info.get('pPortName', 'Unknown')
-                        report.append(f"     Driver: {driver}")
-                        report.append(f"     Port: {port}")
-                    except Exception as e:
-                        report.append(f"     ERROR getting details: {e}")
-                    finally:
-                        win32print.ClosePrinter(hprinter)
-                except Exception as e:
-                    report.append(f"     ERROR opening printer: {e}")
+            yield f"Found {len(printers)} printers:"
+            for idx, printer_info in enumerate(printers):
+                yield f"  {idx + 1}. {printer_info.get('pPrinterName', 'Unknown')}"
+                yield f"     Driver: {printer_info.get('pDriverName', 'Unknown')}"
+                yield f"     Port: {printer_info.get('pPortName', 'Unknown')}"
         else:
-            report.append("✗ NO PRINTERS FOUND")
-            report.append("  Possible causes:")
-            report.append("  - No printers installed on this system")
-            report.append("  - Print spooler service not running")
-            report.append("  - Permission issues")
+            yield "✗ NO PRINTERS FOUND"
+            yield "  Possible causes:"
+            yield "  - No printers installed on this system"
+            yield "  - Print spooler service not running"
+            yield "  - Permission issues"
 
         # Get default printer
         try:
             default_printer = win32print.GetDefaultPrinter()
-            report.append(f"\nDefault Printer: {default_printer}")
+            yield f"\nDefault Printer: {default_printer}"
         except Exception as e:
-            report.append(f"\n✗ Could not get default printer: {e}")
+            yield f"\n✗ Could not get default printer: {e}"
 
     except ImportError:
-        report.append("✗ win32print module not available")
-        report.append("  Install with: pip install pywin32")
+        yield "✗ win32print module not available"
+        yield "  Install with: pip install pywin32"
     except Exception as e:
-        report.append(f"✗ ERROR accessing printers: {e}")
-        report.append(f"  Traceback: {traceback.format_exc()}")
-    report.append("")
+        yield f"✗ ERROR accessing printers: {e}"
+        yield f"  Traceback: {_format_exc()}"
+    yield ""
 
     # Check Print Preset Manager
-    report.append("PRINT PRESET MANAGER:")
-    report.append("-" * 80)
+    yield "PRINT PRESET MANAGER:"
+    yield "-" * 80
     try:
         from print_preset_manager import PrintPresetManager
 
         preset_mgr = PrintPresetManager()
-        presets = preset_mgr.get_all_presets()
+        presets = preset_mgr.iter_presets()
 
-        report.append(f"Preset file location: {preset_mgr.presets_file}")
-        report.append(f"Found {len(presets)} presets:")
+        yield f"Preset file location: {preset_mgr.presets_file}"
+        yield f"Found {len(presets)} presets:"
 
         for name, preset in presets.items():
-            report.append(f"\n  Preset: {name}")
-            report.append(f"    Default: {'Yes' if preset.is_default else 'No'}")
-            report.append(f"    11x17: {'Enabled' if preset.printer_11x17_enabled else 'Disabled'}")
+            yield f"\n  Preset: {name}"
+            yield f"    Default: {'Yes' if preset.is_default else 'No'}"
+            yield f"    11x17: {'Enabled' if preset.printer_11x17_enabled else 'Disabled'}"
             if preset.printer_11x17_enabled:
-                report.append(f"      Script: {preset.printer_11x17_script or '(not configured)'}")
-                report.append(f"      Copies: {preset.printer_11x17_copies}")
-            report.append(f"    24x36: {'Enabled' if preset.printer_24x36_enabled else 'Disabled'}")
+                yield f"      Script: {preset.printer_11x17_script or '(not configured)'}"
+                yield f"      Copies: {preset.printer_11x17_copies}"
+            yield f"    24x36: {'Enabled' if preset.printer_24x36_enabled else 'Disabled'}"
             if preset.printer_24x36_enabled:
-                report.append(f"      Script: {preset.printer_24x36_script or '(not configured)'}")
-                report.append(f"      Copies: {preset.printer_24x36_copies}")
-            report.append(f"    Folder Label: {'Enabled' if preset.folder_label_enabled else 'Disabled'}")
+                yield f"      Script: {preset.printer_24x36_script or '(not configured)'}"
+                yield f"      Copies: {preset.printer_24x36_copies}"
+            yield f"    Folder Label: {'Enabled' if preset.folder_label_enabled else 'Disabled'}"
             if preset.folder_label_enabled:
-                report.append(f"      Printer: {preset.folder_label_printer or '(not configured)'}")
+                yield f"      Printer: {preset.folder_label_printer or '(not configured)'}"
 
     except ImportError as e:
-        report.append(f"✗ Could not import PrintPresetManager: {e}")
+        yield f"✗ Could not import PrintPresetManager: {e}"
     except Exception as e:
-        report.append(f"✗ ERROR checking presets: {e}")
-        report.append(f"  Traceback: {traceback.format_exc()}")
-    report.append("")
+        yield f"✗ ERROR checking presets: {e}"
+        yield f"  Traceback: {_format_exc()}"
+    yield ""
 
     # Check Database
-    report.append("DATABASE:")
-    report.append("-" * 80)
+    yield "DATABASE:"
+    yield "-" * 80
     try:
         db_file = "document_manager_v2.1.db"
-        if Path(db_file).exists():
-            size = Path(db_file).stat().st_size
-            report.append(f"✓ Database found: {db_file}")
-            report.append(f"  Size: {size:,} bytes")
 
-            # Try to connect
-            import sqlite3
-            conn = sqlite3.connect(db_file)
-            cursor = conn.cursor()
-
-            # Get table count
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-            tables = cursor.fetchall()
-            report.append(f"  Tables: {len(tables)}")
+        # One stat answers both "does it exist" and "how big is it"
+        try:
+            db_size = os.stat(db_file).st_size
+        except (FileNotFoundError, NotADirectoryError):
+            db_size = None
 
-            # Get order count
-            cursor.execute("SELECT COUNT(*) FROM relationships")
-            order_count = cursor.fetchone()[0]
-            report.append(f"  Total orders: {order_count}")
+        if db_size is not None:
+            yield f"✓ Database found: {db_file}"
+            yield f"  Size: {db_size:,} bytes"
 
-            conn.close()
+            # Try to connect - read-only, diagnostics never write to the database
+            import sqlite3
+            conn = sqlite3.connect(f"file:{db_file}?mode=ro", uri=True)
+            try:
+                cursor = conn.cursor()
+
+                # Get table count
+                cursor.execute("SELECT COUNT(*) FROM sqlite_master WHERE type='table'")
+                yield f"  Tables: {cursor.fetchone()[0]}"
+
+                # Get order count. MAX(rowid) would be cheaper but overcounts:
+                # relationships are saved with INSERT OR REPLACE, which
+                # deletes and re-inserts under a new AUTOINCREMENT id.
+                cursor.execute("SELECT COUNT(*) FROM relationships")
+                order_count = cursor.fetchone()[0]
+                yield f"  Total orders: {order_count}"
+            finally:
+                conn.close()
         else:
-            report.append(f"✗ Database not found: {db_file}")
+            yield f"✗ Database not found: {db_file}"
     except Exception as e:
-        report.append(f"✗ ERROR checking database: {e}")
-    report.append("")
+        yield f"✗ ERROR checking database: {e}"
+    yield ""
 
     # Check Template File
-    report.append("TEMPLATE FILE:")
-    report.append("-" * 80)
+    yield "TEMPLATE FILE:"
+    yield "-" * 80
     try:
         template_paths = [
             "C:/code/Document Manager/DESIGN FILES/Template.docx",
@@ -204,25 +220,27 @@ def generate_diagnostic_report():
 
         found = False
         for template_path in template_paths:
-            if Path(template_path).exists():
-                report.append(f"✓ Template found: {template_path}")
-                size = Path(template_path).stat().st_size
-                report.append(f"  Size: {size:,} bytes")
-                found = True
-                break
+            try:
+                size = os.stat(template_path).st_size
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            yield f"✓ Template found: {template_path}"
+            yield f"  Size: {size:,} bytes"
+            found = True
+            break
 
         if not found:
-            report.append("✗ Template file not found")
-            report.append("  Searched locations:")
+            yield "✗ Template file not found"
+            yield "  Searched locations:"
             for path in template_paths:
-                report.append(f"    - {path}")
+                yield f"    - {path}"
     except Exception as e:
-        report.append(f"✗ ERROR checking template: {e}")
-    report.append("")
+        yield f"✗ ERROR checking template: {e}"
+    yield ""
 
     # Test Print Functionality (dry run)
-    report.append("PRINT FUNCTIONALITY TEST (DRY RUN):")
-    report.append("-" * 80)
+    yield "PRINT FUNCTIONALITY TEST (DRY RUN):"
+    yield "-" * 80
     try:
         from batch_print_with_presets import should_print_folder_label
 
@@ -237,60 +255,81 @@ def generate_diagnostic_report():
             result = should_print_folder_label(test)
             expected = test["expected"]
             status = "✓" if result == expected else "✗"
-            report.append(f"  {status} Folder label logic - {test['desc']}: {result} (expected {expected})")
+            yield f"  {status} Folder label logic - {test['desc']}: {result} (expected {expected})"
             if result != expected:
                 all_passed = False
 
         if all_passed:
-            report.append("\n✓ All print logic tests passed")
+            yield "\n✓ All print logic tests passed"
         else:
-            report.append("\n✗ Some print logic tests failed")
+            yield "\n✗ Some print logic tests failed"
 
     except ImportError as e:
-        report.append(f"✗ Could not import print modules: {e}")
+        yield f"✗ Could not import print modules: {e}"
     except Exception as e:
-        report.append(f"✗ ERROR testing print functionality: {e}")
-        report.append(f"  Traceback: {traceback.format_exc()}")
-    report.append("")
+        yield f"✗ ERROR testing print functionality: {e}"
+        yield f"  Traceback: {_format_exc()}"
+    yield ""
 
     # Summary
-    report.append("=" * 80)
-    report.append("END OF DIAGNOSTIC REPORT")
-    report.append("=" * 80)
-    report.append("")
-    report.append("INSTRUCTIONS:")
-    report.append("1. Copy this entire report")
-    report.append("2. Send it along with any error messages you see")
-    report.append("3. Include a description of what you were trying to do when the error occurred")
-    report.append("")
+    yield "=" * 80
+    yield "END OF DIAGNOSTIC REPORT"
+    yield "=" * 80
+    yield ""
+    yield "INSTRUCTIONS:"
+    yield "1. Copy this entire report"
+    yield "2. Send it along with any error messages you see"
+    yield "3. Include a description of what you were trying to do when the error occurred"
+    yield ""
+
+
+def _write_report(write, echo=None):
+    """Feed the report to a write callable, lines separated by newlines (no trailing one)"""
+    for index, line in enumerate(iter_diagnostic_report()):
+        if index:
+            write("\n")
+        write(line)
+        if echo:
+            echo(line)
 
-    return "\n".join(report)
 
+def generate_diagnostic_report():
+    """Generate a comprehensive diagnostic report as a single string"""
+    buf = io.StringIO()
+    _write_report(buf.write)
+    return buf.getvalue()
 
-def save_diagnostic_report(filename="print_diagnostic_report.txt"):
-    """Generate and save diagnostic report to file"""
-    try:
-        report = generate_diagnostic_report()
 
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(report)
+def save_diagnostic_report(filename="print_diagnostic_report.txt", echo=None):
+    """
+    Generate diagnostic report and stream it to file
+
+    Args:
+        filename: Report file to write
+        echo: Optional callable given each line as it is written (e.g. print)
+
+    Returns:
+        (filename, None) on success, (None, error message) on failure
+    """
+    try:
+        with open(filename, 'w', encoding='utf-8', buffering=65536) as f:
+            _write_report(f.write, echo)
 
-        return filename, report
+        return filename, None
     except Exception as e:
-        return None, f"ERROR generating report: {e}\n{traceback.format_exc()}"
+        return None, f"ERROR generating report: {e}\n{_format_exc()}"
 
 
 if __name__ == "__main__":
     print("Generating diagnostic report...\n")
 
-    filename, report = save_diagnostic_report()
+    filename, error = save_diagnostic_report(echo=print)
 
     if filename:
-        print(report)
         print(f"\n\nReport saved to: {os.path.abspath(filename)}")
         print("\nYou can now:")
         print("1. Open the file and copy its contents")
         print("2. Or copy the output above")
         print("3. Send it for debugging")
     else:
-        print(report)
+        print(error)
@@ -3,28 +3,60 @@
 Print Preset Manager - Manages printer configuration presets for batch printing
 """
 
-import json
+import hashlib
+import importlib
 import logging
-from typing import Dict, List, Optional
+import os
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, fields
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple
 from pathlib import Path
+from json_compat import json_dumps, json_loads
 
+# How long an EnumPrinters result is reused before asking the spooler again
+PRINTER_LIST_TTL_SECONDS = 10.0
 
+
+def _cached_win32print():
+    """Return win32print from sys.modules, importing it only the first time"""
+    return sys.modules.get('win32print') or importlib.import_module('win32print')
+
+
+# slots=True needs Python 3.10+; older interpreters get a regular dataclass
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class PrintPreset:
     """Represents a print configuration preset"""
-    def __init__(self, name: str, preset_data: Dict):
-        self.name = name
-        self.printer_11x17_enabled = preset_data.get('printer_11x17_enabled', True)
-        self.printer_11x17_script = preset_data.get('printer_11x17_script', '')
-        self.printer_11x17_copies = preset_data.get('printer_11x17_copies', 1)
+    name: str
+    printer_11x17_enabled: bool = True
+    printer_11x17_script: str = ''
+    printer_11x17_copies: int = 1
+
+    printer_24x36_enabled: bool = True
+    printer_24x36_script: str = ''
+    printer_24x36_copies: int = 1
 
-        self.printer_24x36_enabled = preset_data.get('printer_24x36_enabled', True)
-        self.printer_24x36_script = preset_data.get('printer_24x36_script', '')
-        self.printer_24x36_copies = preset_data.get('printer_24x36_copies', 1)
+    folder_label_enabled: bool = True
+    folder_label_printer: str = ''
 
-        self.folder_label_enabled = preset_data.get('folder_label_enabled', True)
-        self.folder_label_printer = preset_data.get('folder_label_printer', '')
+    is_default: bool = False
 
-        self.is_default = preset_data.get('is_default', False)
+    @classmethod
+    def from_dict(cls, name: str, preset_data: Dict) -> 'PrintPreset':
+        """Create a preset from its stored dictionary; missing keys take the defaults"""
+        # One C-level merge, then positional args in field order (unknown keys ignored)
+        merged = {**_PRESET_DEFAULTS, **preset_data}
+        return cls(name, *[merged[key] for key in _PRESET_FIELDS])
+
+    @property
+    def display_name(self) -> str:
+        """List label: starred when default, indented to line up otherwise"""
+        return f"⭐ {self.name}" if self.is_default else f"   {self.name}"
 
     def to_dict(self) -> Dict:
         """Convert preset to dictionary for storage"""
@@ -40,60 +72,91 @@ class PrintPreset:
             'is_default': self.is_default
         }
 
-    def get_printers_config(self, template_path: str = None) -> List[Dict]:
+    def iter_printers_config(self, template_path: str = None) -> Iterator[Dict]:
         """
-        Get printer configuration list for batch printing
+        Yield printer configs for batch printing, one per enabled printer
 
-        Returns:
-            List of printer configs ready for batch execution
+        Yields:
+            Printer configs ready for batch execution
         """
-        printers_config = []
-
         if self.printer_11x17_enabled and self.printer_11x17_script:
-            printers_config.append({
+            yield {
                 'type': '11x17',
                 'printer_name': self.printer_11x17_script,
                 'copies': self.printer_11x17_copies
-            })
+            }
 
         if self.printer_24x36_enabled and self.printer_24x36_script:
-            printers_config.append({
+            yield {
                 'type': '24x36',
                 'printer_name': self.printer_24x36_script,
                 'copies': self.printer_24x36_copies
-            })
+            }
 
         if self.folder_label_enabled and self.folder_label_printer:
-            printers_config.append({
+            yield {
                 'type': 'folder',
                 'printer_name': self.folder_label_printer,
                 'template_path': template_path
-            })
+            }
+
+    def get_printers_config(self, template_path: str = None) -> List[Dict]:
+        """
+        Get printer configuration list for batch printing
+
+        Returns:
+            List of printer configs ready for batch execution
+        """
+        return list(self.iter_printers_config(template_path))
+
 
-        return printers_config
+# Stored keys and their defaults - every field except the name, which is the
+# dict key in the file. Field order matches the PrintPreset constructor.
+_PRESET_DEFAULTS = MappingProxyType(
+    {f.name: f.default for f in fields(PrintPreset) if f.name != 'name'}
+)
+_PRESET_FIELDS = tuple(_PRESET_DEFAULTS)
 
 
 class PrintPresetManager:
     """Manages print presets - saving, loading, and retrieving"""
 
+    # (monotonic timestamp, printer names) shared by every manager instance
+    _printers_cache: Optional[Tuple[float, Tuple[str, ...]]] = None
+
     def __init__(self, presets_file: str = "print_presets.json"):
         self.presets_file = presets_file
-        self.presets: Dict[str, PrintPreset] = {}
-        self.load_presets()
-
-        # Create default presets if none exist
-        if not self.presets:
-            self._create_default_presets()
+        self._presets: Dict[str, PrintPreset] = {}
+        self._loaded = False  # Presets are read from disk on first use
+        self._win32print = None  # Bound on first get_available_printers call
+        self._save_deferred = False  # True inside batch(); mutations skip the write
+        self._default_name: Optional[str] = None  # Index for get_default_preset
+        self._saved_hash: Optional[bytes] = None  # Digest of what is on disk
+
+    @property
+    def presets(self) -> Dict[str, PrintPreset]:
+        """Presets by name, loaded from the presets file on first access"""
+        if not self._loaded:
+            self._loaded = True
+            self.load_presets()
+
+            # Create default presets if none exist
+            if not self._presets:
+                self._create_default_presets()
+
+        return self._presets
 
     def load_presets(self):
         """Load presets from file"""
         try:
             if Path(self.presets_file).exists():
-                with open(self.presets_file, 'r') as f:
-                    data = json.load(f)
+                # One read and one parse of the whole (small) file
+                data = json_loads(Path(self.presets_file).read_bytes())
 
                 for name, preset_data in data.items():
-                    self.presets[name] = PrintPreset(name, preset_data)
+                    self.presets[name] = PrintPreset.from_dict(name, preset_data)
+                self._refresh_default_name()
+                self._saved_hash = self._payload_hash(self._serialize())
 
                 logging.info(f"Loaded {len(self.presets)} print presets")
             else:
@@ -101,15 +164,32 @@ class PrintPresetManager:
         except Exception as e:
             logging.error(f"Failed to load presets: {e}")
 
+    def _serialize(self) -> bytes:
+        """Presets as the JSON bytes stored in the presets file"""
+        return json_dumps({name: preset.to_dict() for name, preset in self.presets.items()})
+
+    @staticmethod
+    def _payload_hash(payload: bytes) -> bytes:
+        """Digest used to detect saves that would not change the file"""
+        return hashlib.blake2b(payload, digest_size=16).digest()
+
     def save_presets(self):
         """Save presets to file"""
         try:
-            data = {}
-            for name, preset in self.presets.items():
-                data[name] = preset.to_dict()
+            payload = self._serialize()
 
-            with open(self.presets_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            # Nothing to write if the presets match what is already on disk
+            payload_hash = self._payload_hash(payload)
+            if payload_hash == self._saved_hash and Path(self.presets_file).exists():
+                logging.debug("Print presets unchanged, skipping save")
+                return True
+
+            # Write to a temp file and swap it in so a crash can't truncate presets
+            temp_file = f"{self.presets_file}.tmp"
+            with open(temp_file, 'wb') as f:
+                f.write(payload)
+            os.replace(temp_file, self.presets_file)
+            self._saved_hash = payload_hash
 
             logging.info(f"Saved {len(self.presets)} print presets")
             return True
@@ -117,6 +197,39 @@ class PrintPresetManager:
             logging.error(f"Failed to save presets: {e}")
             return False
 
+    def _refresh_default_name(self):
+        """Re-index the default preset: first flagged is_default, else the first preset"""
+        self._default_name = next(
+            (name for name, preset in self._presets.items() if preset.is_default),
+            next(iter(self._presets), None)
+        )
+
+    @contextmanager
+    def batch(self):
+        """
+        Group several preset changes into a single save
+
+        Usage:
+            with manager.batch():
+                for name, data in imported.items():
+                    manager.add_preset(name, data)
+        """
+        if self._save_deferred:
+            # Already inside a batch - the outer one does the save
+            yield
+            return
+
+        self._save_deferred = True
+        try:
+            yield
+        finally:
+            self._save_deferred = False
+            self.save_presets()
+
+    def _save_or_defer(self) -> bool:
+        """Save presets now, or leave it to the enclosing batch()"""
+        return True if self._save_deferred else self.save_presets()
+
     def _create_default_presets(self):
         """Create default presets for new installations"""
         default_presets = {
@@ -156,7 +269,8 @@ class PrintPresetManager:
         }
 
         for name, preset_data in default_presets.items():
-            self.presets[name] = PrintPreset(name, preset_data)
+            self.presets[name] = PrintPreset.from_dict(name, preset_data)
+        self._default_name = "Standard Plot"
 
         self.save_presets()
         logging.info("Created default print presets")
@@ -166,24 +280,21 @@ class PrintPresetManager:
         return self.presets.get(name)
 
     def get_all_presets(self) -> Dict[str, PrintPreset]:
-        """Get all presets"""
+        """Get all presets (a copy the caller may modify)"""
         return self.presets.copy()
 
+    def iter_presets(self) -> Mapping[str, PrintPreset]:
+        """Read-only live view of all presets, for callers that only read"""
+        return MappingProxyType(self.presets)
+
     def get_preset_names(self) -> List[str]:
         """Get list of preset names"""
         return list(self.presets.keys())
 
     def get_default_preset(self) -> Optional[PrintPreset]:
         """Get the default preset"""
-        for preset in self.presets.values():
-            if preset.is_default:
-                return preset
-
-        # If no default set, return first preset
-        if self.presets:
-            return list(self.presets.values())[0]
-
-        return None
+        # _default_name is kept current by every mutation, so this is a dict lookup
+        return self.presets.get(self._default_name)
 
     def add_preset(self, name: str, preset_data: Dict) -> bool:
         """Add a new preset"""
@@ -191,8 +302,9 @@ class PrintPresetManager:
             if name in self.presets:
                 logging.warning(f"Preset '{name}' already exists, will be overwritten")
 
-            self.presets[name] = PrintPreset(name, preset_data)
-            return self.save_presets()
+            self.presets[name] = PrintPreset.from_dict(name, preset_data)
+            self._refresh_default_name()
+            return self._save_or_defer()
         except Exception as e:
             logging.error(f"Failed to add preset '{name}': {e}")
             return False
@@ -204,8 +316,9 @@ class PrintPresetManager:
                 logging.error(f"Preset '{name}' does not exist")
                 return False
 
-            self.presets[name] = PrintPreset(name, preset_data)
-            return self.save_presets()
+            self.presets[name] = PrintPreset.from_dict(name, preset_data)
+            self._refresh_default_name()
+            return self._save_or_defer()
         except Exception as e:
             logging.error(f"Failed to update preset '{name}': {e}")
             return False
@@ -226,12 +339,15 @@ class PrintPresetManager:
             if self.presets[name].is_default:
                 del self.presets[name]
                 # Set first remaining preset as default
-                first_preset = list(self.presets.values())[0]
-                first_preset.is_default = True
+                first_name = next(iter(self.presets))
+                self.presets[first_name].is_default = True
+                self._default_name = first_name
             else:
                 del self.presets[name]
+                if name == self._default_name:
+                    self._refresh_default_name()
 
-            return self.save_presets()
+            return self._save_or_defer()
         except Exception as e:
             logging.error(f"Failed to delete preset '{name}': {e}")
             return False
@@ -249,20 +365,34 @@ class PrintPresetManager:
 
             # Set new default
             self.presets[name].is_default = True
+            self._default_name = name
 
-            return self.save_presets()
+            return self._save_or_defer()
         except Exception as e:
             logging.error(f"Failed to set default preset '{name}': {e}")
             return False
 
-    def get_available_printers(self) -> List[str]:
-        """Get list of available printers (print server scripts)"""
+    def get_available_printers(self, force_refresh: bool = False) -> List[str]:
+        """
+        Get list of available printers (print server scripts)
+
+        The spooler is queried at most once per PRINTER_LIST_TTL_SECONDS
+        unless force_refresh is set.
+        """
+        cache = PrintPresetManager._printers_cache
+        if not force_refresh and cache and time.monotonic() - cache[0] < PRINTER_LIST_TTL_SECONDS:
+            return list(cache[1])
+
         try:
-            import win32print
+            if self._win32print is None:
+                self._win32print = _cached_win32print()
+            win32print = self._win32print
             printers = win32print.EnumPrinters(
                 win32print.PRINTER_ENUM_LOCAL | win32print.PRINTER_ENUM_CONNECTIONS
             )
-            return [printer[2] for printer in printers]
+            printer_names = tuple(printer[2] for printer in printers)
+            PrintPresetManager._printers_cache = (time.monotonic(), printer_names)
+            return list(printer_names)
         except Exception as e:
             logging.error(f"Failed to get available printers: {e}")
             return []
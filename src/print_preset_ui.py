@@ -5,10 +5,18 @@ Print Preset UI - User interface for managing print presets
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import Optional, Callable
+from typing import Dict, List, Optional, Callable, Tuple
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from print_preset_manager import PrintPresetManager, PrintPreset
 
+# Quiet period before a listbox selection loads the editor, so holding an
+# arrow key only loads the preset it stops on
+SELECT_DEBOUNCE_MS = 50
+
+# How often the Tk thread checks for a finished preset file operation
+IO_POLL_MS = 20
+
 
 class PresetManagerDialog(tk.Toplevel):
     """Dialog for managing print presets"""
@@ -17,12 +25,29 @@ class PresetManagerDialog(tk.Toplevel):
         super().__init__(parent)
         self.parent_window = parent
         self.preset_manager = preset_manager
+
+        # (name, preset) pairs in listbox order, rebuilt by refresh_preset_list
+        self._preset_cache: List[Tuple[str, PrintPreset]] = []
+        self._preset_index: Dict[str, int] = {}
+        self._ordered_names: Tuple[str, ...] = ()
+        self._select_after_id: Optional[str] = None  # Pending debounced selection
+
+        # Preset file writes run on one worker thread so the dialog never blocks on disk
+        self._io = ThreadPoolExecutor(max_workers=1)
+        self._io_busy = False
+        self._io_after_id: Optional[str] = None
+
+        # Served from the manager's short-lived printer cache when the spooler
+        # was queried recently, so reopening the dialog doesn't re-enumerate
         self.available_printers = preset_manager.get_available_printers()
 
         # If no printers found, show a warning
         if not self.available_printers:
             self.available_printers = ["(No printers detected - check printer installation)"]
 
+        # Shared, immutable values for the three printer comboboxes
+        self._printer_values = tuple(self.available_printers)
+
         self.setup_window()
 
     def setup_window(self):
@@ -62,7 +87,9 @@ class PresetManagerDialog(tk.Toplevel):
             fg='#2c3e50'
         ).pack(anchor=tk.W, pady=(0, 10))
 
-        # Preset listbox
+        # Preset listbox. Tk's Listbox stores rows as strings and only draws the
+        # visible ones, so it stays fast with thousands of presets - no
+        # per-row widgets to virtualize.
         listbox_frame = tk.Frame(left_frame)
         listbox_frame.pack(fill=tk.BOTH, expand=True)
 
@@ -73,11 +100,11 @@ class PresetManagerDialog(tk.Toplevel):
             height=15
         )
         self.preset_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        self.preset_listbox.bind('<<ListboxSelect>>', self.on_preset_selected)
+        self.preset_listbox.bind('<<ListboxSelect>>', self._on_listbox_select)
 
-        scrollbar = ttk.Scrollbar(listbox_frame, orient=tk.VERTICAL, command=self.preset_listbox.yview)
-        self.preset_listbox.configure(yscrollcommand=scrollbar.set)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.preset_scrollbar = ttk.Scrollbar(listbox_frame, orient=tk.VERTICAL, command=self.preset_listbox.yview)
+        self.preset_listbox.configure(yscrollcommand=self.preset_scrollbar.set)
+        self.preset_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
         # Preset action buttons
         preset_btn_frame = tk.Frame(left_frame, bg='#ecf0f1')
@@ -111,11 +138,15 @@ class PresetManagerDialog(tk.Toplevel):
         self.right_frame = tk.Frame(content_frame, bg='#ffffff', relief='solid', borderwidth=1)
         self.right_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
+        # Editor widgets are built once and reused for every preset
+        self._build_editor_once()
+
         # Initially show "Select a preset" message
         self.show_empty_editor()
 
-        # Populate preset list (must be after right_frame is created)
-        self.refresh_preset_list()
+        # Populate preset list (must be after right_frame is created). Deferred
+        # to idle time so the window paints before presets are loaded.
+        self._refresh_after_id = self.after_idle(self._initial_refresh)
 
         # Bottom buttons
         button_frame = tk.Frame(self, bg='#ecf0f1')
@@ -133,80 +164,139 @@ class PresetManagerDialog(tk.Toplevel):
             pady=8
         ).pack(side=tk.RIGHT)
 
+    def _initial_refresh(self):
+        """First fill of the preset list, once the window has been drawn"""
+        self._refresh_after_id = None
+        self.refresh_preset_list()
+
     def refresh_preset_list(self):
         """Refresh the preset listbox"""
+        # Detach the scrollbar while the rows are replaced so it is only
+        # re-measured once, after the rebuild
+        self.preset_listbox.configure(yscrollcommand='')
         self.preset_listbox.delete(0, tk.END)
 
-        for name, preset in self.preset_manager.get_all_presets().items():
-            display_name = f"⭐ {name}" if preset.is_default else f"   {name}"
-            self.preset_listbox.insert(tk.END, display_name)
+        # One sweep over the presets; selection handlers index into this cache
+        self._preset_cache = list(self.preset_manager.iter_presets().items())
+        self._ordered_names = tuple(name for name, _ in self._preset_cache)
+        self._preset_index = {name: i for i, name in enumerate(self._ordered_names)}
+
+        # Single insert call - one Tcl round-trip instead of one per preset
+        display_names = [preset.display_name for _, preset in self._preset_cache]
+        if display_names:
+            self.preset_listbox.insert(tk.END, *display_names)
+
+        self.preset_listbox.configure(yscrollcommand=self.preset_scrollbar.set)
+        self.preset_scrollbar.set(*self.preset_listbox.yview())
 
         # Select first item
         if self.preset_listbox.size() > 0:
             self.preset_listbox.selection_set(0)
             self.on_preset_selected(None)
 
+    def _on_listbox_select(self, event):
+        """Debounce listbox selection events; only the last one loads the editor"""
+        if self._select_after_id is not None:
+            self.after_cancel(self._select_after_id)
+        self._select_after_id = self.after(SELECT_DEBOUNCE_MS, self._do_select)
+
+    def _do_select(self):
+        """Load the preset the debounced selection settled on"""
+        self._select_after_id = None
+        self.on_preset_selected(None)
+
+    def destroy(self):
+        """Cancel pending callbacks before the dialog goes away"""
+        for after_id in (self._refresh_after_id, self._select_after_id, self._io_after_id):
+            if after_id is not None:
+                self.after_cancel(after_id)
+        self._refresh_after_id = self._select_after_id = self._io_after_id = None
+
+        # Let an in-flight write finish in the background; nothing waits on it
+        self._io.shutdown(wait=False)
+        super().destroy()
+
+    def _run_in_background(self, work: Callable[[], bool], on_done: Callable[[bool], None]):
+        """Run a preset manager call on the I/O thread, then on_done(result) on the Tk thread"""
+        self._io_busy = True
+        self.save_button.configure(state=tk.DISABLED)
+        self._poll_io(self._io.submit(work), on_done)
+
+    def _poll_io(self, future, on_done: Callable[[bool], None]):
+        """Wait for a background preset operation without blocking the event loop"""
+        if not future.done():
+            self._io_after_id = self.after(IO_POLL_MS, self._poll_io, future, on_done)
+            return
+
+        self._io_after_id = None
+        self._io_busy = False
+        self.save_button.configure(state=tk.NORMAL)
+
+        try:
+            result = future.result()
+        except Exception as e:
+            logging.error(f"Preset operation failed: {e}")
+            result = False
+
+        on_done(result)
+
     def on_preset_selected(self, event):
         """Handle preset selection"""
         selection = self.preset_listbox.curselection()
         if not selection:
             return
 
-        index = selection[0]
-        preset_names = list(self.preset_manager.get_all_presets().keys())
-        preset_name = preset_names[index]
-        preset = self.preset_manager.get_preset(preset_name)
-
-        if preset:
-            self.show_preset_editor(preset_name, preset)
+        preset_name, preset = self._preset_cache[selection[0]]
+        self.show_preset_editor(preset_name, preset)
 
     def show_empty_editor(self):
         """Show empty editor state"""
-        for widget in self.right_frame.winfo_children():
-            widget.destroy()
-
-        tk.Label(
+        self.editor_frame.pack_forget()
+        self._current_name = None
+        self._current_preset = None
+        self._empty_label.pack(expand=True)
+
+    def _build_editor_once(self):
+        """Create the editor widgets; selecting a preset only updates their variables"""
+        self._current_name: Optional[str] = None
+        self._current_preset: Optional[PrintPreset] = None  # Preset shown in the editor
+
+        # Placeholder shown instead of the editor when nothing is selected
+        self._empty_label = tk.Label(
             self.right_frame,
             text="Select a preset to edit\nor create a new one",
             font=("Segoe UI", 13, "italic"),
             bg='#ffffff',
             fg='#95a5a6'
-        ).pack(expand=True)
-
-    def show_preset_editor(self, preset_name: str, preset: PrintPreset):
-        """Show preset editor"""
-        # Clear right frame
-        for widget in self.right_frame.winfo_children():
-            widget.destroy()
+        )
 
-        # Editor content
-        editor_frame = tk.Frame(self.right_frame, bg='#ffffff')
-        editor_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        # Editor content (packed by show_preset_editor). Its rows are laid out
+        # on one grid instead of a frame per row.
+        self.editor_frame = tk.Frame(self.right_frame, bg='#ffffff')
+        editor_frame = self.editor_frame
+        editor_frame.columnconfigure(1, weight=1)
 
         # Preset name
-        name_frame = tk.Frame(editor_frame, bg='#ffffff')
-        name_frame.pack(fill=tk.X, pady=(0, 20))
-
         tk.Label(
-            name_frame,
+            editor_frame,
             text="Preset Name:",
             font=("Segoe UI", 11, "bold"),
             bg='#ffffff'
-        ).pack(side=tk.LEFT, padx=(0, 10))
+        ).grid(row=0, column=0, sticky=tk.W, padx=(0, 10), pady=(0, 20))
 
-        self.preset_name_var = tk.StringVar(value=preset_name)
+        self.preset_name_var = tk.StringVar()
         tk.Entry(
-            name_frame,
+            editor_frame,
             textvariable=self.preset_name_var,
             font=("Segoe UI", 11),
             width=30
-        ).pack(side=tk.LEFT)
+        ).grid(row=0, column=1, sticky=tk.W, pady=(0, 20))
 
         # 11x17 Printer Settings
         printer1_frame = ttk.LabelFrame(editor_frame, text="11×17 Printer Settings", padding=15)
-        printer1_frame.pack(fill=tk.X, pady=(0, 15))
+        printer1_frame.grid(row=1, column=0, columnspan=2, sticky=tk.EW, pady=(0, 15))
 
-        self.p1_enabled_var = tk.BooleanVar(value=preset.printer_11x17_enabled)
+        self.p1_enabled_var = tk.BooleanVar()
         ttk.Checkbutton(
             printer1_frame,
             text="Enabled",
@@ -214,17 +304,17 @@ class PresetManagerDialog(tk.Toplevel):
         ).pack(anchor=tk.W)
 
         tk.Label(printer1_frame, text="Printer Script:", bg='white').pack(anchor=tk.W, pady=(10, 5))
-        self.p1_script_var = tk.StringVar(value=preset.printer_11x17_script)
+        self.p1_script_var = tk.StringVar()
         p1_combo = ttk.Combobox(
             printer1_frame,
             textvariable=self.p1_script_var,
-            values=self.available_printers,
+            values=self._printer_values,
             width=50
         )
         p1_combo.pack(fill=tk.X)
 
         tk.Label(printer1_frame, text="Copies:", bg='white').pack(anchor=tk.W, pady=(10, 5))
-        self.p1_copies_var = tk.IntVar(value=preset.printer_11x17_copies)
+        self.p1_copies_var = tk.IntVar()
         ttk.Spinbox(
             printer1_frame,
             from_=1,
@@ -235,9 +325,9 @@ class PresetManagerDialog(tk.Toplevel):
 
         # 24x36 Printer Settings
         printer2_frame = ttk.LabelFrame(editor_frame, text="24×36 Printer Settings", padding=15)
-        printer2_frame.pack(fill=tk.X, pady=(0, 15))
+        printer2_frame.grid(row=2, column=0, columnspan=2, sticky=tk.EW, pady=(0, 15))
 
-        self.p2_enabled_var = tk.BooleanVar(value=preset.printer_24x36_enabled)
+        self.p2_enabled_var = tk.BooleanVar()
         ttk.Checkbutton(
             printer2_frame,
             text="Enabled",
@@ -245,17 +335,17 @@ class PresetManagerDialog(tk.Toplevel):
         ).pack(anchor=tk.W)
 
         tk.Label(printer2_frame, text="Printer Script:", bg='white').pack(anchor=tk.W, pady=(10, 5))
-        self.p2_script_var = tk.StringVar(value=preset.printer_24x36_script)
+        self.p2_script_var = tk.StringVar()
         p2_combo = ttk.Combobox(
             printer2_frame,
             textvariable=self.p2_script_var,
-            values=self.available_printers,
+            values=self._printer_values,
             width=50
         )
         p2_combo.pack(fill=tk.X)
 
         tk.Label(printer2_frame, text="Copies:", bg='white').pack(anchor=tk.W, pady=(10, 5))
-        self.p2_copies_var = tk.IntVar(value=preset.printer_24x36_copies)
+        self.p2_copies_var = tk.IntVar()
         ttk.Spinbox(
             printer2_frame,
             from_=1,
@@ -266,9 +356,9 @@ class PresetManagerDialog(tk.Toplevel):
 
         # Folder Label Settings
         folder_frame = ttk.LabelFrame(editor_frame, text="Folder Label Settings", padding=15)
-        folder_frame.pack(fill=tk.X, pady=(0, 15))
+        folder_frame.grid(row=3, column=0, columnspan=2, sticky=tk.EW, pady=(0, 15))
 
-        self.folder_enabled_var = tk.BooleanVar(value=preset.folder_label_enabled)
+        self.folder_enabled_var = tk.BooleanVar()
         ttk.Checkbutton(
             folder_frame,
             text="Print folder labels",
@@ -284,54 +374,96 @@ class PresetManagerDialog(tk.Toplevel):
         ).pack(anchor=tk.W, pady=(5, 10))
 
         tk.Label(folder_frame, text="Printer Script:", bg='white').pack(anchor=tk.W, pady=(0, 5))
-        self.folder_printer_var = tk.StringVar(value=preset.folder_label_printer)
+        self.folder_printer_var = tk.StringVar()
         folder_combo = ttk.Combobox(
             folder_frame,
             textvariable=self.folder_printer_var,
-            values=self.available_printers,
+            values=self._printer_values,
             width=50
         )
         folder_combo.pack(fill=tk.X)
 
-        # Save buttons
-        save_frame = tk.Frame(editor_frame, bg='#ffffff')
-        save_frame.pack(fill=tk.X, pady=(20, 0))
+        # Save buttons. Only one of the default label / Set as Default button
+        # is shown, depending on the selected preset.
+        self.default_label = tk.Label(
+            editor_frame,
+            text="⭐ Default Preset",
+            font=("Segoe UI", 10, "bold"),
+            bg='#ffffff',
+            fg='#f39c12'
+        )
+        self.set_default_button = tk.Button(
+            editor_frame,
+            text="⭐ Set as Default",
+            command=lambda: self.set_default(self._current_name),
+            font=("Segoe UI", 10),
+            bg='#f39c12',
+            fg='white',
+            border=0,
+            padx=15,
+            pady=5
+        )
 
-        if preset.is_default:
-            tk.Label(
-                save_frame,
-                text="⭐ Default Preset",
-                font=("Segoe UI", 10, "bold"),
-                bg='#ffffff',
-                fg='#f39c12'
-            ).pack(side=tk.LEFT)
-        else:
-            tk.Button(
-                save_frame,
-                text="⭐ Set as Default",
-                command=lambda: self.set_default(preset_name),
-                font=("Segoe UI", 10),
-                bg='#f39c12',
-                fg='white',
-                border=0,
-                padx=15,
-                pady=5
-            ).pack(side=tk.LEFT)
+        for widget in (self.default_label, self.set_default_button):
+            widget.grid(row=4, column=0, sticky=tk.W, pady=(20, 0))
+            widget.grid_remove()
 
-        tk.Button(
-            save_frame,
+        self.save_button = tk.Button(
+            editor_frame,
             text="💾 Save Changes",
-            command=lambda: self.save_preset(preset_name),
+            command=lambda: self.save_preset(self._current_name),
             font=("Segoe UI", 10, "bold"),
             bg='#27ae60',
             fg='white',
             border=0,
             padx=20,
             pady=5
-        ).pack(side=tk.RIGHT)
+        )
+        self.save_button.grid(row=4, column=1, sticky=tk.E, pady=(20, 0))
+
+        # Stored preset field -> the editor variable bound to it. The variables
+        # live as long as the dialog; loading a preset only sets them.
+        self._field_vars = {
+            'printer_11x17_enabled': self.p1_enabled_var,
+            'printer_11x17_script': self.p1_script_var,
+            'printer_11x17_copies': self.p1_copies_var,
+            'printer_24x36_enabled': self.p2_enabled_var,
+            'printer_24x36_script': self.p2_script_var,
+            'printer_24x36_copies': self.p2_copies_var,
+            'folder_label_enabled': self.folder_enabled_var,
+            'folder_label_printer': self.folder_printer_var,
+        }
+
+    def _load_preset_into_editor(self, preset_name: str, preset: PrintPreset):
+        """Point the editor variables at a preset"""
+        self._current_name = preset_name
+        self._current_preset = preset
+
+        self.preset_name_var.set(preset_name)
+        for field_name, var in self._field_vars.items():
+            var.set(getattr(preset, field_name))
+
+        # grid_remove keeps the grid options, so grid() puts it back in place
+        if preset.is_default:
+            self.set_default_button.grid_remove()
+            self.default_label.grid()
+        else:
+            self.default_label.grid_remove()
+            self.set_default_button.grid()
+
+    def show_preset_editor(self, preset_name: str, preset: PrintPreset):
+        """Show preset editor"""
+        self._empty_label.pack_forget()
+        self._load_preset_into_editor(preset_name, preset)
+
+        if not self.editor_frame.winfo_manager():
+            self.editor_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
 
     def save_preset(self, old_name: str):
         """Save preset changes"""
+        if self._io_busy:
+            return
+
         new_name = self.preset_name_var.get().strip()
 
         if not new_name:
@@ -339,53 +471,66 @@ class PresetManagerDialog(tk.Toplevel):
             return
 
         # Check if renaming to existing name
-        if new_name != old_name and new_name in self.preset_manager.get_preset_names():
+        if new_name != old_name and new_name in self._preset_index:
             messagebox.showwarning("Name Exists", f"A preset named '{new_name}' already exists.")
             return
 
         # Build preset data
-        preset_data = {
-            'printer_11x17_enabled': self.p1_enabled_var.get(),
-            'printer_11x17_script': self.p1_script_var.get(),
-            'printer_11x17_copies': self.p1_copies_var.get(),
-            'printer_24x36_enabled': self.p2_enabled_var.get(),
-            'printer_24x36_script': self.p2_script_var.get(),
-            'printer_24x36_copies': self.p2_copies_var.get(),
-            'folder_label_enabled': self.folder_enabled_var.get(),
-            'folder_label_printer': self.folder_printer_var.get(),
-            'is_default': self.preset_manager.get_preset(old_name).is_default if old_name in self.preset_manager.get_preset_names() else False
-        }
+        preset_data = {field_name: var.get() for field_name, var in self._field_vars.items()}
+        preset_data['is_default'] = (
+            self._current_preset.is_default if self._current_preset is not None else False
+        )
 
-        # If renaming, delete old preset
-        if new_name != old_name:
-            self.preset_manager.delete_preset(old_name)
+        def work() -> bool:
+            # If renaming, delete old preset
+            if new_name != old_name:
+                self.preset_manager.delete_preset(old_name)
 
-        # Save preset
-        success = self.preset_manager.add_preset(new_name, preset_data)
+            # Save preset
+            return self.preset_manager.add_preset(new_name, preset_data)
 
-        if success:
-            messagebox.showinfo("Saved", f"Preset '{new_name}' saved successfully!")
-            self.refresh_preset_list()
-        else:
-            messagebox.showerror("Error", "Failed to save preset.")
+        def on_done(success: bool):
+            if success:
+                messagebox.showinfo("Saved", f"Preset '{new_name}' saved successfully!")
+                if new_name == old_name and old_name in self._preset_index:
+                    # Same name and default flag, so the row text is unchanged.
+                    # Just swap in the new preset object and keep the user's
+                    # selection and scroll position.
+                    preset = self.preset_manager.get_preset(new_name)
+                    self._preset_cache[self._preset_index[new_name]] = (new_name, preset)
+                    if self._current_name == new_name:
+                        self._current_preset = preset
+                else:
+                    self.refresh_preset_list()
+            else:
+                messagebox.showerror("Error", "Failed to save preset.")
+
+        self._run_in_background(work, on_done)
 
     def set_default(self, preset_name: str):
         """Set preset as default"""
-        success = self.preset_manager.set_default_preset(preset_name)
+        if self._io_busy:
+            return
 
-        if success:
-            messagebox.showinfo("Default Set", f"'{preset_name}' is now the default preset.")
-            self.refresh_preset_list()
-        else:
-            messagebox.showerror("Error", "Failed to set default preset.")
+        def on_done(success: bool):
+            if success:
+                messagebox.showinfo("Default Set", f"'{preset_name}' is now the default preset.")
+                self.refresh_preset_list()
+            else:
+                messagebox.showerror("Error", "Failed to set default preset.")
+
+        self._run_in_background(lambda: self.preset_manager.set_default_preset(preset_name), on_done)
 
     def new_preset(self):
         """Create a new preset"""
+        if self._io_busy:
+            return
+
         name = tk.simpledialog.askstring("New Preset", "Enter preset name:", parent=self)
 
         if name:
             name = name.strip()
-            if name in self.preset_manager.get_preset_names():
+            if name in self._preset_index:
                 messagebox.showwarning("Name Exists", f"A preset named '{name}' already exists.")
                 return
 
@@ -402,28 +547,30 @@ class PresetManagerDialog(tk.Toplevel):
                 'is_default': False
             }
 
-            success = self.preset_manager.add_preset(name, preset_data)
+            def on_done(success: bool):
+                if success:
+                    self.refresh_preset_list()
+                    # Select the new preset
+                    index = self._preset_index[name]
+                    self.preset_listbox.selection_clear(0, tk.END)
+                    self.preset_listbox.selection_set(index)
+                    self.on_preset_selected(None)
+                else:
+                    messagebox.showerror("Error", "Failed to create preset.")
 
-            if success:
-                self.refresh_preset_list()
-                # Select the new preset
-                preset_names = self.preset_manager.get_preset_names()
-                index = preset_names.index(name)
-                self.preset_listbox.selection_clear(0, tk.END)
-                self.preset_listbox.selection_set(index)
-                self.on_preset_selected(None)
-            else:
-                messagebox.showerror("Error", "Failed to create preset.")
+            self._run_in_background(lambda: self.preset_manager.add_preset(name, preset_data), on_done)
 
     def delete_preset(self):
         """Delete selected preset"""
+        if self._io_busy:
+            return
+
         selection = self.preset_listbox.curselection()
         if not selection:
             messagebox.showwarning("No Selection", "Please select a preset to delete.")
             return
 
-        index = selection[0]
-        preset_name = list(self.preset_manager.get_all_presets().keys())[index]
+        preset_name = self._ordered_names[selection[0]]
 
         result = messagebox.askyesno(
             "Delete Preset",
@@ -431,13 +578,14 @@ class PresetManagerDialog(tk.Toplevel):
         )
 
         if result:
-            success = self.preset_manager.delete_preset(preset_name)
-
-            if success:
-                self.refresh_preset_list()
-                self.show_empty_editor()
-            else:
-                messagebox.showerror("Error", "Failed to delete preset.\n(Cannot delete the last preset)")
+            def on_done(success: bool):
+                if success:
+                    self.refresh_preset_list()
+                    self.show_empty_editor()
+                else:
+                    messagebox.showerror("Error", "Failed to delete preset.\n(Cannot delete the last preset)")
+
+            self._run_in_background(lambda: self.preset_manager.delete_preset(preset_name), on_done)
 
 
 # Import at the top if needed for askstring
@@ -5,18 +5,28 @@ Guides IT/admins through printer setup for network deployment
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
-from typing import Dict, List, Optional
+from tkinter import ttk, messagebox
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
 from pathlib import Path
-from network_printer_manager import NetworkPrinterManager, PrinterDefinition, NetworkPrinterConfig
 from error_logger import log_info, log_error, log_success
 from datetime import datetime
 
+# network_printer_manager and tkinter.filedialog are imported where they are
+# used, so importing this module stays cheap when the wizard is never shown
+if TYPE_CHECKING:
+    from network_printer_manager import NetworkPrinterManager
+
+# Printer discovery runs here so the wizard's event loop never waits on the spooler
+_DISCOVERY_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+
+# How often the Tk thread checks whether discovery has finished
+DISCOVERY_POLL_MS = 50
 
 class PrinterSetupWizard:
     """Setup wizard for configuring network printers"""
 
-    def __init__(self, parent=None, network_manager: NetworkPrinterManager = None):
+    def __init__(self, parent=None, network_manager: 'NetworkPrinterManager' = None):
         """
         Initialize the setup wizard
 
@@ -25,16 +35,34 @@ class PrinterSetupWizard:
             network_manager: NetworkPrinterManager instance (optional, creates new if None)
         """
         self.parent = parent
-        self.network_manager = network_manager or NetworkPrinterManager()
+        if network_manager is None:
+            from network_printer_manager import NetworkPrinterManager
+            network_manager = NetworkPrinterManager()
+        self.network_manager = network_manager
         self.window = None
         self.current_step = 0
 
+        # Called once when the wizard closes: the manager after a save, None otherwise
+        self._on_complete: Optional[Callable[[Optional['NetworkPrinterManager']], None]] = None
+
         # Configuration being built
         self.selected_11x17 = []
         self.selected_24x36 = []
         self.selected_folder_label = []
         self.template_path = ""
 
+        # Pending background discovery; Next stays disabled until it finishes
+        self._discovery_future = None
+
+        # Step content frames by step index, built on first visit
+        self._step_frames: Dict[int, tk.Frame] = {}
+
+        # Selection step listboxes by step index, with the attribute they fill
+        self._step_listboxes: Dict[int, Tuple[tk.Listbox, str]] = {}
+
+        # categorize_printers() result, reused by every step until discovery re-runs
+        self._categories: Optional[Dict[str, List[str]]] = None
+
         # Wizard steps
         self.steps = [
             ("Welcome", self.create_welcome_step),
@@ -46,17 +74,33 @@ class PrinterSetupWizard:
             ("Review & Save", self.create_review_step)
         ]
 
-    def show(self):
-        """Show the setup wizard"""
+    def show(self, on_complete: Optional[Callable[[Optional['NetworkPrinterManager']], None]] = None):
+        """
+        Show the setup wizard
+
+        Returns immediately; the caller's event loop keeps running the wizard.
+
+        Args:
+            on_complete: Called when the wizard closes, with the network manager
+                after a successful save or None if the wizard was cancelled
+        """
+        self._on_complete = on_complete
         self.window = tk.Toplevel(self.parent) if self.parent else tk.Tk()
         self.window.title("Network Printer Setup Wizard")
-        self.window.geometry("800x600")
+
+        # Center window; the size is fixed, so no layout pass is needed first
+        screen_width = self.window.winfo_screenwidth()
+        screen_height = self.window.winfo_screenheight()
+        self.window.geometry(f"800x600+{(screen_width - 800) // 2}+{(screen_height - 600) // 2}")
         self.window.configure(bg='#ecf0f1')
+        self.window.protocol("WM_DELETE_WINDOW", lambda: self._close(None))
 
         if self.parent:
             self.window.transient(self.parent)
             self.window.grab_set()
 
+        self._configure_styles()
+
         # Create main layout
         self.create_header()
         self.create_content_area()
@@ -65,46 +109,77 @@ class PrinterSetupWizard:
         # Show first step
         self.show_step(0)
 
-        # Center window
-        self.window.update_idletasks()
-        x = (self.window.winfo_screenwidth() // 2) - (800 // 2)
-        y = (self.window.winfo_screenheight() // 2) - (600 // 2)
-        self.window.geometry(f"800x600+{x}+{y}")
-
-        self.window.wait_window()
+    def _configure_styles(self):
+        """Register the wizard's ttk styles once, instead of styling each widget"""
+        style = ttk.Style(self.window)
+
+        # Frames
+        style.configure('Wizard.TFrame', background='#ecf0f1')
+        style.configure('Wizard.Header.TFrame', background='#2c3e50')
+        style.configure('Wizard.Card.TFrame', background='#ffffff')
+        style.configure('Wizard.Border.TFrame', background='#ffffff', relief='solid', borderwidth=1)
+        style.configure('Wizard.Info.TFrame', background='#fff8e1', relief='solid', borderwidth=1)
+
+        # Header labels
+        style.configure('Wizard.Title.TLabel', font=("Segoe UI", 20, "bold"),
+                        background='#2c3e50', foreground='white')
+        style.configure('Wizard.Step.TLabel', font=("Segoe UI", 10),
+                        background='#2c3e50', foreground='#ecf0f1')
+
+        # Step body labels
+        style.configure('Wizard.Welcome.TLabel', font=("Segoe UI", 16, "bold"),
+                        background='#ecf0f1', foreground='#2c3e50')
+        style.configure('Wizard.Heading.TLabel', font=("Segoe UI", 14, "bold"),
+                        background='#ecf0f1', foreground='#2c3e50')
+        style.configure('Wizard.Body.TLabel', font=("Segoe UI", 11),
+                        background='#ecf0f1', foreground='#34495e')
+        style.configure('Wizard.Subtitle.TLabel', font=("Segoe UI", 10),
+                        background='#ecf0f1', foreground='#7f8c8d')
+        style.configure('Wizard.Warning.TLabel', font=("Segoe UI", 11),
+                        background='#ecf0f1', foreground='#e67e22')
+
+        # Labels inside white cards
+        style.configure('Wizard.Card.TLabel', font=("Segoe UI", 10),
+                        background='#ffffff', foreground='#2c3e50')
+        style.configure('Wizard.CardHeading.TLabel', font=("Segoe UI", 11, "bold"),
+                        background='#ffffff', foreground='#2c3e50')
+        style.configure('Wizard.CardMuted.TLabel', font=("Segoe UI", 11),
+                        background='#ffffff', foreground='#7f8c8d')
+
+        # Labels inside the template info box
+        style.configure('Wizard.InfoHeading.TLabel', font=("Segoe UI", 10, "bold"),
+                        background='#fff8e1', foreground='#f39c12')
+        style.configure('Wizard.Info.TLabel', font=("Segoe UI", 9),
+                        background='#fff8e1', foreground='#e67e22')
 
     def create_header(self):
         """Create wizard header"""
-        self.header_frame = tk.Frame(self.window, bg='#2c3e50', height=80)
+        self.header_frame = ttk.Frame(self.window, style='Wizard.Header.TFrame', height=80)
         self.header_frame.pack(fill=tk.X)
         self.header_frame.pack_propagate(False)
 
-        self.title_label = tk.Label(
+        self.title_label = ttk.Label(
             self.header_frame,
             text="Network Printer Setup",
-            font=("Segoe UI", 20, "bold"),
-            bg='#2c3e50',
-            fg='white'
+            style='Wizard.Title.TLabel'
         )
         self.title_label.pack(pady=20)
 
-        self.step_label = tk.Label(
+        self.step_label = ttk.Label(
             self.header_frame,
             text="Step 1 of 7",
-            font=("Segoe UI", 10),
-            bg='#2c3e50',
-            fg='#ecf0f1'
+            style='Wizard.Step.TLabel'
         )
         self.step_label.pack()
 
     def create_content_area(self):
         """Create main content area"""
-        self.content_frame = tk.Frame(self.window, bg='#ecf0f1')
+        self.content_frame = ttk.Frame(self.window, style='Wizard.TFrame')
         self.content_frame.pack(fill=tk.BOTH, expand=True, padx=30, pady=30)
 
     def create_navigation(self):
         """Create navigation buttons"""
-        self.nav_frame = tk.Frame(self.window, bg='#ecf0f1', height=60)
+        self.nav_frame = ttk.Frame(self.window, style='Wizard.TFrame', height=60)
         self.nav_frame.pack(fill=tk.X, padx=30, pady=(0, 20))
         self.nav_frame.pack_propagate(False)
 
@@ -153,6 +228,12 @@ class PrinterSetupWizard:
         if step_index < 0 or step_index >= len(self.steps):
             return
 
+        # Hide the step being left; its widgets are kept for when the user returns
+        self._commit_selection(self.current_step)
+        previous_frame = self._step_frames.get(self.current_step)
+        if previous_frame is not None:
+            previous_frame.pack_forget()
+
         self.current_step = step_index
 
         # Update header
@@ -160,21 +241,37 @@ class PrinterSetupWizard:
         self.title_label.config(text=step_name)
         self.step_label.config(text=f"Step {step_index + 1} of {len(self.steps)}")
 
-        # Clear content area
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
+        # Build each step once; the review step summarizes the other steps, so it
+        # is rebuilt on every visit
+        frame = self._step_frames.get(step_index)
+        if frame is None or step_func == self.create_review_step:
+            if frame is not None:
+                frame.destroy()
+            frame = ttk.Frame(self.content_frame, style='Wizard.TFrame')
+            self._step_frames[step_index] = frame
+            step_func(frame)
 
-        # Show step content
-        step_func()
+        frame.pack(fill=tk.BOTH, expand=True)
 
         # Update navigation buttons
         self.back_btn.config(state=tk.NORMAL if step_index > 0 else tk.DISABLED)
+        discovering = self._discovery_future is not None and step_func == self.create_discovery_step
+        self.next_btn.config(state=tk.DISABLED if discovering else tk.NORMAL)
 
         if step_index == len(self.steps) - 1:
             self.next_btn.config(text="Finish & Save", bg='#2980b9')
         else:
             self.next_btn.config(text="Next →", bg='#27ae60')
 
+    def _commit_selection(self, step_index: int):
+        """Copy a selection step's listbox choice into its wizard attribute"""
+        entry = self._step_listboxes.get(step_index)
+        if entry is None:
+            return
+
+        listbox, attr_name = entry
+        setattr(self, attr_name, [listbox.get(i) for i in listbox.curselection()])
+
     def go_back(self):
         """Go to previous step"""
         if self.current_step > 0:
@@ -222,47 +319,63 @@ class PrinterSetupWizard:
             parent=self.window
         )
         if result:
-            self.window.destroy()
+            self._close(None)
+
+    def _close(self, result: Optional['NetworkPrinterManager']):
+        """Close the wizard and report the outcome to the on_complete callback"""
+        self.window.destroy()
+
+        on_complete, self._on_complete = self._on_complete, None
+        if on_complete:
+            on_complete(result)
 
     def finish(self):
         """Complete wizard and save configuration"""
+        from network_printer_manager import PrinterDefinition, NetworkPrinterConfig
+
         try:
+            # One timestamp for the whole save
+            now_iso = datetime.now().isoformat()
+
             # Create printer definitions
-            printers_11x17 = []
-            for i, printer_name in enumerate(self.selected_11x17):
-                printers_11x17.append(PrinterDefinition(
+            printers_11x17 = [
+                PrinterDefinition(
                     display_name=f"11x17 Printer {i+1}",
                     printer_name=printer_name,
                     printer_type="11x17",
                     is_default=(i == 0),
                     is_available=True,
                     description="Configured via setup wizard",
-                    last_verified=datetime.now().isoformat()
-                ))
+                    last_verified=now_iso
+                )
+                for i, printer_name in enumerate(self.selected_11x17)
+            ]
 
-            printers_24x36 = []
-            for i, printer_name in enumerate(self.selected_24x36):
-                printers_24x36.append(PrinterDefinition(
+            printers_24x36 = [
+                PrinterDefinition(
                     display_name=f"24x36 Plotter {i+1}",
                     printer_name=printer_name,
                     printer_type="24x36",
                     is_default=(i == 0),
                     is_available=True,
                     description="Configured via setup wizard",
-                    last_verified=datetime.now().isoformat()
-                ))
+                    last_verified=now_iso
+                )
+                for i, printer_name in enumerate(self.selected_24x36)
+            ]
 
-            printers_folder_label = []
-            for i, printer_name in enumerate(self.selected_folder_label):
-                printers_folder_label.append(PrinterDefinition(
+            printers_folder_label = [
+                PrinterDefinition(
                     display_name=f"Label Printer {i+1}",
                     printer_name=printer_name,
                     printer_type="folder_label",
                     is_default=(i == 0),
                     is_available=True,
                     description="Configured via setup wizard",
-                    last_verified=datetime.now().isoformat()
-                ))
+                    last_verified=now_iso
+                )
+                for i, printer_name in enumerate(self.selected_folder_label)
+            ]
 
             # Create configuration
             self.network_manager.config = NetworkPrinterConfig(
@@ -272,7 +385,7 @@ class PrinterSetupWizard:
                 template_path=self.template_path,
                 auto_discover_on_startup=True,
                 version="1.0",
-                last_updated=datetime.now().isoformat()
+                last_updated=now_iso
             )
 
             # Save configuration
@@ -294,7 +407,7 @@ class PrinterSetupWizard:
                     parent=self.window
                 )
 
-                self.window.destroy()
+                self._close(self.network_manager)
             else:
                 messagebox.showerror(
                     "Save Failed",
@@ -312,35 +425,23 @@ class PrinterSetupWizard:
 
     # ===== STEP CREATION METHODS =====
 
-    def create_welcome_step(self):
+    def create_welcome_step(self, parent: tk.Frame):
         """Welcome step"""
-        tk.Label(
-            self.content_frame,
+        ttk.Label(
+            parent,
             text="Welcome to Network Printer Setup",
-            font=("Segoe UI", 16, "bold"),
-            bg='#ecf0f1',
-            fg='#2c3e50'
+            style='Wizard.Welcome.TLabel'
         ).pack(pady=(20, 10))
 
-        tk.Label(
-            self.content_frame,
+        ttk.Label(
+            parent,
             text="This wizard will help you configure printers for network deployment.",
-            font=("Segoe UI", 11),
-            bg='#ecf0f1',
-            fg='#34495e'
+            style='Wizard.Body.TLabel'
         ).pack(pady=(0, 30))
 
-        info_frame = tk.Frame(self.content_frame, bg='#ffffff', relief='solid', borderwidth=1)
+        info_frame = ttk.Frame(parent, style='Wizard.Border.TFrame')
         info_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
 
-        tk.Label(
-            info_frame,
-            text="What this wizard will do:",
-            font=("Segoe UI", 12, "bold"),
-            bg='#ffffff',
-            fg='#2c3e50'
-        ).pack(anchor=tk.W, padx=20, pady=(20, 10))
-
         steps_text = [
             "1. Discover all available printers on your network",
             "2. Configure 11×17 (standard) printers",
@@ -350,288 +451,197 @@ class PrinterSetupWizard:
             "6. Save centralized configuration for all users"
         ]
 
+        # One read-only Text widget instead of a Label per line
+        text = self._make_text(info_frame)
+        text.insert(tk.END, "What this wizard will do:\n", 'heading')
         for step in steps_text:
-            tk.Label(
-                info_frame,
-                text=step,
-                font=("Segoe UI", 10),
-                bg='#ffffff',
-                fg='#34495e',
-                justify=tk.LEFT
-            ).pack(anchor=tk.W, padx=40, pady=5)
-
-        tk.Label(
-            info_frame,
-            text="⚠️ Administrator/IT privileges may be required",
-            font=("Segoe UI", 9, "italic"),
-            bg='#ffffff',
-            fg='#e67e22'
-        ).pack(anchor=tk.W, padx=20, pady=(20, 20))
+            text.insert(tk.END, f"{step}\n", 'step')
+        text.insert(tk.END, "\n⚠️ Administrator/IT privileges may be required", 'note')
+        text.configure(state=tk.DISABLED)
+        text.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
 
-    def create_discovery_step(self):
+    def create_discovery_step(self, parent: tk.Frame):
         """Printer discovery step"""
-        tk.Label(
-            self.content_frame,
+        ttk.Label(
+            parent,
             text="Discovering Network Printers...",
-            font=("Segoe UI", 14, "bold"),
-            bg='#ecf0f1',
-            fg='#2c3e50'
+            style='Wizard.Heading.TLabel'
         ).pack(pady=(10, 20))
 
-        # Refresh printer list
-        self.network_manager.discover_printers()
-        categories = self.network_manager.categorize_printers()
-
         # Display results
-        results_frame = tk.Frame(self.content_frame, bg='#ffffff', relief='solid', borderwidth=1)
+        results_frame = ttk.Frame(parent, style='Wizard.Border.TFrame')
         results_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
 
-        canvas = tk.Canvas(results_frame, bg='#ffffff', highlightthickness=0)
-        scrollbar = ttk.Scrollbar(results_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg='#ffffff')
-
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+        # Scanning indicator, replaced by the results once discovery finishes
+        scanning_label = ttk.Label(
+            results_frame,
+            text="Scanning for printers...",
+            style='Wizard.CardMuted.TLabel'
         )
+        scanning_label.pack(pady=(40, 10))
 
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        progress = ttk.Progressbar(results_frame, mode='indeterminate', length=300)
+        progress.pack()
+        progress.start(50)
 
-        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        # Refresh printer list off the Tk thread; enumeration can take seconds
+        # per unreachable host
+        self._discovery_future = _DISCOVERY_EXECUTOR.submit(self.network_manager.discover_printers)
+        self._poll_discovery(self._discovery_future, results_frame, (scanning_label, progress))
 
-        # Summary
-        tk.Label(
-            scrollable_frame,
-            text=f"✓ Found {len(self.network_manager.available_printers)} printer(s)",
-            font=("Segoe UI", 12, "bold"),
-            bg='#ffffff',
-            fg='#27ae60'
-        ).pack(anchor=tk.W, padx=20, pady=(20, 10))
-
-        # Categories
-        for category, printers in categories.items():
-            if printers:
-                category_names = {
-                    'large_format': '24×36 Large Format Printers',
-                    'standard': '11×17 Standard Printers',
-                    'label': 'Label Printers',
-                    'other': 'Other Printers'
-                }
-
-                tk.Label(
-                    scrollable_frame,
-                    text=f"{category_names[category]} ({len(printers)}):",
-                    font=("Segoe UI", 11, "bold"),
-                    bg='#ffffff',
-                    fg='#2c3e50'
-                ).pack(anchor=tk.W, padx=20, pady=(15, 5))
-
-                for printer in printers:
-                    tk.Label(
-                        scrollable_frame,
-                        text=f"  • {printer}",
-                        font=("Segoe UI", 9),
-                        bg='#ffffff',
-                        fg='#34495e'
-                    ).pack(anchor=tk.W, padx=40, pady=2)
-
-    def create_11x17_step(self):
-        """Configure 11x17 printers step"""
-        tk.Label(
-            self.content_frame,
-            text="Select 11×17 (Standard) Printers",
-            font=("Segoe UI", 14, "bold"),
-            bg='#ecf0f1',
-            fg='#2c3e50'
-        ).pack(pady=(10, 5))
-
-        tk.Label(
-            self.content_frame,
-            text="These printers will be used for standard-size plots (11×17 / Tabloid)",
-            font=("Segoe UI", 10),
-            bg='#ecf0f1',
-            fg='#7f8c8d'
-        ).pack(pady=(0, 20))
-
-        # Get available printers
-        categories = self.network_manager.categorize_printers()
-        available = categories['standard'] + categories['other']
-
-        if not available:
-            tk.Label(
-                self.content_frame,
-                text="⚠️ No printers detected. You can configure this later.",
-                font=("Segoe UI", 11),
-                bg='#ecf0f1',
-                fg='#e67e22'
-            ).pack(pady=50)
+    def _poll_discovery(self, future, results_frame, placeholders):
+        """Wait for background discovery without blocking the event loop"""
+        # The wizard may have been cancelled or finished while discovery ran
+        if not self.window.winfo_exists():
             return
 
-        # Printer selection listbox
-        list_frame = tk.Frame(self.content_frame, bg='#ffffff', relief='solid', borderwidth=1)
-        list_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
-
-        tk.Label(
-            list_frame,
-            text="Select one or more printers (first selected will be default):",
-            font=("Segoe UI", 10),
-            bg='#ffffff',
-            fg='#2c3e50'
-        ).pack(anchor=tk.W, padx=15, pady=(15, 10))
+        if not future.done():
+            self.window.after(DISCOVERY_POLL_MS, self._poll_discovery, future, results_frame, placeholders)
+            return
 
-        listbox_frame = tk.Frame(list_frame, bg='#ffffff')
-        listbox_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=(0, 15))
+        if future is self._discovery_future:
+            self._discovery_future = None
+            self.next_btn.config(state=tk.NORMAL)
 
-        scrollbar = ttk.Scrollbar(listbox_frame, orient=tk.VERTICAL)
-        listbox = tk.Listbox(
-            listbox_frame,
-            selectmode=tk.MULTIPLE,
-            yscrollcommand=scrollbar.set,
-            font=("Segoe UI", 10),
-            height=10
-        )
-        scrollbar.config(command=listbox.yview)
+        try:
+            future.result()
+        except Exception as e:
+            log_error("setup_wizard_discovery", e)
 
-        listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        # Fresh printer list - categorize it once for all the following steps
+        self._categories = self.network_manager.categorize_printers()
 
-        # Populate listbox
-        for printer in available:
-            listbox.insert(tk.END, printer)
+        # The user may have left the step while discovery was running
+        if not results_frame.winfo_exists():
+            return
 
-        # Pre-select if already configured
-        for i, printer in enumerate(available):
-            if printer in self.selected_11x17:
-                listbox.selection_set(i)
+        for widget in placeholders:
+            widget.destroy()
 
-        # Save selection when changed
-        def save_selection(event=None):
-            self.selected_11x17 = [listbox.get(i) for i in listbox.curselection()]
+        self._populate_discovery(results_frame)
 
-        listbox.bind('<<ListboxSelect>>', save_selection)
+    def _get_categories(self) -> Dict[str, List[str]]:
+        """Categorized printers, computed once per discovery"""
+        if self._categories is None:
+            self._categories = self.network_manager.categorize_printers()
+        return self._categories
 
-    def create_24x36_step(self):
-        """Configure 24x36 printers step"""
-        tk.Label(
-            self.content_frame,
-            text="Select 24×36 (Large Format) Printers",
-            font=("Segoe UI", 14, "bold"),
-            bg='#ecf0f1',
-            fg='#2c3e50'
-        ).pack(pady=(10, 5))
+    def _populate_discovery(self, results_frame):
+        """Show discovered printers grouped by category"""
+        categories = self._get_categories()
 
-        tk.Label(
-            self.content_frame,
-            text="These printers will be used for large format plots (plotters, wide format)",
-            font=("Segoe UI", 10),
-            bg='#ecf0f1',
-            fg='#7f8c8d'
-        ).pack(pady=(0, 20))
+        category_names = {
+            'large_format': '24×36 Large Format Printers',
+            'standard': '11×17 Standard Printers',
+            'label': 'Label Printers',
+            'other': 'Other Printers'
+        }
 
-        # Get available printers
-        categories = self.network_manager.categorize_printers()
-        available = categories['large_format'] + categories['other']
+        # Long UNC printer names scroll sideways instead of wrapping
+        text = self._make_text(results_frame, wrap=tk.NONE)
+        text.tag_configure('category', font=("Segoe UI", 11, "bold"), foreground='#2c3e50',
+                           spacing1=12, spacing3=4)
+        text.tag_configure('printer', font=("Segoe UI", 9), lmargin1=20, spacing1=2)
 
-        if not available:
-            tk.Label(
-                self.content_frame,
-                text="⚠️ No large format printers detected. You can configure this later.",
-                font=("Segoe UI", 11),
-                bg='#ecf0f1',
-                fg='#e67e22'
-            ).pack(pady=50)
-            return
+        y_scrollbar = ttk.Scrollbar(results_frame, orient="vertical", command=text.yview)
+        x_scrollbar = ttk.Scrollbar(results_frame, orient="horizontal", command=text.xview)
+        text.configure(yscrollcommand=y_scrollbar.set, xscrollcommand=x_scrollbar.set)
 
-        # Printer selection listbox
-        list_frame = tk.Frame(self.content_frame, bg='#ffffff', relief='solid', borderwidth=1)
-        list_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
+        # Summary
+        text.insert(tk.END, f"✓ Found {len(self.network_manager.available_printers)} printer(s)\n", 'summary')
 
-        tk.Label(
-            list_frame,
-            text="Select one or more printers (first selected will be default):",
-            font=("Segoe UI", 10),
-            bg='#ffffff',
-            fg='#2c3e50'
-        ).pack(anchor=tk.W, padx=15, pady=(15, 10))
+        # Categories
+        for category, printers in categories.items():
+            if printers:
+                text.insert(tk.END, f"\n{category_names[category]} ({len(printers)}):\n", 'category')
+                text.insert(tk.END, "".join(f"  • {printer}\n" for printer in printers), 'printer')
 
-        listbox_frame = tk.Frame(list_frame, bg='#ffffff')
-        listbox_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=(0, 15))
+        text.configure(state=tk.DISABLED)
+        x_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
+        y_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(20, 0), pady=(20, 0))
 
-        scrollbar = ttk.Scrollbar(listbox_frame, orient=tk.VERTICAL)
-        listbox = tk.Listbox(
-            listbox_frame,
-            selectmode=tk.MULTIPLE,
-            yscrollcommand=scrollbar.set,
-            font=("Segoe UI", 10),
-            height=10
+    def create_11x17_step(self, parent: tk.Frame):
+        """Configure 11x17 printers step"""
+        self._build_selection_step(
+            parent,
+            title="Select 11×17 (Standard) Printers",
+            subtitle="These printers will be used for standard-size plots (11×17 / Tabloid)",
+            empty_text="⚠️ No printers detected. You can configure this later.",
+            category_keys=('standard', 'other'),
+            attr_name='selected_11x17'
         )
-        scrollbar.config(command=listbox.yview)
-
-        listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-
-        # Populate listbox
-        for printer in available:
-            listbox.insert(tk.END, printer)
 
-        # Pre-select if already configured
-        for i, printer in enumerate(available):
-            if printer in self.selected_24x36:
-                listbox.selection_set(i)
+    def create_24x36_step(self, parent: tk.Frame):
+        """Configure 24x36 printers step"""
+        self._build_selection_step(
+            parent,
+            title="Select 24×36 (Large Format) Printers",
+            subtitle="These printers will be used for large format plots (plotters, wide format)",
+            empty_text="⚠️ No large format printers detected. You can configure this later.",
+            category_keys=('large_format', 'other'),
+            attr_name='selected_24x36'
+        )
 
-        # Save selection when changed
-        def save_selection(event=None):
-            self.selected_24x36 = [listbox.get(i) for i in listbox.curselection()]
+    def create_label_step(self, parent: tk.Frame):
+        """Configure label printers step"""
+        self._build_selection_step(
+            parent,
+            title="Select Folder Label Printer",
+            subtitle="This printer will be used for printing folder labels",
+            empty_text="⚠️ No printers detected. You can configure this later.",
+            category_keys=('label', 'standard', 'other'),
+            attr_name='selected_folder_label'
+        )
 
-        listbox.bind('<<ListboxSelect>>', save_selection)
+    def _build_selection_step(self, parent: tk.Frame, title: str, subtitle: str, empty_text: str,
+                              category_keys: Tuple[str, ...], attr_name: str):
+        """
+        Build a printer selection step
 
-    def create_label_step(self):
-        """Configure label printers step"""
-        tk.Label(
-            self.content_frame,
-            text="Select Folder Label Printer",
-            font=("Segoe UI", 14, "bold"),
-            bg='#ecf0f1',
-            fg='#2c3e50'
+        Args:
+            parent: Step frame to build into
+            title: Step heading
+            subtitle: Line under the heading
+            empty_text: Shown instead of the list when no printers qualify
+            category_keys: Printer categories offered, in listbox order
+            attr_name: Wizard attribute that receives the selected printer names
+        """
+        ttk.Label(
+            parent,
+            text=title,
+            style='Wizard.Heading.TLabel'
         ).pack(pady=(10, 5))
 
-        tk.Label(
-            self.content_frame,
-            text="This printer will be used for printing folder labels",
-            font=("Segoe UI", 10),
-            bg='#ecf0f1',
-            fg='#7f8c8d'
+        ttk.Label(
+            parent,
+            text=subtitle,
+            style='Wizard.Subtitle.TLabel'
         ).pack(pady=(0, 20))
 
         # Get available printers
-        categories = self.network_manager.categorize_printers()
-        available = categories['label'] + categories['standard'] + categories['other']
+        categories = self._get_categories()
+        available = [printer for key in category_keys for printer in categories[key]]
 
         if not available:
-            tk.Label(
-                self.content_frame,
-                text="⚠️ No printers detected. You can configure this later.",
-                font=("Segoe UI", 11),
-                bg='#ecf0f1',
-                fg='#e67e22'
+            ttk.Label(
+                parent,
+                text=empty_text,
+                style='Wizard.Warning.TLabel'
             ).pack(pady=50)
             return
 
         # Printer selection listbox
-        list_frame = tk.Frame(self.content_frame, bg='#ffffff', relief='solid', borderwidth=1)
+        list_frame = ttk.Frame(parent, style='Wizard.Border.TFrame')
         list_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
 
-        tk.Label(
+        ttk.Label(
             list_frame,
             text="Select one or more printers (first selected will be default):",
-            font=("Segoe UI", 10),
-            bg='#ffffff',
-            fg='#2c3e50'
+            style='Wizard.Card.TLabel'
         ).pack(anchor=tk.W, padx=15, pady=(15, 10))
 
-        listbox_frame = tk.Frame(list_frame, bg='#ffffff')
+        listbox_frame = ttk.Frame(list_frame, style='Wizard.Card.TFrame')
         listbox_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=(0, 15))
 
         scrollbar = ttk.Scrollbar(listbox_frame, orient=tk.VERTICAL)
@@ -647,52 +657,43 @@ class PrinterSetupWizard:
         listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-        # Populate listbox
-        for printer in available:
-            listbox.insert(tk.END, printer)
+        # Populate listbox in one Tcl call
+        listbox.insert(tk.END, *available)
 
         # Pre-select if already configured
+        selected = set(getattr(self, attr_name))
         for i, printer in enumerate(available):
-            if printer in self.selected_folder_label:
+            if printer in selected:
                 listbox.selection_set(i)
 
-        # Save selection when changed
-        def save_selection(event=None):
-            self.selected_folder_label = [listbox.get(i) for i in listbox.curselection()]
-
-        listbox.bind('<<ListboxSelect>>', save_selection)
+        # The selection is read once when the user leaves the step, not on every click
+        self._step_listboxes[self.current_step] = (listbox, attr_name)
 
-    def create_template_step(self):
+    def create_template_step(self, parent: tk.Frame):
         """Template path configuration step"""
-        tk.Label(
-            self.content_frame,
+        ttk.Label(
+            parent,
             text="Folder Label Template",
-            font=("Segoe UI", 14, "bold"),
-            bg='#ecf0f1',
-            fg='#2c3e50'
+            style='Wizard.Heading.TLabel'
         ).pack(pady=(10, 5))
 
-        tk.Label(
-            self.content_frame,
+        ttk.Label(
+            parent,
             text="Select the Word template file used for folder labels",
-            font=("Segoe UI", 10),
-            bg='#ecf0f1',
-            fg='#7f8c8d'
+            style='Wizard.Subtitle.TLabel'
         ).pack(pady=(0, 20))
 
         # Template selection frame
-        template_frame = tk.Frame(self.content_frame, bg='#ffffff', relief='solid', borderwidth=1)
+        template_frame = ttk.Frame(parent, style='Wizard.Border.TFrame')
         template_frame.pack(fill=tk.X, padx=20, pady=10)
 
-        tk.Label(
+        ttk.Label(
             template_frame,
             text="Template File:",
-            font=("Segoe UI", 11, "bold"),
-            bg='#ffffff',
-            fg='#2c3e50'
+            style='Wizard.CardHeading.TLabel'
         ).pack(anchor=tk.W, padx=15, pady=(15, 10))
 
-        path_frame = tk.Frame(template_frame, bg='#ffffff')
+        path_frame = ttk.Frame(template_frame, style='Wizard.Card.TFrame')
         path_frame.pack(fill=tk.X, padx=15, pady=(0, 15))
 
         self.template_entry = tk.Entry(
@@ -716,15 +717,13 @@ class PrinterSetupWizard:
         ).pack(side=tk.RIGHT)
 
         # Info text
-        info_frame = tk.Frame(self.content_frame, bg='#fff8e1', relief='solid', borderwidth=1)
+        info_frame = ttk.Frame(parent, style='Wizard.Info.TFrame')
         info_frame.pack(fill=tk.X, padx=20, pady=20)
 
-        tk.Label(
+        ttk.Label(
             info_frame,
             text="ℹ️  Template Requirements:",
-            font=("Segoe UI", 10, "bold"),
-            bg='#fff8e1',
-            fg='#f39c12'
+            style='Wizard.InfoHeading.TLabel'
         ).pack(anchor=tk.W, padx=15, pady=(10, 5))
 
         requirements = [
@@ -735,23 +734,22 @@ class PrinterSetupWizard:
         ]
 
         for req in requirements:
-            tk.Label(
+            ttk.Label(
                 info_frame,
                 text=req,
-                font=("Segoe UI", 9),
-                bg='#fff8e1',
-                fg='#e67e22',
-                justify=tk.LEFT
+                style='Wizard.Info.TLabel'
             ).pack(anchor=tk.W, padx=30, pady=2)
 
-        tk.Label(
+        ttk.Label(
             info_frame,
             text=" ",
-            bg='#fff8e1'
+            style='Wizard.Info.TLabel'
         ).pack(pady=5)
 
     def browse_template(self):
         """Browse for template file"""
+        from tkinter import filedialog
+
         filename = filedialog.askopenfilename(
             title="Select Folder Label Template",
             filetypes=[
@@ -766,34 +764,21 @@ class PrinterSetupWizard:
             self.template_entry.delete(0, tk.END)
             self.template_entry.insert(0, filename)
 
-    def create_review_step(self):
+    def create_review_step(self, parent: tk.Frame):
         """Review and confirmation step"""
-        tk.Label(
-            self.content_frame,
+        ttk.Label(
+            parent,
             text="Review Configuration",
-            font=("Segoe UI", 14, "bold"),
-            bg='#ecf0f1',
-            fg='#2c3e50'
+            style='Wizard.Heading.TLabel'
         ).pack(pady=(10, 20))
 
         # Review frame with scrollbar
-        review_frame = tk.Frame(self.content_frame, bg='#ffffff', relief='solid', borderwidth=1)
+        review_frame = ttk.Frame(parent, style='Wizard.Border.TFrame')
         review_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
 
-        canvas = tk.Canvas(review_frame, bg='#ffffff', highlightthickness=0)
-        scrollbar = ttk.Scrollbar(review_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg='#ffffff')
-
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-
-        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        text, scrollbar = self._make_text(review_frame), ttk.Scrollbar(review_frame, orient="vertical")
+        text.configure(yscrollcommand=scrollbar.set)
+        scrollbar.configure(command=text.yview)
 
         # Display configuration summary
         sections = [
@@ -803,76 +788,80 @@ class PrinterSetupWizard:
         ]
 
         for title, printers in sections:
-            tk.Label(
-                scrollable_frame,
-                text=f"{title}: ({len(printers)})",
-                font=("Segoe UI", 11, "bold"),
-                bg='#ffffff',
-                fg='#2c3e50'
-            ).pack(anchor=tk.W, padx=20, pady=(15, 5))
+            text.insert(tk.END, f"{title}: ({len(printers)})\n", 'heading')
 
             if printers:
-                for i, printer in enumerate(printers):
-                    default_text = " [DEFAULT]" if i == 0 else ""
-                    tk.Label(
-                        scrollable_frame,
-                        text=f"  • {printer}{default_text}",
-                        font=("Segoe UI", 9),
-                        bg='#ffffff',
-                        fg='#27ae60' if i == 0 else '#34495e'
-                    ).pack(anchor=tk.W, padx=40, pady=2)
+                text.insert(tk.END, f"  • {printers[0]} [DEFAULT]\n", 'default')
+                text.insert(tk.END, "".join(f"  • {printer}\n" for printer in printers[1:]), 'item')
             else:
-                tk.Label(
-                    scrollable_frame,
-                    text="  (None configured)",
-                    font=("Segoe UI", 9, "italic"),
-                    bg='#ffffff',
-                    fg='#95a5a6'
-                ).pack(anchor=tk.W, padx=40, pady=2)
+                text.insert(tk.END, "  (None configured)\n", 'muted')
 
         # Template path
-        tk.Label(
-            scrollable_frame,
-            text="Template Path:",
-            font=("Segoe UI", 11, "bold"),
-            bg='#ffffff',
-            fg='#2c3e50'
-        ).pack(anchor=tk.W, padx=20, pady=(15, 5))
-
-        tk.Label(
-            scrollable_frame,
-            text=f"  {self.template_path or '(Not configured)'}",
-            font=("Segoe UI", 9),
-            bg='#ffffff',
-            fg='#34495e',
-            wraplength=700
-        ).pack(anchor=tk.W, padx=40, pady=2)
+        text.insert(tk.END, "Template Path:\n", 'heading')
+        text.insert(tk.END, f"  {self.template_path or '(Not configured)'}\n", 'item')
 
         # Warning if nothing configured
         if not any([self.selected_11x17, self.selected_24x36, self.selected_folder_label]):
-            tk.Label(
-                scrollable_frame,
-                text="⚠️ Warning: No printers configured. You can add them later.",
-                font=("Segoe UI", 10),
-                bg='#ffffff',
-                fg='#e67e22'
-            ).pack(pady=20)
+            text.insert(tk.END, "\n⚠️ Warning: No printers configured. You can add them later.", 'warning')
 
+        text.configure(state=tk.DISABLED)
+        text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(20, 0), pady=(5, 20))
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-def run_setup_wizard(parent=None):
+    @staticmethod
+    def _make_text(parent: tk.Frame, wrap: str = tk.WORD) -> tk.Text:
+        """
+        Read-only style Text widget for multi-line step content
+
+        A single Text with tagged runs replaces a Label per line; callers
+        insert their content and then disable it.
+        """
+        text = tk.Text(
+            parent,
+            wrap=wrap,
+            bg='#ffffff',
+            relief='flat',
+            borderwidth=0,
+            highlightthickness=0,
+            cursor='arrow',
+            font=("Segoe UI", 10),
+            fg='#34495e'
+        )
+        text.tag_configure('heading', font=("Segoe UI", 11, "bold"), foreground='#2c3e50',
+                           spacing1=12, spacing3=4)
+        text.tag_configure('summary', font=("Segoe UI", 12, "bold"), foreground='#27ae60',
+                           spacing3=6)
+        text.tag_configure('step', lmargin1=20, lmargin2=20, spacing1=5)
+        text.tag_configure('item', font=("Segoe UI", 9), lmargin1=20, lmargin2=32, spacing1=2)
+        text.tag_configure('default', font=("Segoe UI", 9), foreground='#27ae60',
+                           lmargin1=20, lmargin2=32, spacing1=2)
+        text.tag_configure('muted', font=("Segoe UI", 9, "italic"), foreground='#95a5a6',
+                           lmargin1=20, spacing1=2)
+        text.tag_configure('note', font=("Segoe UI", 9, "italic"), foreground='#e67e22')
+        text.tag_configure('warning', foreground='#e67e22', spacing1=10)
+        return text
+
+
+def run_setup_wizard(parent=None, on_complete=None):
     """
     Run the printer setup wizard
 
+    Opens the wizard and returns without waiting for it to close.
+
     Args:
         parent: Parent window (optional)
+        on_complete: Called when the wizard closes, with the NetworkPrinterManager
+            after a successful save or None if the wizard was cancelled (optional)
 
     Returns:
-        NetworkPrinterManager with updated configuration
+        NetworkPrinterManager the wizard configures
     """
+    from network_printer_manager import NetworkPrinterManager
+
     network_manager = NetworkPrinterManager()
 
     wizard = PrinterSetupWizard(parent, network_manager)
-    wizard.show()
+    wizard.show(on_complete=on_complete)
 
     return network_manager
 
@@ -882,6 +871,8 @@ if __name__ == "__main__":
     root = tk.Tk()
     root.withdraw()
 
-    run_setup_wizard()
+    # Keep the process alive until the wizard closes
+    run_setup_wizard(on_complete=lambda manager: root.quit())
+    root.mainloop()
 
     root.destroy()
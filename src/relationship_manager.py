@@ -3,11 +3,21 @@
 Relationship Manager - Handles unique identifiers and PDF-CSV relationships
 """
 
-import uuid
-import json
 import logging
+from datetime import date
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
+from enhanced_database_v2 import new_relationship_id
+from json_compat import json_dumps, json_loads
+
+# Optional incremental JSON parser so large backups can be imported without loading the whole file
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Number of relationships stored per transaction during import
+IMPORT_BATCH_SIZE = 1000
 
 class RelationshipManager:
     def __init__(self, db_manager):
@@ -20,7 +30,7 @@ class RelationshipManager:
         """
         try:
             # Generate unique relationship ID
-            relationship_id = str(uuid.uuid4())
+            relationship_id = new_relationship_id()
 
             # Store relationship in database
             relationship_data = {
@@ -91,6 +101,39 @@ class RelationshipManager:
             logging.error(f"Failed to get relationship for order {order_number}: {e}")
             return None
 
+    def _relationships_by_order(self) -> Dict[str, Dict]:
+        """
+        Load every active relationship once, keyed by order number
+
+        Mirrors get_relationship_by_order: when an order has several active
+        relationships, the most recently created one wins.
+        """
+        by_order = {}
+        for rel in self.db_manager.get_all_relationships():
+            current = by_order.get(rel['order_number'])
+            if current is None or (rel.get('created_date') or '') >= (current.get('created_date') or ''):
+                by_order[rel['order_number']] = rel
+        return by_order
+
+    def _order_date(self, relationship: Dict) -> Optional[date]:
+        """
+        Required date of a relationship's order, or None if it has none
+
+        Uses the order_date parsed when the CSV row was stored. Relationships
+        without one (unparseable, or written by an older client) fall back to
+        parsing DateRequired here.
+        """
+        order_date = relationship.get('order_date')
+        if order_date is None:
+            order_date = self.db_manager.order_date_from_csv(relationship.get('csv_data', {}))
+            if order_date is None:
+                return None
+
+        try:
+            return date.fromisoformat(order_date)
+        except ValueError:
+            return None
+
     def get_relationship_by_id(self, relationship_id: str) -> Optional[Dict]:
         """Get relationship data by relationship ID"""
         try:
@@ -127,62 +170,102 @@ class RelationshipManager:
             logging.error(f"Failed to remove PDF from relationship {relationship_id}: {e}")
             return False
 
-    def get_orders_with_relationships(self) -> List[Dict]:
+    def get_orders_with_relationships(self, include_history: bool = False) -> List[Dict]:
         """
         Get all orders with their relationship status
         Combines CSV data with PDF status
+
+        PDF change history is only loaded with include_history; without it
+        attachment_method is None and pdf_change_count is 0.
         """
         try:
             relationships = self.db_manager.get_all_relationships()
 
-            orders_with_status = []
-            for rel in relationships:
-                csv_data = rel.get('csv_data', {})
-
-                # Determine attachment method from PDF change history
-                attachment_method = None
-                if rel.get('pdf_path') and rel.get('pdf_changes'):
-                    # Get the most recent attach action
-                    for change in reversed(rel.get('pdf_changes', [])):
-                        if change.get('action') in ['attach', 'replace']:
-                            reason = change.get('reason', '')
-                            if reason == 'automatic_matching':
-                                attachment_method = 'automatic'
-                            elif reason in ['manual_attachment', 'unknown']:
-                                attachment_method = 'manual'
-                            break
-
-                order_info = {
-                    'relationship_id': rel.get('relationship_id'),
-                    'order_number': rel.get('order_number'),
-                    'csv_data': csv_data,
-                    'has_pdf': bool(rel.get('pdf_path')),
-                    'pdf_path': rel.get('pdf_path'),
-                    'created_date': rel.get('created_date'),
-                    'updated_date': rel.get('updated_date'),
-                    'pdf_change_count': len(rel.get('pdf_changes', [])),
-                    'processed': rel.get('processed', False),
-                    'processed_date': rel.get('processed_date'),
-                    'attachment_method': attachment_method  # 'automatic', 'manual', or None
-                }
-
-                # Extract commonly used fields for easy access
-                order_info.update({
-                    'OrderNumber': csv_data.get('OrderNumber', ''),
-                    'Customer': csv_data.get('Customer', ''),
-                    'JobReference': csv_data.get('JobReference', ''),
-                    'Designer': csv_data.get('Designer', ''),
-                    'DateRequired': csv_data.get('DateRequired', '')
-                })
-
-                orders_with_status.append(order_info)
-
-            return orders_with_status
+            if include_history:
+                changes_by_relationship = self.db_manager.get_pdf_changes_by_relationship()
+                for rel in relationships:
+                    rel['pdf_changes'] = changes_by_relationship.get(rel['relationship_id'], [])
+
+            return [self._order_info(rel) for rel in relationships]
 
         except Exception as e:
             logging.error(f"Failed to get orders with relationships: {e}")
             return []
 
+    def get_orders_with_relationships_full(self) -> List[Dict]:
+        """Get all orders with their relationship status and PDF attachment history"""
+        return self.get_orders_with_relationships(include_history=True)
+
+    def get_orders_in_date_range(self, start_date: date, end_date: date) -> List[Dict]:
+        """
+        Get orders required between two dates (inclusive) with their relationship status
+
+        Orders are shaped like get_orders_with_relationships plus 'order_date'.
+        When the CSV file table shares the relationship database, each order
+        also carries 'csv_file' (its newest CSV file's status, or None),
+        fetched in the same query.
+        """
+        try:
+            relationships = self.db_manager.get_relationships_with_csv_status(
+                start_date.isoformat(), end_date.isoformat()
+            )
+
+            orders = []
+            for rel in relationships:
+                order_info = self._order_info(rel)
+                order_info['order_date'] = rel['order_date']
+                if 'csv_file' in rel:
+                    order_info['csv_file'] = rel['csv_file']
+                orders.append(order_info)
+
+            return orders
+
+        except Exception as e:
+            logging.error(f"Failed to get orders from {start_date} to {end_date}: {e}")
+            return []
+
+    @staticmethod
+    def _order_info(rel: Dict) -> Dict:
+        """Build an order status record from a relationship"""
+        csv_data = rel.get('csv_data') or {}
+        pdf_path = rel.get('pdf_path')
+        changes = rel.get('pdf_changes') or []
+
+        # Determine attachment method from the most recent attach action
+        attachment_method = None
+        if pdf_path and changes:
+            last_attach = next(
+                (change for change in reversed(changes) if change.get('action') in ('attach', 'replace')),
+                None
+            )
+            if last_attach is not None:
+                reason = last_attach.get('reason', '')
+                if reason == 'automatic_matching':
+                    attachment_method = 'automatic'
+                elif reason in ('manual_attachment', 'unknown'):
+                    attachment_method = 'manual'
+
+        return {
+            'relationship_id': rel.get('relationship_id'),
+            'order_number': rel.get('order_number'),
+            'csv_data': csv_data,
+            'has_pdf': bool(pdf_path),
+            'pdf_path': pdf_path,
+            'created_date': rel.get('created_date'),
+            'updated_date': rel.get('updated_date'),
+            'pdf_change_count': len(changes),
+            'processed': rel.get('processed', False),
+            'processed_date': rel.get('processed_date'),
+            'attachment_method': attachment_method,  # 'automatic', 'manual', or None
+
+            # Commonly used fields for easy access
+            'OrderNumber': csv_data.get('OrderNumber', ''),
+            'Customer': csv_data.get('Customer', ''),
+            'JobReference': csv_data.get('JobReference', ''),
+            'Designer': csv_data.get('Designer', ''),
+            'DateRequired': csv_data.get('DateRequired', '')
+        }
+
     def sync_csv_data(self, csv_records: List[Dict]) -> Tuple[int, int, int]:
         """
         Sync CSV data with existing relationships
@@ -193,37 +276,61 @@ class RelationshipManager:
             updated_count = 0
             unchanged_count = 0
 
+            # Stored CSV hashes for every existing relationship, in one query;
+            # comparing hashes avoids decoding and comparing each stored row
+            hashes_by_order = self.db_manager.get_relationship_csv_hashes()
+
+            # Changes are collected here and written in bulk after the loop
+            to_insert: Dict[str, Dict] = {}  # order_number -> new relationship (no ID yet)
+            to_update: Dict[str, Dict] = {}  # relationship_id -> new CSV data
+
             for csv_record in csv_records:
                 order_number = str(csv_record.get('OrderNumber', ''))
                 if not order_number:
                     continue
 
+                csv_hash = self.db_manager.csv_data_hash(csv_record)
+
                 # Check if relationship already exists
-                existing_rel = self.get_relationship_by_order(order_number)
+                existing = hashes_by_order.get(order_number)
 
-                if existing_rel:
+                if existing:
                     # Update existing relationship with new CSV data
                     # IMPORTANT: Preserve processed status during sync
-                    current_csv_data = existing_rel.get('csv_data', {})
+                    relationship_id, current_hash = existing
 
                     # Check if CSV data has changed
-                    if current_csv_data != csv_record:
-                        update_data = {'csv_data': csv_record}
-                        # Note: update_relationship only updates specified fields
-                        # The processed flag and other fields are preserved automatically
-                        if self.db_manager.update_relationship(existing_rel['relationship_id'], update_data):
-                            updated_count += 1
+                    if current_hash != csv_hash:
+                        # Only csv_data is written; the processed flag and other
+                        # fields are preserved automatically
+                        hashes_by_order[order_number] = (relationship_id, csv_hash)
+                        if order_number in to_insert:
+                            to_insert[order_number]['csv_data'] = csv_record
                         else:
-                            unchanged_count += 1
+                            to_update[relationship_id] = csv_record
+                        updated_count += 1
                     else:
                         unchanged_count += 1
                 else:
-                    # Create new relationship
-                    try:
-                        self.create_relationship(order_number, csv_record)
-                        new_count += 1
-                    except Exception as e:
-                        logging.warning(f"Failed to create relationship for order {order_number}: {e}")
+                    # Create new relationship; later records for the same order update it.
+                    # bulk_store_relationships assigns the ID when the row is inserted
+                    to_insert[order_number] = {
+                        'order_number': order_number,
+                        'csv_data': csv_record,
+                        'pdf_path': None
+                    }
+                    hashes_by_order[order_number] = (None, csv_hash)
+                    new_count += 1
+
+            # One transaction each for inserts and updates instead of one per record
+            if not self.db_manager.bulk_store_relationships(list(to_insert.values())):
+                logging.warning(f"Failed to create {len(to_insert)} new relationships")
+                new_count = 0
+
+            if not self.db_manager.bulk_update_relationships(list(to_update.items())):
+                logging.warning(f"Failed to update {len(to_update)} relationships")
+                unchanged_count += updated_count
+                updated_count = 0
 
             logging.info(f"CSV sync complete: {new_count} new, {updated_count} updated, {unchanged_count} unchanged")
             return new_count, updated_count, unchanged_count
@@ -238,49 +345,33 @@ class RelationshipManager:
         Skips matching for orders with dates in the past for efficiency
         Returns: (matched_count, unmatched_count)
         """
-        from datetime import datetime
-
         try:
             matched_count = 0
             unmatched_count = 0
             skipped_past_dates = 0
-            today = datetime.now().date()
+            today = date.today()
 
-            for pdf_path in pdf_files:
-                try:
-                    # Extract order number from PDF
-                    order_number = pdf_processor.extract_sales_order(Path(pdf_path))
+            # One query for all relationships instead of one per PDF
+            by_order = self._relationships_by_order()
+
+            # Extract every order number up front; PDF parsing runs in parallel
+            # and the matching below is then plain dict lookups
+            order_numbers = pdf_processor.extract_sales_orders([Path(pdf_path) for pdf_path in pdf_files])
 
+            for pdf_path, order_number in zip(pdf_files, order_numbers):
+                try:
                     if order_number:
                         # Find relationship for this order
-                        relationship = self.get_relationship_by_order(order_number)
+                        relationship = by_order.get(order_number)
 
                         if relationship:
-                            # Check if order date is in the past
-                            csv_data = relationship.get('csv_data', {})
-                            date_required = csv_data.get('DateRequired', '')
-
                             # Skip matching for past dates (efficiency optimization)
-                            if date_required:
-                                try:
-                                    # Parse the date (assuming format like "YYYY-MM-DD" or similar)
-                                    # Try multiple date formats
-                                    order_date = None
-                                    for fmt in ['%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y', '%Y/%m/%d']:
-                                        try:
-                                            order_date = datetime.strptime(str(date_required), fmt).date()
-                                            break
-                                        except:
-                                            continue
-
-                                    if order_date and order_date < today:
-                                        # Skip matching for past orders
-                                        skipped_past_dates += 1
-                                        logging.debug(f"Skipping past date order {order_number} (date: {date_required})")
-                                        continue
-                                except Exception as e:
-                                    # If date parsing fails, continue with matching
-                                    logging.debug(f"Could not parse date {date_required} for order {order_number}: {e}")
+                            order_date = self._order_date(relationship)
+                            if order_date and order_date < today:
+                                # Skip matching for past orders
+                                skipped_past_dates += 1
+                                logging.debug(f"Skipping past date order {order_number} (date: {order_date})")
+                                continue
 
                             # Check if PDF is already attached
                             if not relationship.get('pdf_path'):
@@ -290,6 +381,8 @@ class RelationshipManager:
                                     pdf_path,
                                     "automatic_matching"
                                 ):
+                                    # A later PDF for the same order must not replace this one
+                                    relationship['pdf_path'] = pdf_path
                                     matched_count += 1
                                     logging.info(f"Auto-matched PDF {pdf_path} to order {order_number}")
                                 else:
@@ -341,7 +434,7 @@ class RelationshipManager:
     def export_relationships(self, export_path: str) -> bool:
         """Export all relationships to a JSON file for backup"""
         try:
-            relationships = self.db_manager.get_all_relationships()
+            relationships = [rel.to_dict() for rel in self.db_manager.get_all_relationships()]
 
             export_data = {
                 'export_date': None,  # Will be set by database
@@ -350,8 +443,8 @@ class RelationshipManager:
                 'relationships': relationships
             }
 
-            with open(export_path, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, default=str)
+            with open(export_path, 'wb') as f:
+                f.write(json_dumps(export_data, default=str))
 
             logging.info(f"Exported {len(relationships)} relationships to {export_path}")
             return True
@@ -362,35 +455,61 @@ class RelationshipManager:
 
     def mark_order_processed(self, order_number: str) -> bool:
         """Mark an order as processed"""
+        return self.mark_orders_processed([order_number]) > 0
+
+    def mark_orders_processed(self, order_numbers: List[str]) -> int:
+        """Mark many orders as processed with one batched update; returns the number marked"""
         try:
-            relationship = self.get_relationship_by_order(order_number)
-            if relationship:
-                return self.db_manager.mark_relationship_processed(relationship['relationship_id'])
-            return False
+            return self.db_manager.mark_orders_processed(order_numbers)
         except Exception as e:
-            logging.error(f"Failed to mark order {order_number} as processed: {e}")
-            return False
+            logging.error(f"Failed to mark {len(order_numbers)} orders as processed: {e}")
+            return 0
 
     def import_relationships(self, import_path: str) -> bool:
         """Import relationships from a JSON backup file"""
         try:
-            with open(import_path, 'r', encoding='utf-8') as f:
-                import_data = json.load(f)
-
-            relationships = import_data.get('relationships', [])
             imported_count = 0
-
-            for rel_data in relationships:
-                try:
-                    # Store the relationship
-                    if self.db_manager.store_relationship(rel_data):
-                        imported_count += 1
-                except Exception as e:
-                    logging.warning(f"Failed to import relationship {rel_data.get('relationship_id', 'unknown')}: {e}")
-
-            logging.info(f"Imported {imported_count} of {len(relationships)} relationships")
+            total_count = 0
+            batch = []
+
+            with open(import_path, 'rb') as f:
+                for rel_data in self._iter_backup_relationships(f):
+                    batch.append(rel_data)
+                    if len(batch) >= IMPORT_BATCH_SIZE:
+                        imported_count += self._store_import_batch(batch)
+                        total_count += len(batch)
+                        batch.clear()
+
+            if batch:
+                imported_count += self._store_import_batch(batch)
+                total_count += len(batch)
+
+            logging.info(f"Imported {imported_count} of {total_count} relationships")
             return imported_count > 0
 
         except Exception as e:
             logging.error(f"Failed to import relationships: {e}")
-            return False
\ No newline at end of file
+            return False
+
+    @staticmethod
+    def _iter_backup_relationships(f):
+        """Yield relationship records from an open backup file, streaming when ijson is available"""
+        if ijson is not None:
+            yield from ijson.items(f, 'relationships.item', use_float=True)
+        else:
+            yield from json_loads(f.read()).get('relationships', [])
+
+    def _store_import_batch(self, batch: List[Dict]) -> int:
+        """Store a batch of imported relationships, returning how many were stored"""
+        if self.db_manager.bulk_store_relationships(batch):
+            return len(batch)
+
+        # A bad record rolls back the whole batch; retry one at a time so the rest still import
+        imported_count = 0
+        for rel_data in batch:
+            try:
+                if self.db_manager.store_relationship(rel_data):
+                    imported_count += 1
+            except Exception as e:
+                logging.warning(f"Failed to import relationship {rel_data.get('relationship_id', 'unknown')}: {e}")
+        return imported_count
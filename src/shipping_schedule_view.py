@@ -8,24 +8,93 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import logging
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional
 from collections import defaultdict
 from pathlib import Path
 import platform
 import subprocess
 import os
 
+# platform.system() queries the OS on every call, so look it up once
+_SYSTEM = platform.system()
+# Command that opens a file in its default viewer; Windows uses os.startfile instead
+_OPEN_CMD = {'Darwin': ('open',), 'Windows': None}.get(_SYSTEM, ('xdg-open',))
+
+# Dates with more orders than this insert their rows a page at a time
+ROWS_PAGINATE_THRESHOLD = 200
+ROWS_PAGE_SIZE = 50
+
+# DateSections are built when their slot comes within this many screen heights
+# of the visible area, and destroyed again once it is further than
+# SECTION_DROP_SCREENS away
+SECTION_BUILD_SCREENS = 1
+SECTION_DROP_SCREENS = 3
+
+
+# PDF column text for an attached PDF, by how it was attached
+PDF_STATUS_BY_METHOD = {
+    'manual': "✅ 📎 Manual",
+    'automatic': "✅ Auto",
+}
+# PDF column text otherwise, by (has PDF, processed)
+PDF_STATUS = {
+    (True, True): "✅ Processed",
+    (True, False): "✅ Has PDF",
+    (False, True): "✅ Processed",
+    (False, False): "❌ No PDF",
+}
+
+# CSV column text for the newest CSV file: its status wins over its validation status
+CSV_STATUS_BY_STATUS = {
+    'uploaded': "✅ Uploaded",
+    'archived': "📦 Archived",
+}
+CSV_STATUS_BY_VALIDATION = {
+    'valid': "✓ Ready",
+    'has_errors': "❌ Has Errors",
+    'has_warnings': "⚠️ Warnings",
+    'not_validated': "⚪ Not Validated",
+}
+CSV_STATUS_OTHER = "📄 Has CSV"
+CSV_STATUS_NONE = "❌ No CSV"
+CSV_STATUS_UNKNOWN = "❓ Unknown"
+
+
+def _format_csv_status(csv_file: Optional[Dict]) -> str:
+    """Display string for an order's most recent CSV file (None if it has none)"""
+    if not csv_file:
+        return CSV_STATUS_NONE
+
+    status = CSV_STATUS_BY_STATUS.get(csv_file.get('status', 'pending'))
+    if status is not None:
+        return status
+    return CSV_STATUS_BY_VALIDATION.get(csv_file.get('validation_status', 'not_validated'), CSV_STATUS_OTHER)
+
 
 class DateSection(tk.Frame):
     """Section showing all orders for a specific date"""
 
-    def __init__(self, parent, date_str: str, orders: List[Dict], csv_db=None, **kwargs):
+    def __init__(self, parent, date_str: str, orders: List[Dict], csv_db=None,
+                 csv_status_map: Optional[Dict[str, List[Dict]]] = None,
+                 status_cache: Optional[Dict[str, str]] = None, **kwargs):
         super().__init__(parent, **kwargs)
 
         self.date_str = date_str
         self.orders = orders
         self.csv_db = csv_db
 
+        # CSV files by order number, prefetched by the parent view; None means
+        # query csv_db per order
+        self.csv_status_map = csv_status_map
+
+        # Formatted CSV status by order number, shared by every section of the view
+        self.status_cache = status_cache
+
+        # Tree item ID -> order, for double-click lookups
+        self.order_data_map: Dict[str, Dict] = {}
+        # Index in self.orders of the next order to insert into the tree
+        self._next_row = 0
+
         self.setup_section()
 
     def setup_section(self):
@@ -97,44 +166,62 @@ class DateSection(tk.Frame):
                 self.tree.column(col, width=column_widths.get(col, 100))
 
         # Add scrollbar
-        scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.tree.yview)
-        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.tree_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=self._on_tree_yscroll)
 
-        # Populate orders
-        for order in self.orders:
-            self.add_order_to_tree(order)
+        # Populate orders; large dates start with one page and load more as the
+        # list is scrolled to the bottom
+        if len(self.orders) > ROWS_PAGINATE_THRESHOLD:
+            self._insert_rows(ROWS_PAGE_SIZE)
+        else:
+            self._insert_rows(len(self.orders))
 
         # Bind double-click to view PDF
         self.tree.bind('<Double-1>', self.on_tree_double_click)
 
         self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+    def _insert_rows(self, count: int):
+        """Insert the next count orders into the tree"""
+        orders = self.orders[self._next_row:self._next_row + count]
+        rows = [self._order_row_values(order) for order in orders]
+
+        insert = self.tree.insert
+        order_data_map = self.order_data_map
+        for values, order in zip(rows, orders):
+            order_data_map[insert('', tk.END, values=values)] = order
+
+        self._next_row += len(orders)
+
+    def _on_tree_yscroll(self, first, last):
+        """Update the scrollbar and load the next page once the bottom is visible"""
+        self.tree_scrollbar.set(first, last)
+        if float(last) >= 1.0 and self._next_row < len(self.orders):
+            self.after_idle(self._insert_rows, ROWS_PAGE_SIZE)
 
     def add_order_to_tree(self, order: Dict):
         """Add an order to the tree view"""
+        self.order_data_map[self.tree.insert('', tk.END, values=self._order_row_values(order))] = order
+
+    def _order_row_values(self, order: Dict) -> tuple:
+        """Tree column values for an order"""
         csv_data = order.get('csv_data', {})
 
         # Get PDF status
-        if order.get('pdf_path') or order.get('has_pdf'):
-            attachment_method = order.get('attachment_method')
-            if attachment_method == 'manual':
-                pdf_status = "✅ 📎 Manual"
-            elif attachment_method == 'automatic':
-                pdf_status = "✅ Auto"
-            elif order.get('processed', False):
-                pdf_status = "✅ Processed"
-            else:
-                pdf_status = "✅ Has PDF"
-        else:
-            if order.get('processed', False):
-                pdf_status = "✅ Processed"
-            else:
-                pdf_status = "❌ No PDF"
+        has_pdf = bool(order.get('pdf_path') or order.get('has_pdf'))
+        pdf_status = PDF_STATUS_BY_METHOD.get(order.get('attachment_method')) if has_pdf else None
+        if pdf_status is None:
+            pdf_status = PDF_STATUS[has_pdf, bool(order.get('processed', False))]
 
         # Get CSV status
-        csv_status = self._get_csv_status(csv_data.get('OrderNumber', ''))
+        if 'csv_file' in order:
+            # CSV file already joined onto the order by the query that loaded it
+            csv_status = _format_csv_status(order['csv_file'])
+        else:
+            csv_status = self._get_csv_status(csv_data.get('OrderNumber', ''))
 
-        values = (
+        return (
             csv_data.get('OrderNumber', ''),
             csv_data.get('Customer', ''),
             csv_data.get('JobReference', ''),
@@ -143,53 +230,39 @@ class DateSection(tk.Frame):
             csv_status
         )
 
-        item_id = self.tree.insert('', tk.END, values=values)
-
-        # Store order data for double-click
-        if not hasattr(self, 'order_data_map'):
-            self.order_data_map = {}
-        self.order_data_map[item_id] = order
-
     def _get_csv_status(self, order_number: str) -> str:
-        """Get CSV status from database for display"""
+        """Get CSV status for display, reusing the view's cached result when there is one"""
         if not order_number:
-            return "❌ No CSV"
+            return CSV_STATUS_NONE
+
+        if self.status_cache is None:
+            return self._lookup_csv_status(order_number)
 
+        status = self.status_cache.get(order_number)
+        if status is None:
+            status = self._lookup_csv_status(order_number)
+            # Lookup errors are not cached so a later redraw can retry them
+            if status != CSV_STATUS_UNKNOWN:
+                self.status_cache[order_number] = status
+        return status
+
+    def _lookup_csv_status(self, order_number: str) -> str:
+        """Get CSV status from database for display"""
         try:
-            if not hasattr(self, 'csv_db') or not self.csv_db:
-                return "❌ No CSV"
-
-            # Query CSV files for this order
-            csv_files = self.csv_db.get_csv_files_by_order(order_number)
-
-            if not csv_files:
-                return "❌ No CSV"
-
-            # Get the most recent CSV
-            csv_file = csv_files[0]  # Already sorted by added_date DESC
-
-            status = csv_file.get('status', 'pending')
-            validation_status = csv_file.get('validation_status', 'not_validated')
-
-            # Return formatted status
-            if status == 'uploaded':
-                return "✅ Uploaded"
-            elif status == 'archived':
-                return "📦 Archived"
-            elif validation_status == 'valid':
-                return "✓ Ready"
-            elif validation_status == 'has_errors':
-                return "❌ Has Errors"
-            elif validation_status == 'has_warnings':
-                return "⚠️ Warnings"
-            elif validation_status == 'not_validated':
-                return "⚪ Not Validated"
+            if self.csv_status_map is not None:
+                csv_files = self.csv_status_map.get(order_number)
+            elif not self.csv_db:
+                return CSV_STATUS_NONE
             else:
-                return "📄 Has CSV"
+                # Query CSV files for this order
+                csv_files = self.csv_db.get_csv_files_by_order(order_number)
+
+            # Most recent CSV first (already sorted by added_date DESC)
+            return _format_csv_status(csv_files[0] if csv_files else None)
 
         except Exception as e:
             logging.error(f"Error getting CSV status for order {order_number}: {e}")
-            return "❓ Unknown"
+            return CSV_STATUS_UNKNOWN
 
     def on_tree_double_click(self, event):
         """Handle double-click on tree item - view PDF if available"""
@@ -199,11 +272,10 @@ class DateSection(tk.Frame):
         item = self.tree.selection()[0]
 
         # Get order data from our mapping
-        if not hasattr(self, 'order_data_map') or item not in self.order_data_map:
+        order_data = self.order_data_map.get(item)
+        if order_data is None:
             return
 
-        order_data = self.order_data_map[item]
-
         # Double-click to view PDF if available
         if order_data.get('pdf_path'):
             self.view_pdf(order_data['pdf_path'])
@@ -211,12 +283,11 @@ class DateSection(tk.Frame):
     def view_pdf(self, pdf_path: str):
         """Open PDF in default viewer"""
         try:
-            if platform.system() == 'Darwin':  # macOS
-                subprocess.call(('open', pdf_path))
-            elif platform.system() == 'Windows':  # Windows
+            if _OPEN_CMD is None:  # Windows
                 os.startfile(pdf_path)
-            else:  # linux variants
-                subprocess.call(('xdg-open', pdf_path))
+            else:
+                # Popen returns immediately instead of blocking the Tk event loop
+                subprocess.Popen(_OPEN_CMD + (pdf_path,))
         except Exception as e:
             messagebox.showerror("Error", f"Could not open PDF:\n{str(e)}")
 
@@ -236,6 +307,21 @@ class ShippingScheduleView(tk.Toplevel):
         self.relationship_manager = relationship_manager
         self.custom_title = title
 
+        # Fields read from every order when (re)building sections, extracted
+        # once into lists parallel to self.orders
+        self._order_numbers = [order.get('csv_data', {}).get('OrderNumber', '') for order in orders]
+        self._date_displays = [order.get('date_display', 'Unknown Date') for order in orders]
+
+        # Formatted CSV status by order number; the CSV data does not change
+        # while the view is open, so redraws reuse it instead of querying again
+        self._csv_status_cache: Dict[str, str] = {}
+
+        # One slot per date: a placeholder frame plus the DateSection built
+        # inside it while it is near the visible area (None otherwise)
+        self._section_slots: List[Dict] = []
+        self._csv_status_map: Optional[Dict[str, List[Dict]]] = None
+        self._section_update_pending = False
+
         # Set window properties
         self.title(title or "Shipping Schedule")
         self.geometry("1200x800")
@@ -279,7 +365,7 @@ class ShippingScheduleView(tk.Toplevel):
         summary_label.pack(side=tk.RIGHT, padx=20, pady=15)
 
         # Scrollable content frame
-        canvas = tk.Canvas(self, bg='#ecf0f1', highlightthickness=0)
+        self.canvas = canvas = tk.Canvas(self, bg='#ecf0f1', highlightthickness=0)
         scrollbar = ttk.Scrollbar(self, orient="vertical", command=canvas.yview)
         self.scrollable_frame = tk.Frame(canvas, bg='#ecf0f1')
 
@@ -288,8 +374,13 @@ class ShippingScheduleView(tk.Toplevel):
             lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
         )
 
+        def on_canvas_yscroll(first, last):
+            scrollbar.set(first, last)
+            self._schedule_section_update()
+
         canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        canvas.configure(yscrollcommand=on_canvas_yscroll)
+        canvas.bind("<Configure>", lambda e: self._schedule_section_update())
 
         # Group orders by date
         self.create_date_sections()
@@ -319,22 +410,41 @@ class ShippingScheduleView(tk.Toplevel):
         """Create sections grouped by date"""
         # Group orders by date
         orders_by_date = defaultdict(list)
-
-        for order in self.orders:
-            date_display = order.get('date_display', 'Unknown Date')
+        for date_display, order in zip(self._date_displays, self.orders):
             orders_by_date[date_display].append(order)
 
-        # Create a section for each date
+        # Fetch CSV files in one query for every order that was not loaded with its
+        # CSV file and whose status is not cached yet
+        csv_status_map = None
+        if self.csv_db:
+            csv_status_map = self.csv_db.get_csv_files_by_orders([
+                order_number for order_number, order in zip(self._order_numbers, self.orders)
+                if 'csv_file' not in order and order_number not in self._csv_status_cache
+            ])
+
+        self._csv_status_map = csv_status_map
+
+        # Reserve a placeholder of roughly the final height for each date; the
+        # DateSection itself is only built once it scrolls near the viewport
         for date_str in sorted(orders_by_date.keys()):
             date_orders = orders_by_date[date_str]
 
-            date_section = DateSection(
+            placeholder = tk.Frame(
                 self.scrollable_frame,
-                date_str,
-                date_orders,
-                csv_db=self.csv_db
+                bg='#ecf0f1',
+                height=self._estimated_section_height(len(date_orders))
             )
-            date_section.pack(fill=tk.X, pady=(0, 10))
+            placeholder.pack(fill=tk.X, pady=(0, 10))
+            placeholder.pack_propagate(False)
+
+            self._section_slots.append({
+                'placeholder': placeholder,
+                'date_str': date_str,
+                'orders': date_orders,
+                'section': None
+            })
+
+        self._schedule_section_update()
 
         # If no orders
         if not orders_by_date:
@@ -346,3 +456,63 @@ class ShippingScheduleView(tk.Toplevel):
                 fg='#7f8c8d'
             )
             empty_label.pack(pady=50)
+
+    @staticmethod
+    def _estimated_section_height(order_count: int) -> int:
+        """Height a DateSection will take: header, padding, tree heading and visible rows"""
+        return 40 + 20 + 30 + min(order_count, 10) * 28 + 2
+
+    def _schedule_section_update(self):
+        """Update the built sections once the pending scroll/resize events are handled"""
+        if not self._section_update_pending:
+            self._section_update_pending = True
+            self.after_idle(self._update_visible_sections)
+
+    def _update_visible_sections(self):
+        """Build DateSections near the visible area and destroy those far from it"""
+        if not self._section_slots:
+            self._section_update_pending = False
+            return
+
+        # Placeholder positions are only valid once pending geometry work is done
+        self.update_idletasks()
+        self._section_update_pending = False
+
+        view_height = self.canvas.winfo_height()
+        if view_height <= 1:
+            # Canvas not mapped yet; its <Configure> event schedules another update
+            return
+
+        top = self.canvas.canvasy(0)
+        bottom = top + view_height
+
+        build_top = top - SECTION_BUILD_SCREENS * view_height
+        build_bottom = bottom + SECTION_BUILD_SCREENS * view_height
+        drop_top = top - SECTION_DROP_SCREENS * view_height
+        drop_bottom = bottom + SECTION_DROP_SCREENS * view_height
+
+        for slot in self._section_slots:
+            placeholder = slot['placeholder']
+            slot_top = placeholder.winfo_y()
+            slot_bottom = slot_top + placeholder.winfo_height()
+
+            if slot['section'] is None:
+                if slot_bottom >= build_top and slot_top <= build_bottom:
+                    section = DateSection(
+                        placeholder,
+                        slot['date_str'],
+                        slot['orders'],
+                        csv_db=self.csv_db,
+                        csv_status_map=self._csv_status_map,
+                        status_cache=self._csv_status_cache
+                    )
+                    section.pack(fill=tk.X)
+                    # Let the placeholder take the section's real height
+                    placeholder.pack_propagate(True)
+                    slot['section'] = section
+            elif slot_bottom < drop_top or slot_top > drop_bottom:
+                # Keep the space the section took so the content below does not move
+                placeholder.configure(height=placeholder.winfo_height())
+                placeholder.pack_propagate(False)
+                slot['section'].destroy()
+                slot['section'] = None
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Test PDF order number matching - filename and content fallbacks
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from pdf_processor import PDFProcessor
+
+
+def test_filename_prefers_explicit_order_patterns():
+    processor = PDFProcessor()
+    assert processor.extract_from_filename('4098014.pdf') == '4098014'
+    assert processor.extract_from_filename('SO-4098014 plan.pdf') == '4098014'
+    assert processor.extract_from_filename('Sheet 12 Job 1234567.pdf') == '1234567'
+
+
+def test_filename_ignores_numbers_after_invalid_placeholder():
+    # Only the first match of each pattern and the first digit run count;
+    # a sheet number or suffix behind a placeholder is never taken instead
+    processor = PDFProcessor()
+    assert processor.extract_from_filename('abc 0000000 1234.pdf') is None
+    assert processor.extract_from_filename('SO 0000000 order ABC-12.pdf') is None
+    assert processor.extract_from_filename('sheet 0000 5555 1234.pdf') is None
+
+
+def test_content_tries_several_digit_sequences():
+    processor = PDFProcessor()
+    assert processor._find_order_in_text('abc 0000000 1234', from_content=True) == '1234'
+    assert processor._find_order_in_text('Rev 0000 Order 1234567', from_content=True) == '1234567'
+    assert processor._find_order_in_text('no numbers here', from_content=True) is None
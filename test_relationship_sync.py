@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Test CSV sync - hash-based change detection and derived column upkeep
+"""
+
+import json
+import os
+import sqlite3
+import sys
+from datetime import date
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from enhanced_database_v2 import EnhancedDatabaseV2
+from relationship_manager import RelationshipManager
+
+
+def _manager(tmp_path):
+    db = EnhancedDatabaseV2(str(tmp_path / 'relationships.db'))
+    return db, RelationshipManager(db)
+
+
+def test_sync_counts_new_updated_and_unchanged(tmp_path):
+    db, manager = _manager(tmp_path)
+    first = [
+        {'OrderNumber': '1000001', 'Customer': 'A', 'DateRequired': '2024-03-01'},
+        {'OrderNumber': '1000002', 'Customer': 'B', 'DateRequired': '03/02/2024'},
+    ]
+    assert manager.sync_csv_data(first) == (2, 0, 0)
+
+    second = [
+        {'Customer': 'A', 'DateRequired': '2024-03-01', 'OrderNumber': '1000001'},  # same data, other key order
+        {'OrderNumber': '1000002', 'Customer': 'B2', 'DateRequired': '03/09/2024'},
+        {'OrderNumber': '1000003', 'Customer': 'C'},
+        {'OrderNumber': ''},
+    ]
+    assert manager.sync_csv_data(second) == (1, 1, 1)
+    assert manager.sync_csv_data(second) == (0, 0, 3)
+
+    rows = {row['order_number']: row for row in db.get_all_relationships()}
+    assert rows['1000002']['csv_data']['Customer'] == 'B2'
+    assert rows['1000002']['order_date'] == '2024-03-09'
+    assert rows['1000003']['order_date'] is None
+    assert db.get_relationship_csv_hashes()['1000002'][1] == db.csv_data_hash(second[1])
+
+
+def test_sync_duplicate_orders_in_one_batch(tmp_path):
+    _, manager = _manager(tmp_path)
+    records = [
+        {'OrderNumber': '2000001', 'Qty': 1},
+        {'OrderNumber': '2000001', 'Qty': 1},
+        {'OrderNumber': '2000001', 'Qty': 2},
+    ]
+    assert manager.sync_csv_data(records) == (1, 1, 1)
+    assert manager.get_orders_with_relationships()[0]['csv_data']['Qty'] == 2
+
+
+def test_legacy_csv_data_update_clears_stale_derived_columns(tmp_path):
+    db, manager = _manager(tmp_path)
+    manager.sync_csv_data([{'OrderNumber': '3000001', 'DateRequired': '2024-01-05'}])
+
+    # An older client rewrites csv_data without knowing about csv_hash/order_date
+    changed = {'OrderNumber': '3000001', 'DateRequired': '2024-02-10'}
+    with sqlite3.connect(db.db_path) as conn:
+        conn.execute('UPDATE relationships SET csv_data = ? WHERE order_number = ?',
+                     (json.dumps(changed), '3000001'))
+        assert conn.execute('SELECT csv_hash, order_date FROM relationships').fetchone() == (None, None)
+
+    # Readers fall back to csv_data until then: the order is dated and unchanged right away
+    orders = manager.get_orders_in_date_range(date(2024, 2, 10), date(2024, 2, 10))
+    assert [order['order_number'] for order in orders] == ['3000001']
+    assert manager.get_orders_in_date_range(date(2024, 1, 5), date(2024, 1, 5)) == []
+    assert db.get_relationship_csv_hashes()['3000001'][1] == db.csv_data_hash(changed)
+    assert manager.sync_csv_data([changed]) == (0, 0, 1)
+
+    # The next startup backfills them from the new csv_data
+    db = EnhancedDatabaseV2(db.db_path)
+    with sqlite3.connect(db.db_path) as conn:
+        csv_hash, order_date = conn.execute('SELECT csv_hash, order_date FROM relationships').fetchone()
+    assert csv_hash == db.csv_data_hash(changed)
+    assert order_date == '2024-02-10'
+    assert RelationshipManager(db).sync_csv_data([changed]) == (0, 0, 1)
+
+
+def test_date_range_includes_rows_written_by_older_clients(tmp_path):
+    db, manager = _manager(tmp_path)
+    manager.sync_csv_data([
+        {'OrderNumber': '4000001', 'DateRequired': '2024-05-06'},
+        {'OrderNumber': '4000009', 'DateRequired': '2024-06-01'},
+    ])
+
+    # An older client inserts a row and rewrites another without csv_hash/order_date
+    with sqlite3.connect(db.db_path) as conn:
+        conn.execute('INSERT INTO relationships (relationship_id, order_number, csv_data) VALUES (?, ?, ?)',
+                     ('legacy-1', '4000002', json.dumps({'OrderNumber': '4000002', 'DateRequired': '05/06/2024'})))
+        conn.execute('INSERT INTO relationships (relationship_id, order_number, csv_data) VALUES (?, ?, ?)',
+                     ('legacy-2', '4000003', json.dumps({'OrderNumber': '4000003', 'DateRequired': '2024-07-01'})))
+        conn.execute('UPDATE relationships SET csv_data = ? WHERE order_number = ?',
+                     (json.dumps({'OrderNumber': '4000001', 'DateRequired': '2024-05-05'}), '4000001'))
+
+    orders = manager.get_orders_in_date_range(date(2024, 5, 5), date(2024, 5, 6))
+    assert [(order['order_number'], order['order_date']) for order in orders] == [
+        ('4000001', '2024-05-05'),
+        ('4000002', '2024-05-06'),
+    ]